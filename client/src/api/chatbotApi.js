@@ -2,7 +2,8 @@ import { useCallback } from 'react';
 
 import { HOST } from '../constants/host';
 
-const baseUrl = `${HOST}/api/chatbot/chat/`;
+// Async endpoint; the response streams without holding a server thread
+const baseUrl = `${HOST}/api/chatbot/chat/stream/`;
 
 export const useChatbot = () => {
     const sendMessage = useCallback(async data => {
@@ -32,9 +32,10 @@ export const useOrder = () => {
         [post]
     );
 
-    const getOrders = useCallback(async () => {
+    // Pass the `next` link of a page to load the page after it
+    const getOrders = useCallback(async (pageUrl = `${baseUrl}/`) => {
         try {
-            const response = await get(`${baseUrl}/`, {
+            const response = await get(pageUrl, {
                 accessRequired: true,
                 refreshRequired: true,
             });
@@ -1,5 +1,6 @@
-import { useEffect, useState } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 
+import { Button } from '../../../reusable/button/Button';
 import { EmptyList } from '../../../reusable/empty-list/EmptyList';
 import { PaddedContainer } from '../../../reusable/padded-container/PaddedContainer';
 import { OrderList } from './order-list/OrderList';
@@ -13,6 +14,7 @@ export const OrderHistory = () => {
 
     const [orders, setOrders] = useState([]);
     const [loading, setLoading] = useState(true);
+    const [nextPage, setNextPage] = useState(null);
 
     useEffect(() => {
         const fetchOrders = async () => {
@@ -21,6 +23,7 @@ export const OrderHistory = () => {
                 const response = await getOrders();
                 if (response && response.results) {
                     setOrders(response.results);
+                    setNextPage(response.next);
                 } else if (Array.isArray(response)) {
                     setOrders(response);
                 }
@@ -35,6 +38,18 @@ export const OrderHistory = () => {
         fetchOrders();
     }, [getOrders]);
 
+    const loadMoreHandler = useCallback(async () => {
+        if (!nextPage) return;
+
+        try {
+            const response = await getOrders(nextPage);
+            setOrders(prev => [...prev, ...response.results]);
+            setNextPage(response.next);
+        } catch (err) {
+            console.error(err instanceof Error ? err.message : String(err));
+        }
+    }, [getOrders, nextPage]);
+
     return (
         <>
             {!loading && (
@@ -45,6 +60,16 @@ export const OrderHistory = () => {
                                 <h2>Order History</h2>
 
                                 <OrderList orders={orders} />
+
+                                {nextPage && (
+                                    <Button
+                                        color="black"
+                                        title="Load more"
+                                        buttonGrow="1"
+                                        width="10"
+                                        callbackHandler={loadMoreHandler}
+                                    />
+                                )}
                             </section>
                         </PaddedContainer>
                     ) : (
@@ -15,4 +15,12 @@ app.conf.beat_schedule = {
         'schedule': 10800,
         # 'schedule': 30, # For testing
     },
+    'refresh_related_products_task': {
+        'task': 'src.products.tasks.refresh_related_products',
+        'schedule': 86400,
+    },
+    'release_expired_reservations_task': {
+        'task': 'src.shopping_bags.tasks.release_expired_reservations',
+        'schedule': 60,
+    },
 }
@@ -1,15 +1,19 @@
 import os
 
+from django.conf import settings
 from pinecone import Pinecone as PineconeClient
 from langchain_pinecone import Pinecone
 from langchain_openai import ChatOpenAI
 from langchain_openai import OpenAIEmbeddings
 from langchain.memory import ConversationBufferMemory
 
+from src.chatbot.memory import CacheChatMessageHistory
+from src.chatbot.vectorstores import LocalVectorStore
 from src.chatbot.config import (
     DIMENSIONS,
     EMBEDDING_MODEL,
     LLM_MODEL,
+    LOCAL_VECTOR_STORE,
     MAX_TOKENS,
     TEMPERATURE,
     TOP_P,
@@ -63,21 +67,20 @@ class LLMAdapter:
 
 
 class MemoryAdapter:
-    _sessions = {}
+    """Adapter to the session memories, stored in the chatbot cache."""
 
     @classmethod
     def get_memory(cls, session_id):
-        if session_id not in cls._sessions:
-            cls._sessions[session_id] = ConversationBufferMemory(
-                memory_key='conversation_memory',
-                return_messages=True,
-                output_key='response'
-            )
-        return cls._sessions[session_id]
+        return ConversationBufferMemory(
+            chat_memory=CacheChatMessageHistory(session_id),
+            memory_key='conversation_memory',
+            return_messages=True,
+            output_key='response'
+        )
 
 
 class VectorStoreAdapter:
-    """Adapter to connect to existing Pinecone vector store."""
+    """Adapter to the vector store selected by `settings.CHATBOT_VECTOR_STORE`."""
     _instance = None
 
     def __new__(cls):
@@ -93,6 +96,24 @@ class VectorStoreAdapter:
 
     @classmethod
     def _initialize(cls):
+        if settings.CHATBOT_VECTOR_STORE == LOCAL_VECTOR_STORE:
+            return cls._initialize_local()
+
+        return cls._initialize_pinecone()
+
+    @classmethod
+    def _initialize_local(cls):
+        """Map the local index built by the management command into memory."""
+        embedding_model = OpenAIEmbeddings(
+            model=EMBEDDING_MODEL, dimensions=DIMENSIONS)
+
+        return LocalVectorStore.load(
+            settings.CHATBOT_LOCAL_INDEX_DIR,
+            embedding_model,
+        )
+
+    @classmethod
+    def _initialize_pinecone(cls):
         """Initialize connection to existing Pinecone index."""
         # Validate environment variables
         api_key = os.getenv('PINECONE_API_KEY')
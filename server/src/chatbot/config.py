@@ -14,3 +14,20 @@ DIMENSIONS = 512
 CHUNK_SIZE = 550
 CHUNK_OVERLAP = 0
 TOP_N_RESULTS = 4
+
+# Conversation Memory
+MEMORY_CACHE_ALIAS = 'chatbot'
+MEMORY_TTL_SECONDS = 60 * 60
+MEMORY_MAX_MESSAGES = 20
+
+# Local Vector Store
+LOCAL_VECTOR_STORE = 'local'
+PINECONE_VECTOR_STORE = 'pinecone'
+LOCAL_INDEX_EMBEDDINGS_FILE = 'embeddings.npy'
+LOCAL_INDEX_DOCUMENTS_FILE = 'documents.json'
+
+# Vector Index Sync
+SYNC_BATCH_SIZE = 100
+
+# Knowledge Chunks
+PRODUCT_DOCUMENTS_CHUNK_SIZE = 500
@@ -0,0 +1,108 @@
+from django.db.models import Prefetch
+from langchain_core.documents import Document
+
+from src.chatbot.config import PRODUCT_DOCUMENTS_CHUNK_SIZE
+from src.products.models import Inventory
+from src.products.models.product import (
+    Bracelet,
+    Earring,
+    Necklace,
+    Pendant,
+    Ring,
+    Watch,
+)
+
+# Category names as the consultant prompt and the product catalog use them
+PRODUCT_MODELS = (
+    ('earrings', Earring),
+    ('necklaces', Necklace),
+    ('pendants', Pendant),
+    ('rings', Ring),
+    ('bracelets', Bracelet),
+    ('watches', Watch),
+)
+
+TARGET_GENDERS = {
+    'F': 'F(Female, Woman, Girl)',
+    'M': 'M(Male, Man, Boy)',
+}
+
+
+def iter_product_documents(chunk_size=PRODUCT_DOCUMENTS_CHUNK_SIZE):
+    """
+    Yield one knowledge chunk per product, built straight from the
+    database. Products are streamed `chunk_size` at a time, each batch
+    with its attributes joined and its sizes prefetched.
+    """
+    for category, model_class in PRODUCT_MODELS:
+        products = (
+            model_class.objects.select_related(
+                'collection',
+                'color',
+                'metal',
+                'stone',
+            )
+            .prefetch_related(
+                Prefetch(
+                    'inventory',
+                    queryset=Inventory.objects.select_related(
+                        'size'
+                    ).order_by('price', 'id'),
+                ),
+            )
+            .order_by('id')
+        )
+
+        for product in products.iterator(chunk_size=chunk_size):
+            yield build_product_document(category, product)
+
+
+def build_product_document(category, product):
+    """
+    Render a product in the layout of the product catalog, with its
+    filterable attributes as metadata.
+    """
+    inventory = list(product.inventory.all())
+    prices = [float(item.price) for item in inventory]
+
+    sizes = ','.join(
+        f'Size: {item.size.name} - Price: ${item.price}' for item in inventory
+    )
+    average_rating = (
+        f'{product.rating_sum / product.rating_count:.1f}/5 stars'
+        if product.rating_count
+        else ''
+    )
+
+    page_content = (
+        f'Collection: {product.collection.name}; '
+        f'Stone: {product.color.name} {product.stone.name}; '
+        f'Metal: {product.metal.name}; '
+        f'Category: {category}; '
+        f'Product ID: {product.id}; '
+        f'Image URL: {product.first_image}; '
+        f'Sizes: {sizes}; '
+        f'Target Gender: {TARGET_GENDERS.get(product.target_gender, "")}; '
+        f'Description: {product.description or ""}; '
+        f'Average Rating: {average_rating};'
+    )
+
+    metadata = {
+        'category': category,
+        'product_id': product.id,
+        'collection': product.collection.name,
+        'color': product.color.name,
+        'metal': product.metal.name,
+        'stone': product.stone.name,
+        'target_gender': product.target_gender or '',
+        'average_rating': product.average_rating,
+        'rating_count': product.rating_count,
+    }
+
+    # Vector stores reject null metadata, so a product without sizes
+    # simply has no price range
+    if prices:
+        metadata['min_price'] = min(prices)
+        metadata['max_price'] = max(prices)
+
+    return Document(page_content=page_content, metadata=metadata)
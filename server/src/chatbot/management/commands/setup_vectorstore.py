@@ -14,18 +14,35 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 from pinecone import Pinecone as PineconeClient
 
-from src.chatbot.config import CHUNK_OVERLAP, CHUNK_SIZE, DIMENSIONS, EMBEDDING_MODEL
+from src.chatbot.config import (
+    CHUNK_OVERLAP,
+    CHUNK_SIZE,
+    DIMENSIONS,
+    EMBEDDING_MODEL,
+    LOCAL_VECTOR_STORE,
+    PINECONE_VECTOR_STORE,
+    SYNC_BATCH_SIZE,
+)
+from src.chatbot.documents import iter_product_documents
+from src.chatbot.sync import assign_chunk_ids, sync_documents
+from src.chatbot.vectorstores import LocalVectorStore
 
 
 class Command(BaseCommand):
-    help = 'Initialize and populate Pinecone vector store with PDF documents'
+    help = 'Initialize and populate the vector store (Pinecone or local) with the product catalog and boutique info'
 
     def add_arguments(self, parser):
+        parser.add_argument(
+            '--product-source',
+            choices=['database', 'pdf'],
+            default='database',
+            help='Build product chunks from the database or from --pdf-file (default: database)'
+        )
         parser.add_argument(
             '--pdf-file',
             type=str,
             default='product_catalog.pdf',
-            help='Name of the PDF file to process (default: product_catalog.pdf)'
+            help='Name of the product catalog PDF, used with --product-source pdf (default: product_catalog.pdf)'
         )
         parser.add_argument(
             '--pdf-file-boutique-info',
@@ -38,10 +55,16 @@ class Command(BaseCommand):
             type=str,
             help='Pinecone index name (overrides environment variable)'
         )
+        parser.add_argument(
+            '--backend',
+            choices=[PINECONE_VECTOR_STORE, LOCAL_VECTOR_STORE],
+            default=settings.CHATBOT_VECTOR_STORE,
+            help='Vector store to populate (default: settings.CHATBOT_VECTOR_STORE)'
+        )
         parser.add_argument(
             '--force-recreate',
             action='store_true',
-            help='Delete existing vectors and recreate the vector store'
+            help='Re-embed every chunk, even the unchanged ones'
         )
         parser.add_argument(
             '--dry-run',
@@ -61,6 +84,7 @@ class Command(BaseCommand):
                 "PINECONE_INDEX_NAME", default="drf-react-gems-index")
             force_recreate = options['force_recreate']
             dry_run = options['dry_run']
+            backend = options['backend']
 
             if dry_run:
                 self.stdout.write(
@@ -69,17 +93,23 @@ class Command(BaseCommand):
                 )
 
             # Validate environment variables
-            self._validate_environment()
+            self._validate_environment(backend)
 
             # Initialize embedding model
             embedding_model = OpenAIEmbeddings(
                 model=EMBEDDING_MODEL, dimensions=DIMENSIONS)
             self.stdout.write("✓ Initialized embedding model")
 
-            # Process first PDF (product catalog)
-            self.stdout.write(f"Processing PDF: {pdf_file}")
-            pages = self._create_pages_from_pdf(pdf_file)
-            chunks = self._create_chunks_using_regex(pages)
+            if options['product_source'] == 'database':
+                # One chunk per product straight from the ORM, with its
+                # attributes as filterable metadata
+                self.stdout.write("Building product chunks from the database")
+                chunks = list(iter_product_documents())
+            else:
+                # Process first PDF (product catalog)
+                self.stdout.write(f"Processing PDF: {pdf_file}")
+                pages = self._create_pages_from_pdf(pdf_file)
+                chunks = self._create_chunks_using_regex(pages)
 
             # Process second PDF (boutique info)
             self.stdout.write(f"Processing PDF: {pdf_file_boutique_info}")
@@ -88,6 +118,10 @@ class Command(BaseCommand):
             boutique_data_chunks = self._create_chunks_using_langchain(
                 boutique_data_chunks_pages)
 
+            # Stable ids and content hashes, so only changed chunks are embedded
+            assign_chunk_ids(chunks, 'product')
+            assign_chunk_ids(boutique_data_chunks, 'boutique')
+
             # FIXED: Show counts for both PDFs
             self.stdout.write(
                 f"✓ Created {len(chunks)} product document chunks")
@@ -122,8 +156,12 @@ class Command(BaseCommand):
                 return
 
             # Create/update vector store
-            self._create_vector_store(
-                chunks, boutique_data_chunks, embedding_model, index_name, force_recreate)
+            if backend == LOCAL_VECTOR_STORE:
+                self._create_local_vector_store(
+                    chunks, boutique_data_chunks, embedding_model, force_recreate)
+            else:
+                self._create_vector_store(
+                    chunks, boutique_data_chunks, embedding_model, index_name, force_recreate)
 
             # FIXED: Show correct total count
             self.stdout.write(
@@ -136,7 +174,7 @@ class Command(BaseCommand):
         except Exception as e:
             raise CommandError(f"Failed to setup vector store: {str(e)}")
 
-    def _validate_environment(self):
+    def _validate_environment(self, backend=PINECONE_VECTOR_STORE):
         """Validate required environment variables"""
         try:
             pinecone_key = os.getenv('PINECONE_API_KEY') or config(
@@ -144,11 +182,9 @@ class Command(BaseCommand):
             openai_key = os.getenv('OPENAI_API_KEY') or config(
                 'OPENAI_API_KEY', default=None)
 
-            print(f"Pinecone API Key: {pinecone_key[:5]}...")
-            print(f"OpenAI API Key: {openai_key[:5]}...")
-
             missing_vars = []
-            if not pinecone_key:
+            # The local index only needs OpenAI for the embeddings
+            if backend == PINECONE_VECTOR_STORE and not pinecone_key:
                 missing_vars.append('PINECONE_API_KEY')
             if not openai_key:
                 missing_vars.append('OPENAI_API_KEY')
@@ -241,7 +277,7 @@ class Command(BaseCommand):
         return chunks
 
     def _create_vector_store(self, chunks, boutique_data_chunks, embedding_model, index_name, force_recreate=False):
-        """Create or update Pinecone vector store"""
+        """Sync the Pinecone vector store with the chunks"""
         # Initialize Pinecone client
         pc = PineconeClient(api_key=os.getenv(
             "PINECONE_API_KEY") or config("PINECONE_API_KEY"))
@@ -257,22 +293,64 @@ class Command(BaseCommand):
 
         self.stdout.write(f"✓ Found existing index: {index_name}")
 
-        if force_recreate:
-            self.stdout.write("Clearing existing vectors...")
-            index = pc.Index(index_name)
-            # Delete all vectors (this might take a while for large indexes)
-            index.delete(delete_all=True)
-            self.stdout.write("✓ Cleared existing vectors")
-
-        # Create vectorstore from documents
-        self.stdout.write(
-            "Creating vector embeddings and uploading to Pinecone...")
-        all_chunks = chunks + boutique_data_chunks
-        vectorstore = Pinecone.from_documents(
-            documents=all_chunks,
+        index = pc.Index(index_name)
+        vectorstore = Pinecone(
+            index=index,
             embedding=embedding_model,
-            index_name=index_name
+            text_key='text'
+        )
+
+        self.stdout.write("Syncing changed chunks to Pinecone...")
+        stats = sync_documents(
+            vectorstore,
+            chunks + boutique_data_chunks,
+            self._get_pinecone_content_hashes(index),
+            force=force_recreate,
         )
+        self._report_sync(stats)
 
-        self.stdout.write("✓ Vector store created successfully")
         return vectorstore
+
+    def _create_local_vector_store(self, chunks, boutique_data_chunks, embedding_model, force_recreate=False):
+        """Sync the local NumPy index with the chunks and write it to disk"""
+        try:
+            vectorstore = LocalVectorStore.load(
+                settings.CHATBOT_LOCAL_INDEX_DIR, embedding_model)
+        except ValueError:
+            vectorstore = LocalVectorStore(embedding_model)
+
+        self.stdout.write("Syncing changed chunks to the local index...")
+        stats = sync_documents(
+            vectorstore,
+            chunks + boutique_data_chunks,
+            vectorstore.get_content_hashes(),
+            force=force_recreate,
+        )
+        vectorstore.save(settings.CHATBOT_LOCAL_INDEX_DIR)
+        self._report_sync(stats)
+
+        self.stdout.write(
+            f"✓ Local vector store written to {settings.CHATBOT_LOCAL_INDEX_DIR}")
+        return vectorstore
+
+    @staticmethod
+    def _get_pinecone_content_hashes(index):
+        """Map the ids of the vectors in the index to their content hashes"""
+        content_hashes = {}
+
+        # Vectors from before incremental sync have no hash and are replaced
+        for ids in index.list():
+            for start in range(0, len(ids), SYNC_BATCH_SIZE):
+                response = index.fetch(ids=ids[start:start + SYNC_BATCH_SIZE])
+
+                for vector_id, vector in response.vectors.items():
+                    content_hashes[vector_id] = (
+                        vector.metadata or {}).get('content_hash')
+
+        return content_hashes
+
+    def _report_sync(self, stats):
+        self.stdout.write(
+            f"✓ Added {stats['added']}, updated {stats['updated']}, "
+            f"deleted {stats['deleted']}, unchanged {stats['unchanged']} chunks"
+        )
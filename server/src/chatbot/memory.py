@@ -0,0 +1,68 @@
+from django.core.cache import caches
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import messages_from_dict, messages_to_dict
+
+from src.chatbot.config import (
+    MEMORY_CACHE_ALIAS,
+    MEMORY_MAX_MESSAGES,
+    MEMORY_TTL_SECONDS,
+)
+
+
+class CacheChatMessageHistory(BaseChatMessageHistory):
+    """
+    Chat history of one session, stored in a Django cache.
+
+    The backend comes from `settings.CACHES`: Redis, so every worker sees
+    the same conversation (an in-process LRU cache under the test runner).
+    Each write keeps only the latest `max_messages` messages
+    and restarts the `ttl` countdown, so idle sessions expire on their own.
+    """
+
+    def __init__(
+        self,
+        session_id,
+        cache_alias=MEMORY_CACHE_ALIAS,
+        ttl=MEMORY_TTL_SECONDS,
+        max_messages=MEMORY_MAX_MESSAGES,
+    ):
+        self.session_id = session_id
+        self.cache = caches[cache_alias]
+        self.ttl = ttl
+        self.max_messages = max_messages
+
+    @property
+    def key(self):
+        return f'chatbot:memory:{self.session_id}'
+
+    @property
+    def messages(self):
+        return messages_from_dict(self.cache.get(self.key, []))
+
+    async def aget_messages(self):
+        return messages_from_dict(await self.cache.aget(self.key, []))
+
+    def add_messages(self, messages):
+        stored = self.cache.get(self.key, []) + messages_to_dict(messages)
+
+        self.cache.set(
+            self.key,
+            stored[-self.max_messages:],
+            timeout=self.ttl,
+        )
+
+    async def aadd_messages(self, messages):
+        stored = await self.cache.aget(self.key, [])
+        stored += messages_to_dict(messages)
+
+        await self.cache.aset(
+            self.key,
+            stored[-self.max_messages:],
+            timeout=self.ttl,
+        )
+
+    def clear(self):
+        self.cache.delete(self.key)
+
+    async def aclear(self):
+        await self.cache.adelete(self.key)
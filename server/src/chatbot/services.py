@@ -1,4 +1,5 @@
 import json
+import logging
 
 from src.chatbot.config import TOP_N_RESULTS
 from src.chatbot.prompts.jewelry_consultation import (
@@ -15,6 +16,8 @@ from langchain.prompts import (
     HumanMessagePromptTemplate,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ChatbotService:
     """Core service for generating chatbot responses."""
@@ -70,6 +73,47 @@ class ChatbotService:
             print(f'Error in generate_response_stream: {e}')
             yield f'data: {json.dumps({'error': 'Something went wrong. Please try again.'})}\n\n'
 
+    async def agenerate_response_stream(self):
+        """
+        Async variant of `generate_response_stream` for ASGI views. Awaits
+        the LLM, vector store and memory instead of blocking a thread.
+        """
+        yield f'data: {json.dumps({'session_id': self.session_id})}\n\n'
+
+        try:
+            memory_vars = await self.conversation_memory.aload_memory_variables({})
+            conversation_history = memory_vars.get('conversation_memory', '')
+
+            optimized_query = await self._agenerate_non_streaming_response(
+                SYSTEM_MESSAGE_QUERY_FOR_SEARCH_OPTIMIZER,
+                HUMAN_MESSAGE_QUERY_FOR_SEARCH_OPTIMIZER,
+                customer_query=self.customer_query,
+                conversation_history=conversation_history,
+            )
+
+            context = await self._aretrieve_relevant_content(optimized_query)
+
+            accumulated_response = ''
+
+            async for chunk in self._agenerate_streaming_response(
+                SYSTEM_MESSAGE_JEWELRY_CONSULTANT,
+                HUMAN_MESSAGE_JEWELRY_CONSULTANT,
+                context=context,
+                customer_query=self.customer_query,
+                conversation_history=conversation_history,
+            ):
+                accumulated_response += chunk
+                yield f'data: {json.dumps({'chunk': chunk})}\n\n'
+
+            await self.conversation_memory.asave_context(
+                {'input': self.customer_query},
+                {'response': accumulated_response}
+            )
+
+        except Exception:
+            logger.exception('Error in agenerate_response_stream')
+            yield f'data: {json.dumps({'error': 'Something went wrong. Please try again.'})}\n\n'
+
     def _generate_non_streaming_response(self, system_message, human_message, **kwargs):
         """Generate non-streaming AI response - returns string directly."""
         messages = self._format_messages(
@@ -92,6 +136,26 @@ class ChatbotService:
             if chunk.content:
                 yield chunk.content
 
+    async def _agenerate_non_streaming_response(self, system_message, human_message, **kwargs):
+        messages = self._format_messages(
+            system_message,
+            human_message,
+            **kwargs,
+        )
+
+        return (await self.llm.ainvoke(messages)).content
+
+    async def _agenerate_streaming_response(self, system_message, human_message, **kwargs):
+        messages = self._format_messages(
+            system_message,
+            human_message,
+            **kwargs,
+        )
+
+        async for chunk in self.streaming_llm.astream(messages):
+            if chunk.content:
+                yield chunk.content
+
     def _format_messages(
         self,
         system_message,
@@ -120,3 +184,15 @@ class ChatbotService:
         )
 
         return context.strip()
+
+    async def _aretrieve_relevant_content(self, query, k=TOP_N_RESULTS):
+        results = await self.vector_store.asimilarity_search(
+            query,
+            k=k
+        )
+
+        context = '\n'.join(
+            result.page_content for result in results
+        )
+
+        return context.strip()
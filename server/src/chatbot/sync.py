@@ -0,0 +1,107 @@
+import hashlib
+import json
+import re
+
+from src.chatbot.config import SYNC_BATCH_SIZE
+
+PRODUCT_KEY_PATTERN = re.compile(r'Category: (\w+); Product ID: (\d+)')
+
+
+def hash_content(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def get_chunk_id(document, source):
+    """
+    Return a stable id for a chunk. Product chunks are keyed by product,
+    so an edited product replaces its own vector; other chunks are keyed
+    by their content.
+    """
+    metadata = document.metadata
+    if 'category' in metadata and 'product_id' in metadata:
+        return f'product-{metadata["category"]}-{metadata["product_id"]}'
+
+    match = PRODUCT_KEY_PATTERN.search(document.page_content)
+    if match:
+        category, product_id = match.groups()
+        return f'product-{category}-{product_id}'
+
+    return f'{source}-{hash_content(document.page_content)[:32]}'
+
+
+def assign_chunk_ids(documents, source):
+    """
+    Store the chunk id and content hash in each document's metadata. The
+    hash covers the metadata too, so a changed filterable attribute is
+    synced even when the text stays the same.
+    """
+    for document in documents:
+        document.metadata['chunk_id'] = get_chunk_id(document, source)
+        document.metadata['content_hash'] = hash_content(
+            document.page_content
+            + json.dumps(
+                {
+                    key: value
+                    for key, value in document.metadata.items()
+                    if key not in ('chunk_id', 'content_hash')
+                },
+                sort_keys=True,
+            )
+        )
+
+    return documents
+
+
+def sync_documents(
+    vectorstore,
+    documents,
+    existing_hashes,
+    batch_size=SYNC_BATCH_SIZE,
+    force=False,
+):
+    """
+    Bring the vector store in line with `documents`.
+
+    `existing_hashes` maps the chunk ids in the store to their content
+    hashes. Only new or changed chunks (every chunk when `force`) are
+    embedded and upserted, `batch_size` at a time. Vectors of chunks that
+    no longer exist are deleted afterwards, so the store is never empty
+    while it syncs. Returns the number of added, updated, deleted and
+    unchanged chunks.
+    """
+    # Duplicate chunks (e.g. repeated boutique text) collapse into one
+    current = {
+        document.metadata['chunk_id']: document for document in documents
+    }
+
+    changed = [
+        document
+        for chunk_id, document in current.items()
+        if force
+        or existing_hashes.get(chunk_id) != document.metadata['content_hash']
+    ]
+    stale_ids = [
+        chunk_id for chunk_id in existing_hashes if chunk_id not in current
+    ]
+
+    for start in range(0, len(changed), batch_size):
+        batch = changed[start:start + batch_size]
+        vectorstore.add_documents(
+            batch,
+            ids=[document.metadata['chunk_id'] for document in batch],
+        )
+
+    for start in range(0, len(stale_ids), batch_size):
+        vectorstore.delete(ids=stale_ids[start:start + batch_size])
+
+    added = sum(
+        document.metadata['chunk_id'] not in existing_hashes
+        for document in changed
+    )
+
+    return {
+        'added': added,
+        'updated': len(changed) - added,
+        'deleted': len(stale_ids),
+        'unchanged': len(current) - len(changed),
+    }
@@ -1,9 +1,14 @@
 from django.urls import path
 
-from .views import ChatBotView
+from .views import AsyncChatBotView, ChatBotView
 
 app_name = 'chatbot'
 
 urlpatterns = [
     path('chat/', ChatBotView.as_view(), name='chatbot-chat'),
+    path(
+        'chat/stream/',
+        AsyncChatBotView.as_view(),
+        name='chatbot-chat-stream',
+    ),
 ]
@@ -0,0 +1,207 @@
+import json
+import os
+import uuid
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from src.chatbot.config import (
+    DIMENSIONS,
+    LOCAL_INDEX_DOCUMENTS_FILE,
+    LOCAL_INDEX_EMBEDDINGS_FILE,
+    TOP_N_RESULTS,
+)
+
+
+class LocalVectorStore(VectorStore):
+    """
+    In-process vector store over a NumPy matrix of normalized embeddings.
+
+    Rows are unit vectors, so cosine similarity is a single matrix-vector
+    dot product and top-k is a partial sort. `save` writes the matrix as
+    an `.npy` file next to a JSON file with the documents; `load` maps the
+    matrix into memory, so every worker shares the same pages.
+    """
+
+    def __init__(self, embedding, vectors=None, documents=None, ids=None):
+        self.embedding = embedding
+        self.vectors = (
+            vectors
+            if vectors is not None
+            else np.empty((0, DIMENSIONS), dtype=np.float32)
+        )
+        self.documents = documents or []
+        self.ids = ids or []
+
+    @property
+    def embeddings(self):
+        return self.embedding
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+        # Zero vectors stay zero rather than becoming NaN
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def add_texts(self, texts, metadatas=None, *, ids=None, **kwargs):
+        """Embed and add texts; texts with an id already stored replace it."""
+        texts = list(texts)
+        metadatas = metadatas or [{} for _ in texts]
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+
+        vectors = self._normalize(self.embedding.embed_documents(texts))
+
+        # A memory-mapped index is read-only; updates work on a copy
+        self.vectors = np.array(self.vectors, dtype=np.float32)
+        rows = {document_id: row for row, document_id in enumerate(self.ids)}
+        new_vectors = []
+
+        for document_id, text, metadata, vector in zip(
+            ids, texts, metadatas, vectors
+        ):
+            document = Document(page_content=text, metadata=metadata)
+
+            if document_id in rows:
+                self.vectors[rows[document_id]] = vector
+                self.documents[rows[document_id]] = document
+                continue
+
+            rows[document_id] = len(self.ids)
+            new_vectors.append(vector)
+            self.documents.append(document)
+            self.ids.append(document_id)
+
+        if new_vectors:
+            self.vectors = np.vstack([self.vectors, *new_vectors])
+
+        return ids
+
+    def delete(self, ids=None, **kwargs):
+        ids = set(ids or [])
+        keep = [
+            row
+            for row, document_id in enumerate(self.ids)
+            if document_id not in ids
+        ]
+
+        self.vectors = np.asarray(self.vectors)[keep]
+        self.documents = [self.documents[row] for row in keep]
+        self.ids = [self.ids[row] for row in keep]
+
+        return True
+
+    def get_content_hashes(self):
+        """Map the ids of the stored chunks to their content hashes."""
+        return {
+            document_id: document.metadata.get('content_hash')
+            for document_id, document in zip(self.ids, self.documents)
+        }
+
+    @classmethod
+    def from_texts(cls, texts, embedding, metadatas=None, *, ids=None, **kwargs):
+        store = cls(embedding)
+        store.add_texts(texts, metadatas, ids=ids)
+
+        return store
+
+    def similarity_search_with_score_by_vector(self, embedding, k=TOP_N_RESULTS):
+        if not self.documents:
+            return []
+
+        scores = self.vectors @ self._normalize(embedding)
+        k = min(k, len(scores))
+
+        # Partition for the k best rows, then sort only those
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [(self.documents[row], float(scores[row])) for row in top]
+
+    def similarity_search_by_vector(self, embedding, k=TOP_N_RESULTS, **kwargs):
+        return [
+            document
+            for document, _ in self.similarity_search_with_score_by_vector(
+                embedding, k
+            )
+        ]
+
+    def similarity_search_with_score(self, query, k=TOP_N_RESULTS, **kwargs):
+        return self.similarity_search_with_score_by_vector(
+            self.embedding.embed_query(query), k
+        )
+
+    def similarity_search(self, query, k=TOP_N_RESULTS, **kwargs):
+        return self.similarity_search_by_vector(
+            self.embedding.embed_query(query), k
+        )
+
+    async def asimilarity_search(self, query, k=TOP_N_RESULTS, **kwargs):
+        # Only embedding the query involves I/O; the search itself is
+        # a few microseconds of NumPy
+        return self.similarity_search_by_vector(
+            await self.embedding.aembed_query(query), k
+        )
+
+    def save(self, path):
+        """Write the index to the directory `path`, replacing any index there."""
+        os.makedirs(path, exist_ok=True)
+
+        embeddings_path = os.path.join(path, LOCAL_INDEX_EMBEDDINGS_FILE)
+        documents_path = os.path.join(path, LOCAL_INDEX_DOCUMENTS_FILE)
+
+        # Written aside and swapped in, so a running server never maps a
+        # half-written file
+        with open(f'{embeddings_path}.tmp', 'wb') as file:
+            np.save(file, np.ascontiguousarray(self.vectors, dtype=np.float32))
+
+        with open(f'{documents_path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(
+                [
+                    {
+                        'id': document_id,
+                        'text': document.page_content,
+                        'metadata': document.metadata,
+                    }
+                    for document_id, document in zip(self.ids, self.documents)
+                ],
+                file,
+            )
+
+        os.replace(f'{embeddings_path}.tmp', embeddings_path)
+        os.replace(f'{documents_path}.tmp', documents_path)
+
+    @classmethod
+    def load(cls, path, embedding):
+        """Map an index written by `save` into memory."""
+        embeddings_path = os.path.join(path, LOCAL_INDEX_EMBEDDINGS_FILE)
+        documents_path = os.path.join(path, LOCAL_INDEX_DOCUMENTS_FILE)
+
+        if not os.path.exists(embeddings_path):
+            raise ValueError(
+                f"Local vector store not found in '{path}'. "
+                f"Please run 'python manage.py setup_vectorstore' first."
+            )
+
+        vectors = np.load(embeddings_path, mmap_mode='r')
+
+        with open(documents_path, encoding='utf-8') as file:
+            records = json.load(file)
+
+        if len(records) != len(vectors):
+            raise ValueError(
+                f"Local vector store in '{path}' is inconsistent. "
+                f"Please run 'python manage.py setup_vectorstore' again."
+            )
+
+        return cls(
+            embedding,
+            vectors=vectors,
+            documents=[
+                Document(page_content=record['text'], metadata=record['metadata'])
+                for record in records
+            ],
+            ids=[record['id'] for record in records],
+        )
@@ -1,7 +1,11 @@
 import json
 import uuid
 
-from django.http import StreamingHttpResponse
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
@@ -60,3 +64,53 @@ class ChatBotView(APIView):
             session_id = str(uuid.uuid4())
 
         return session_id
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncChatBotView(View):
+    """
+    Async variant of `ChatBotView` for ASGI servers (daphne). The LLM
+    round trips are awaited, so an open chat holds no worker thread.
+    """
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b'{}')
+
+        except ValueError:
+            return JsonResponse(
+                ERROR_RESPONSE_OBJECT,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = ChatRequestSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(
+                ERROR_RESPONSE_OBJECT,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            # Connecting the adapters the first time is blocking I/O
+            chatbot_service = await sync_to_async(ChatbotServiceFactory.create)(
+                data.get('session_id') or str(uuid.uuid4()),
+                serializer.validated_data['message'],
+            )
+
+        except Exception as e:
+            return JsonResponse(
+                {'error': str(e), 'success': False},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        async def generate_response():
+            try:
+                async for chunk in chatbot_service.agenerate_response_stream():
+                    yield chunk
+            except Exception as e:
+                yield f'data: {json.dumps({'error': str(e)})}\n\n'
+
+        return StreamingHttpResponse(
+            generate_response(),
+            content_type='text/plain',
+        )
@@ -12,6 +12,60 @@ class InventoryMixin:
     The mixin uses ContentType to dynamically determine the product type.
     """
 
+    @staticmethod
+    def prefetch_products(objs):
+        """
+        Resolve the products of many inventory-holding objects at once.
+
+        Resolving `inventory.product` row by row costs a query for the
+        product and one for each of its attributes. Instead, the
+        inventories are grouped by content type, each product type is
+        loaded with a single query (attributes joined), and the results
+        are stored in the generic foreign key cache of every inventory.
+        Rows pointing at the same product share one instance.
+        """
+        pending = {}
+
+        for obj in objs:
+            inventory = getattr(obj, 'inventory', None)
+
+            if inventory is None:
+                continue
+
+            if not inventory._meta.get_field('product').is_cached(inventory):
+                pending.setdefault(inventory.content_type_id, []).append(
+                    inventory
+                )
+
+        # (content type id, object id) -> product
+        products = {}
+
+        for content_type_id, inventories in pending.items():
+            model_class = ContentType.objects.get_for_id(
+                content_type_id
+            ).model_class()
+
+            loaded = model_class.objects.select_related(
+                'collection',
+                'color',
+                'metal',
+                'stone',
+            ).in_bulk({inventory.object_id for inventory in inventories})
+
+            for pk, product in loaded.items():
+                products[content_type_id, pk] = product
+
+        for inventories in pending.values():
+            for inventory in inventories:
+                product = products.get(
+                    (inventory.content_type_id, inventory.object_id)
+                )
+
+                if product is not None:
+                    inventory._meta.get_field('product').set_cached_value(
+                        inventory, product
+                    )
+
     @staticmethod
     def get_product_info(obj):
         # Get the inventory object from the passed object
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from src.common.mixins import InventoryMixin
+
+
+class InventoryListSerializer(serializers.ListSerializer):
+    """
+    List serializer for objects with an `inventory` (shopping bag items
+    and orders) that resolves all of their products in a batch before the
+    items are serialized, see `InventoryMixin.prefetch_products`.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        InventoryMixin.prefetch_products(items)
+
+        return super().to_representation(items)
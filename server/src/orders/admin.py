@@ -2,38 +2,36 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 
-from src.orders.models import Order
+from src.orders.models import Order, OrderGroup
 
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     def product_display(self, obj):
-        if obj.inventory:
-            product = getattr(obj.inventory, 'product', None)
-
-            if product:
-                return str(product)
-
-            return str(obj.inventory)
+        # Read from the snapshot taken at checkout, so the changelist runs
+        # no query per row into the catalog tables
+        snapshot = obj.product_snapshot
+        if snapshot:
+            return (
+                f'{snapshot["category"]} #{snapshot["product_id"]} '
+                f'({snapshot["size"]})'
+            )
 
         return '-'
 
     product_display.short_description = 'Product'
 
     def product_info(self, obj):
-        if obj.inventory:
-            product = getattr(obj.inventory, 'product', None)
-
-            if product:
-                app_label = product._meta.app_label
-                model_name = product._meta.model_name
-                url = reverse(
-                    f'admin:{app_label}_{model_name}_change', args=[product.id]
-                )
-
-                return format_html('<a href="{}">{}</a>', url, str(product))
+        snapshot = obj.product_snapshot
+        if snapshot:
+            url = reverse(
+                f'admin:products_{snapshot["content_type"]}_change',
+                args=[snapshot['product_id']],
+            )
 
-            return str(obj.inventory)
+            return format_html(
+                '<a href="{}">{}</a>', url, self.product_display(obj)
+            )
 
         return '-'
 
@@ -50,7 +48,23 @@ class OrderAdmin(admin.ModelAdmin):
         'order_group',
     )
     list_filter = ('status', 'created_at')
-    search_fields = ('user__username', 'order_group')
+    search_fields = ('user__username', 'order_group__id')
     readonly_fields = ('created_at', 'product_info')
     ordering = ('-created_at',)
     exclude = ('content_type', 'object_id')
+
+
+@admin.register(OrderGroup)
+class OrderGroupAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'user',
+        'status',
+        'total_items',
+        'total_price',
+        'created_at',
+    )
+    list_filter = ('status', 'created_at')
+    search_fields = ('user__username', 'id')
+    readonly_fields = ('created_at', 'total_items', 'total_price')
+    ordering = ('-created_at',)
@@ -12,6 +12,24 @@ class CardFieldLengths:
     CVV_EXACT_LENGTH = 3
 
 
+class OrderFieldLengths:
+    # Matches the inventory price the unit price is copied from
+    UNIT_PRICE_MAX_DIGITS = 7
+
+    # Room for a full bag of the most expensive inventory items
+    TOTAL_PRICE_MAX_DIGITS = 12
+
+    PRICE_DECIMAL_PLACES = 2
+
+
+class OrderCompletionDefaults:
+    # Pending orders older than this are completed by the periodic task
+    AGE_DAYS = 1
+
+    # Rows completed per transaction
+    BATCH_SIZE = 500
+
+
 class CardErrorMessages:
     INVALID_CARD_NUMBER = 'Please enter a valid card number'
 
@@ -41,3 +59,4 @@ class OrderStatusMessages:
 class OrderErrorMessages:
     ERROR_INVALID_CONTENT_TYPE_OR_ID = 'Invalid content type or object ID'
     ERROR_REVIEW_NOT_FOUND = 'Review not found'
+    ERROR_STOCK_CHANGED = 'Stock changed during checkout, please try again'
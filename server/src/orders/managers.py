@@ -0,0 +1,69 @@
+from django.db import models, transaction
+from django.db.models import Q
+
+from src.orders.choices import OrderStatusChoices
+from src.orders.constants import OrderCompletionDefaults
+
+
+class OrderStatusQuerySet(models.QuerySet):
+    """
+    Status helpers shared by order groups and order lines.
+    """
+
+    def pending(self):
+        return self.filter(status=OrderStatusChoices.PENDING)
+
+    def complete_pending_before(
+        self,
+        cutoff,
+        batch_size=OrderCompletionDefaults.BATCH_SIZE,
+        on_batch=None,
+    ):
+        """
+        Mark rows still pending and created before `cutoff` as completed,
+        `batch_size` rows per transaction, oldest first.
+
+        Each batch only locks the rows it updates and skips rows another
+        transaction holds, so checkout writes never wait on this job.
+        Committed batches stay completed if the run stops halfway; the
+        next run picks up the rest from the pending index. `on_batch` is
+        called with the running total after every batch.
+        Returns the number of rows completed.
+        """
+        completed = 0
+        last_position = None
+
+        while True:
+            with transaction.atomic():
+                batch = self.pending().filter(created_at__lt=cutoff)
+
+                # Continue after the last row seen, so rows skipped as
+                # locked are not picked up again in the same run
+                if last_position is not None:
+                    created_at, pk = last_position
+                    batch = batch.filter(
+                        Q(created_at__gt=created_at)
+                        | Q(created_at=created_at, pk__gt=pk)
+                    )
+
+                rows = list(
+                    batch.select_for_update(skip_locked=True)
+                    .order_by('created_at', 'pk')
+                    .values_list('created_at', 'pk')[:batch_size]
+                )
+
+                if not rows:
+                    return completed
+
+                completed += self.filter(pk__in=[pk for _, pk in rows]).update(
+                    status=OrderStatusChoices.COMPLETED
+                )
+
+            if on_batch is not None:
+                on_batch(completed)
+
+            # A short batch means nothing older is left
+            if len(rows) < batch_size:
+                return completed
+
+            last_position = rows[-1]
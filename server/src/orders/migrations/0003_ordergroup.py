@@ -0,0 +1,108 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:31
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+# One group per checkout UUID already stored on the order lines. A group
+# is pending while any of its lines is ('PE' sorts after 'CO'). Plain SQL
+# keeps the original checkout time, which auto_now_add would overwrite.
+CREATE_ORDER_GROUPS = """
+    INSERT INTO orders_ordergroup
+        (id, status, total_price, total_items, created_at, user_id)
+    SELECT
+        o.order_group,
+        MAX(o.status),
+        SUM(i.price * o.quantity),
+        SUM(o.quantity),
+        MIN(o.created_at),
+        MIN(o.user_id)
+    FROM orders_order o
+    INNER JOIN products_inventory i ON i.id = o.inventory_id
+    GROUP BY o.order_group
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_initial'),
+        ('products', '0006_generic_relation_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderGroup',
+            fields=[
+                (
+                    'id',
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[('PE', 'Pending'), ('CO', 'Completed')],
+                        default='PE',
+                        help_text='Current status of the checkout (e.g., pending, completed).',
+                        max_length=2,
+                    ),
+                ),
+                (
+                    'total_price',
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text='Sum of price times quantity over the order lines.',
+                        max_digits=12,
+                    ),
+                ),
+                (
+                    'total_items',
+                    models.PositiveIntegerField(
+                        help_text='Sum of the quantities of the order lines.'
+                    ),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text='Timestamp when the order was placed.',
+                    ),
+                ),
+                (
+                    'user',
+                    models.ForeignKey(
+                        help_text='The user who placed the order.',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='order_groups',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.RunSQL(
+            CREATE_ORDER_GROUPS,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='order_group',
+            field=models.ForeignKey(
+                db_column='order_group',
+                help_text='The checkout this order item belongs to.',
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='orders',
+                to='orders.ordergroup',
+            ),
+        ),
+    ]
@@ -0,0 +1,118 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:35
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+
+def snapshot_order_lines(apps, schema_editor):
+    """
+    Existing lines get the current inventory price and product details,
+    which is the best record there is of what was bought.
+    """
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Order = apps.get_model('orders', 'Order')
+
+    orders = Order.objects.select_related('inventory__size').order_by('pk')
+    content_type_ids = orders.values_list(
+        'inventory__content_type_id', flat=True
+    ).distinct()
+
+    products = {}
+
+    for content_type in ContentType.objects.filter(pk__in=content_type_ids):
+        model_class = apps.get_model(
+            content_type.app_label, content_type.model
+        )
+
+        for product in model_class.objects.select_related(
+            'collection',
+            'color',
+            'metal',
+            'stone',
+        ):
+            products[content_type.pk, product.pk] = (content_type, product)
+
+    batch = []
+
+    for order in orders.iterator(chunk_size=BATCH_SIZE):
+        inventory = order.inventory
+
+        order.unit_price = inventory.price
+        order.total_price = inventory.price * order.quantity
+
+        content_type, product = products.get(
+            (inventory.content_type_id, inventory.object_id),
+            (None, None),
+        )
+
+        if product is not None:
+            order.product_snapshot = {
+                'product_id': product.pk,
+                'content_type': content_type.model,
+                'category': content_type.model.capitalize(),
+                'collection': product.collection.name,
+                'first_image': product.first_image,
+                'size': inventory.size.name,
+                'metal': product.metal.name,
+                'stone': product.stone.name,
+                'color': product.color.name,
+            }
+
+        batch.append(order)
+
+        if len(batch) == BATCH_SIZE:
+            Order.objects.bulk_update(
+                batch, ['unit_price', 'total_price', 'product_snapshot']
+            )
+            batch = []
+
+    Order.objects.bulk_update(
+        batch, ['unit_price', 'total_price', 'product_snapshot']
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('orders', '0003_ordergroup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='product_snapshot',
+            field=models.JSONField(
+                default=dict,
+                help_text='Product details (name parts, image, size) at checkout.',
+            ),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='total_price',
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                help_text='Unit price times quantity.',
+                max_digits=12,
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='unit_price',
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                help_text='Inventory price at the time of checkout.',
+                max_digits=7,
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            snapshot_order_lines,
+            migrations.RunPython.noop,
+        ),
+    ]
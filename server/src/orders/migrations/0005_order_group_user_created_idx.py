@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_order_line_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ordergroup',
+            index=models.Index(
+                fields=['user', '-created_at'],
+                name='order_group_user_created_idx',
+            ),
+        ),
+    ]
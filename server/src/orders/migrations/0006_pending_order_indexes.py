@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_order_group_user_created_idx'),
+        ('products', '0006_generic_relation_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(
+                condition=models.Q(('status', 'PE')),
+                fields=['created_at'],
+                name='order_pending_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ordergroup',
+            index=models.Index(
+                condition=models.Q(('status', 'PE')),
+                fields=['created_at'],
+                name='order_group_pending_idx',
+            ),
+        ),
+    ]
@@ -2,17 +2,94 @@ from django.db import models
 from django.contrib.auth import get_user_model
 import uuid
 from src.orders.choices import OrderStatusChoices
+from src.orders.constants import OrderFieldLengths
+from src.orders.managers import OrderStatusQuerySet
 
 UserModel = get_user_model()
 
 
+class OrderGroup(models.Model):
+    """
+    The OrderGroup model represents a single checkout: the products a user
+    bought together.
+
+    Key Features:
+    - The primary key is the UUID clients already use to refer to a checkout.
+    - Stores the total price and item count computed at checkout, so order
+      history never has to re-sum the order lines.
+    - Tracks the status of the checkout as a whole.
+
+    Relationships:
+    - orders: the order lines (one per inventory item) of the checkout.
+    - user: ForeignKey to the user who placed the order.
+    """
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # A user's order history, newest first (cursor pagination)
+            models.Index(
+                fields=['user', '-created_at'],
+                name='order_group_user_created_idx',
+            ),
+            # Pending checkouts by age (auto-completion task); completed
+            # rows leave the index, so it stays small
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status=OrderStatusChoices.PENDING),
+                name='order_group_pending_idx',
+            ),
+        ]
+
+    objects = OrderStatusQuerySet.as_manager()
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    status = models.CharField(
+        max_length=OrderStatusChoices.max_length(),
+        choices=OrderStatusChoices.choices,
+        default=OrderStatusChoices.PENDING,
+        help_text="Current status of the checkout (e.g., pending, completed).",
+    )
+
+    total_price = models.DecimalField(
+        max_digits=OrderFieldLengths.TOTAL_PRICE_MAX_DIGITS,
+        decimal_places=OrderFieldLengths.PRICE_DECIMAL_PLACES,
+        help_text="Sum of price times quantity over the order lines.",
+    )
+
+    total_items = models.PositiveIntegerField(
+        help_text="Sum of the quantities of the order lines."
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True, help_text="Timestamp when the order was placed."
+    )
+
+    user = models.ForeignKey(
+        to=UserModel,
+        on_delete=models.CASCADE,
+        related_name='order_groups',
+        help_text="The user who placed the order.",
+    )
+
+    def __str__(self):
+        return str(self.id)
+
+
 class Order(models.Model):
     """
     The Order model represents a single product order made by a user.
 
     Key Features:
     - Each order is linked to a specific inventory item (size/variation) via a ForeignKey.
-    - Supports grouping multiple products into a single order event using order_group (UUID).
+    - Belongs to the OrderGroup of the checkout that created it.
+    - Snapshots the unit price, line total and product details at checkout, so
+      history and reports never read the live catalog (prices can change).
     - Tracks order status (pending, completed, etc.).
     - Stores the quantity and creation timestamp for each order item.
     - Linked to the user who placed the order.
@@ -20,16 +97,29 @@ class Order(models.Model):
     Relationships:
     - inventory: ForeignKey to Inventory, which in turn is linked to the actual product (Earwear, Neckwear, etc.).
     - user: ForeignKey to the user who placed the order.
-    - order_group: UUID to group multiple order items from a single checkout.
+    - order_group: ForeignKey to the OrderGroup (checkout) of the order.
     """
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Pending order lines by age (auto-completion task)
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status=OrderStatusChoices.PENDING),
+                name='order_pending_idx',
+            ),
+        ]
 
-    order_group = models.UUIDField(
-        default=uuid.uuid4,
-        editable=False,
-        help_text="Groups multiple order items from a single checkout event.",
+    objects = OrderStatusQuerySet.as_manager()
+
+    # The column keeps its name, so the stored checkout UUIDs stay valid
+    order_group = models.ForeignKey(
+        to=OrderGroup,
+        on_delete=models.CASCADE,
+        related_name='orders',
+        db_column='order_group',
+        help_text="The checkout this order item belongs to.",
     )
 
     status = models.CharField(
@@ -47,6 +137,23 @@ class Order(models.Model):
         auto_now_add=True, help_text="Timestamp when the order was created."
     )
 
+    unit_price = models.DecimalField(
+        max_digits=OrderFieldLengths.UNIT_PRICE_MAX_DIGITS,
+        decimal_places=OrderFieldLengths.PRICE_DECIMAL_PLACES,
+        help_text="Inventory price at the time of checkout.",
+    )
+
+    total_price = models.DecimalField(
+        max_digits=OrderFieldLengths.TOTAL_PRICE_MAX_DIGITS,
+        decimal_places=OrderFieldLengths.PRICE_DECIMAL_PLACES,
+        help_text="Unit price times quantity.",
+    )
+
+    product_snapshot = models.JSONField(
+        default=dict,
+        help_text="Product details (name parts, image, size) at checkout.",
+    )
+
     inventory = models.ForeignKey(
         to='products.Inventory',
         on_delete=models.CASCADE,
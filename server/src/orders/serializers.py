@@ -1,33 +1,81 @@
 from rest_framework import serializers
 
 from src.orders.constants import CardFieldLengths
-from src.orders.models import Order
+from src.orders.models import Order, OrderGroup
 from src.orders.services import OrderService, PaymentValidationService
-from src.common.mixins import InventoryMixin
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSummarySerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for an order line in the order history list.
+    Reads only the product snapshot taken at checkout, so the line needs
+    no related objects.
+    """
+
+    product_info = serializers.SerializerMethodField()
+    product_content_type = serializers.SerializerMethodField()
+    product_object_id = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Order
+        fields = [
+            'id',
+            'quantity',
+            'product_info',
+            'product_content_type',
+            'product_object_id',
+        ]
+        read_only_fields = fields
+
+    def get_product_info(self, obj):
+        """
+        Returns the product details snapshotted at checkout, with the unit
+        price paid. Size is not included. No catalog table is read.
+        """
+        info = {
+            key: value
+            for key, value in obj.product_snapshot.items()
+            if key not in ('size', 'content_type')
+        }
+        if info:
+            info['price'] = float(obj.unit_price)
+
+        return info
+
+    def get_product_content_type(self, obj):
+        """
+        Returns the model name of the related product (e.g., 'earwear'), used for review integration.
+        """
+        return obj.product_snapshot.get('content_type')
+
+    def get_product_object_id(self, obj):
+        """
+        Returns the primary key of the related product, used for review integration.
+        """
+        return obj.product_snapshot.get('product_id')
+
+
+class OrderSerializer(OrderSummarySerializer):
     """
     Serializer for the Order model.
 
     Key Features:
     - Serializes order details, including inventory, status, and user.
     - Excludes size and quantity fields to ensure only unique products are shown in order history.
-    - Includes product_info (details about the product from inventory, with size removed).
+    - Includes product_info (the product snapshot taken at checkout, with size removed).
     - Includes product_content_type and product_object_id for review integration (used by frontend to submit reviews for the correct product).
-    - Calculates total price for the order item.
+    - Returns the total price stored for the order item at checkout.
     """
 
     inventory = serializers.PrimaryKeyRelatedField(
         queryset=Order._meta.get_field('inventory').related_model.objects.all()
     )
-    product_info = serializers.SerializerMethodField()
+    # The checkout UUID rather than the nested group (depth=3)
+    order_group = serializers.PrimaryKeyRelatedField(read_only=True)
     total_price = serializers.SerializerMethodField()
     status_display = serializers.CharField(
         source='get_status_display', read_only=True
     )
-    product_content_type = serializers.SerializerMethodField()
-    product_object_id = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
@@ -57,91 +105,60 @@ class OrderSerializer(serializers.ModelSerializer):
         ]
         depth = 3
 
-    def get_product_info(self, obj):
-        """
-        Returns product details for the order item, using the related inventory's product.
-        Removes size from the product_info if present.
-        """
-        info = InventoryMixin.get_product_info(obj)
-        if isinstance(info, dict) and 'size' in info:
-            info.pop('size')
-
-        return info
-
     def get_total_price(self, obj):
         """
-        Calculates the total price for this order item (price * quantity).
+        Returns the line total stored at checkout (unit price * quantity).
         """
-        return InventoryMixin.get_total_price_per_product(obj)
+        return obj.total_price
 
-    def get_product_content_type(self, obj):
-        """
-        Returns the model name of the related product (e.g., 'earwear'), used for review integration.
-        """
-        inventory = obj.inventory
-        if not inventory:
-            return None
 
-        product = getattr(inventory, 'product', None)
-        if not product:
-            return None
+class OrderGroupListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for a checkout in the paginated order history.
+    Reads the totals stored on the group and lists each product of the
+    checkout once, from the line snapshots only.
+    Expects the group's lines to be prefetched (see
+    `OrderService.get_user_order_group_summaries`).
+    """
 
-        return product._meta.model_name
+    order_group = serializers.UUIDField(source='id', read_only=True)
+    status_display = serializers.CharField(
+        source='get_status_display', read_only=True
+    )
+    total_price = serializers.FloatField(read_only=True)
+    products = serializers.SerializerMethodField()
 
-    def get_product_object_id(self, obj):
-        """
-        Returns the primary key of the related product, used for review integration.
-        """
-        inventory = obj.inventory
-        if not inventory:
-            return None
+    # Serializes each product of the checkout
+    product_serializer_class = OrderSummarySerializer
 
-        product = getattr(inventory, 'product', None)
-        if not product:
-            return None
+    class Meta:
+        model = OrderGroup
+        fields = [
+            'order_group',
+            'status',
+            'status_display',
+            'created_at',
+            'total_price',
+            'total_items',
+            'products',
+        ]
+        read_only_fields = fields
+
+    def get_products(self, obj):
+        orders = OrderService.get_unique_product_orders(obj.orders.all())
 
-        return product.id
+        return self.product_serializer_class(orders, many=True).data
 
 
-class OrderGroupSerializer(serializers.Serializer):
+class OrderGroupSerializer(OrderGroupListSerializer):
     """
     Serializer for a group of orders (products purchased together in one checkout).
-    Aggregates order info, total price, and product details for the group.
+    Reads the totals stored on the group and lists each product of the checkout once,
+    with the full order line details.
+    Expects the group's lines to be prefetched (see `OrderService.get_user_order_groups`).
     """
 
-    order_group = serializers.UUIDField(read_only=True)
-    status = serializers.CharField(read_only=True)
-    status_display = serializers.CharField(read_only=True)
-    created_at = serializers.DateTimeField(read_only=True)
-    total_price = serializers.FloatField(read_only=True)
-    total_items = serializers.IntegerField(read_only=True)
-    products = OrderSerializer(many=True, read_only=True)
-
-    def to_representation(self, instance):
-        """
-        Customizes the output format for grouped orders.
-        """
-        if isinstance(instance, dict) and 'orders' in instance:
-            orders = instance['orders']
-            if not orders:
-                return {}
-
-            first_order = orders[0]
-            total_items = sum(order.quantity for order in orders)
-
-            return {
-                'order_group': str(first_order.order_group),
-                'status': first_order.status,
-                'status_display': first_order.get_status_display(),
-                'created_at': first_order.created_at,
-                'total_price': OrderService.calculate_order_group_total(
-                    str(first_order.order_group), first_order.user
-                ),
-                'total_items': total_items,
-                'products': OrderSerializer(orders, many=True).data,
-            }
-
-        return super().to_representation(instance)
+    product_serializer_class = OrderSerializer
 
 
 class OrderCreateSerializer(serializers.Serializer):
@@ -1,15 +1,24 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.db.models import Case, F, Prefetch, Q, Value, When
 
 from rest_framework.exceptions import ValidationError
 
 from datetime import datetime
 import re
-import uuid
 
-from src.orders.models import Order
-from src.shopping_bags.models import ShoppingBag
+from src.orders.models import Order, OrderGroup
+from src.products.cache import bump_catalog_version
+from src.products.models import Inventory, ProductListing
+from src.shopping_bags.constants import ShoppingBagErrorMessages
+from src.shopping_bags.models import ShoppingBag, StockReservation
+from src.common.mixins import InventoryMixin
 from src.common.services import UserIdentificationService
-from src.orders.constants import CardErrorMessages, CardRegexPatterns
+from src.orders.constants import (
+    CardErrorMessages,
+    CardRegexPatterns,
+    OrderErrorMessages,
+)
 
 
 class PaymentValidationService:
@@ -147,93 +156,264 @@ class OrderService:
     @staticmethod
     @transaction.atomic
     def process_order_from_shopping_bag(user):
-        shopping_bag_items = ShoppingBag.objects.filter(
-            user=user
-        ).select_related('inventory')
+        """
+        Turn the user's shopping bag into a single order group.
+
+        The inventory rows of the bag are locked in primary key order, so
+        concurrent checkouts of overlapping bags always queue up in the
+        same order instead of deadlocking. Stock is checked for every line
+        and taken with one conditional UPDATE, then all orders are
+        inserted at once, so a checkout runs the same number of queries
+        no matter how many items the bag holds.
+        """
+        shopping_bag_items = list(
+            ShoppingBag.objects.filter(
+                user=user,
+            ).order_by('inventory_id')
+        )
 
-        if not shopping_bag_items.exists():
+        if not shopping_bag_items:
             raise ValidationError(
                 {
                     'shopping_bag': 'Shopping bag is empty',
                 }
             )
 
-        order_group = uuid.uuid4()
-        orders = []
+        inventories = (
+            Inventory.objects.select_for_update(of=('self',))
+            .select_related('size')
+            .in_bulk(
+                sorted(
+                    bag_item.inventory_id for bag_item in shopping_bag_items
+                )
+            )
+        )
+
+        # Stock held in other shoppers' bags cannot be bought
+        reserved_quantities = StockReservation.objects.get_reserved_quantities(
+            inventories,
+            exclude_user=user,
+        )
+
+        OrderService._validate_stock(
+            shopping_bag_items,
+            inventories,
+            reserved_quantities,
+        )
+
+        # The rows are locked, so the guard cannot fail after the check
+        # above; it stays as a safety net against negative stock
+        stock_guard = Q()
+        quantity_taken = []
 
         for bag_item in shopping_bag_items:
-            order = Order.objects.create(
+            stock_guard |= Q(
+                pk=bag_item.inventory_id,
+                quantity__gte=bag_item.quantity,
+            )
+            quantity_taken.append(
+                When(pk=bag_item.inventory_id, then=Value(bag_item.quantity))
+            )
+
+        updated = Inventory.objects.filter(stock_guard).update(
+            quantity=F('quantity') - Case(*quantity_taken)
+        )
+
+        if updated != len(shopping_bag_items):
+            raise ValidationError(
+                {
+                    'shopping_bag': OrderErrorMessages.ERROR_STOCK_CHANGED,
+                }
+            )
+
+        # Totals are stored with the checkout, so order history never
+        # re-sums the lines
+        order_group = OrderGroup.objects.create(
+            user=user,
+            total_price=sum(
+                inventories[bag_item.inventory_id].price * bag_item.quantity
+                for bag_item in shopping_bag_items
+            ),
+            total_items=sum(
+                bag_item.quantity for bag_item in shopping_bag_items
+            ),
+        )
+
+        orders = [
+            Order(
                 user=user,
-                inventory=bag_item.inventory,
+                inventory=inventories[bag_item.inventory_id],
                 quantity=bag_item.quantity,
                 order_group=order_group,
+                unit_price=inventories[bag_item.inventory_id].price,
+                total_price=(
+                    inventories[bag_item.inventory_id].price
+                    * bag_item.quantity
+                ),
+            )
+            for bag_item in shopping_bag_items
+        ]
+
+        # One query per product type for the product snapshots
+        InventoryMixin.prefetch_products(orders)
+
+        for order in orders:
+            order.product_snapshot = OrderService.build_product_snapshot(
+                order.inventory
             )
-            orders.append(order)
 
-        shopping_bag_items.delete()
+        Order.objects.bulk_create(orders)
+
+        ShoppingBag.objects.filter(
+            pk__in=[bag_item.pk for bag_item in shopping_bag_items]
+        ).delete()
+
+        # The UPDATE above bypasses the Inventory signals, so the listing
+        # rows and catalog cache are refreshed once the stock is committed
+        products = {
+            (inventory.content_type_id, inventory.object_id)
+            for inventory in inventories.values()
+        }
+        transaction.on_commit(
+            lambda: OrderService._sync_product_listings(products)
+        )
 
         return orders
 
+    @staticmethod
+    def build_product_snapshot(inventory):
+        """
+        Returns the product details an order line keeps from checkout, in
+        the shape of `InventoryMixin.get_product_info`, plus the content
+        type used for review integration.
+        """
+        product = getattr(inventory, 'product', None)
+        if not product:
+            return {}
+
+        content_type = ContentType.objects.get_for_id(
+            inventory.content_type_id
+        )
+
+        return {
+            'product_id': product.id,
+            'content_type': content_type.model,
+            'category': content_type.model.capitalize(),
+            'collection': product.collection.name,
+            'first_image': product.first_image,
+            'size': inventory.size.name,
+            'metal': product.metal.name,
+            'stone': product.stone.name,
+            'color': product.color.name,
+        }
+
+    @staticmethod
+    def _validate_stock(shopping_bag_items, inventories, reserved_quantities):
+        # Keyed by inventory id, so the client can point at every line
+        # that can no longer be fulfilled
+        errors = {}
+
+        for bag_item in shopping_bag_items:
+            inventory = inventories[bag_item.inventory_id]
+            available_quantity = inventory.quantity - (
+                reserved_quantities.get(inventory.pk, 0)
+            )
+
+            if bag_item.quantity > available_quantity:
+                errors[inventory.pk] = (
+                    ShoppingBagErrorMessages.INSUFFICIENT_STOCK.format(
+                        quantity=max(available_quantity, 0)
+                    )
+                )
+
+        if errors:
+            raise ValidationError(
+                {
+                    'shopping_bag': errors,
+                }
+            )
+
+    @staticmethod
+    def _sync_product_listings(products):
+        for content_type_id, object_id in products:
+            content_type = ContentType.objects.get_for_id(content_type_id)
+
+            ProductListing.objects.sync_for(content_type, object_id)
+            bump_catalog_version(content_type.model)
+
     @staticmethod
     def get_user_orders(user):
-        # Retrieves all orders for a user, with related product and user info
+        # Retrieves all orders for a user with user info; product details
+        # come from the line snapshots, so no catalog table is joined
         return (
             Order.objects.filter(
                 user=user,
             )
             .select_related(
-                'inventory',
                 'user',
             )
+            # The serializer nests the user (depth=3) with their groups and
+            # permissions
+            .prefetch_related(
+                'user__groups',
+                'user__user_permissions',
+            )
             .order_by(
                 '-created_at',
             )
         )
 
     @staticmethod
-    def get_user_orders_grouped(user):
+    def get_user_order_groups(user):
         """
-        Groups orders by order_group, but only includes one entry per unique product (not per inventory/size).
-        The order group total is still calculated as the sum of all order items in the group.
-        Do not modify the order objects (do not set quantity to None).
+        Retrieves the user's checkouts, newest first, with their order
+        lines prefetched. Iterating any number of groups runs two queries.
         """
-        orders = OrderService.get_user_orders(user)
-        grouped_orders = {}
-
-        for order in orders:
-            order_group_str = str(order.order_group)
-            if order_group_str not in grouped_orders:
-                grouped_orders[order_group_str] = {}
-            # Use (product_content_type, product_object_id) as the unique key
-
-            inventory = order.inventory
-
-            product = getattr(inventory, 'product', None)
-            if not product:
-                continue
-
-            product_key = (product._meta.model_name, product.id)
-            if product_key not in grouped_orders[order_group_str]:
-                grouped_orders[order_group_str][product_key] = order
-
-        # Convert dicts to lists for serializer compatibility
-        for group in grouped_orders:
-            grouped_orders[group] = list(grouped_orders[group].values())
-
-        return grouped_orders
+        return OrderGroup.objects.filter(
+            user=user,
+        ).prefetch_related(
+            Prefetch(
+                'orders',
+                queryset=OrderService.get_user_orders(user).order_by('id'),
+            ),
+        )
 
     @staticmethod
-    def calculate_order_group_total(order_group_id, user):
-        # Calculates the total price for all orders in a group (single checkout)
-        orders = Order.objects.filter(
+    def get_user_order_group_summaries(user):
+        """
+        Retrieves the user's checkouts, newest first, with only the order
+        line columns the history list shows (the product snapshots).
+        """
+        return OrderGroup.objects.filter(
             user=user,
-            order_group=order_group_id,
-        ).select_related('inventory')
+        ).prefetch_related(
+            Prefetch(
+                'orders',
+                queryset=Order.objects.order_by('id').only(
+                    'id',
+                    'order_group',
+                    'quantity',
+                    'unit_price',
+                    'product_snapshot',
+                ),
+            ),
+        )
 
-        total = 0.0
+    @staticmethod
+    def get_unique_product_orders(orders):
+        """
+        Returns one order line per unique product (not per inventory/size),
+        in line order. Order history shows each product of a checkout once.
+        """
+        unique_orders = {}
 
         for order in orders:
-            if order.inventory and hasattr(order.inventory, 'price'):
-                total += float(order.inventory.price) * order.quantity
+            snapshot = order.product_snapshot
+            if not snapshot:
+                continue
+
+            # Use (product model name, product id) as the unique key
+            product_key = (snapshot['content_type'], snapshot['product_id'])
+            unique_orders.setdefault(product_key, order)
 
-        return round(total, 2)
+        return list(unique_orders.values())
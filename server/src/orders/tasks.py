@@ -1,17 +1,32 @@
+import logging
+
 from celery import shared_task
 
 from django.utils import timezone
 from datetime import timedelta
 
-from src.orders.models import Order
-from src.orders.choices import OrderStatusChoices
+from src.orders.constants import OrderCompletionDefaults
+from src.orders.models import Order, OrderGroup
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
-def complete_old_orders():
-    cutoff = timezone.now() - timedelta(days=1)
+def complete_old_orders(batch_size=OrderCompletionDefaults.BATCH_SIZE):
+    cutoff = timezone.now() - timedelta(days=OrderCompletionDefaults.AGE_DAYS)
     # cutoff = timezone.now() - timedelta(seconds=30)
 
-    Order.objects.filter(
-        status=OrderStatusChoices.PENDING, created_at__lt=cutoff
-    ).update(status=OrderStatusChoices.COMPLETED)
+    completed = {}
+
+    for model in (OrderGroup, Order):
+        name = model._meta.verbose_name_plural
+
+        completed[name] = model.objects.complete_pending_before(
+            cutoff,
+            batch_size=batch_size,
+            on_batch=lambda total, name=name: logger.info(
+                'Completed %d pending %s', total, name
+            ),
+        )
+
+    return completed
@@ -2,7 +2,7 @@
 This module defines the API views for order management.
 
 Key features:
-- Allows users to view their orders (list, retrieve)
+- Allows users to view their orders (cursor-paginated list, retrieve one checkout)
 - Provides a custom endpoint to create orders from the shopping bag using a POST request
 - Ensures all order creation steps are performed atomically (all succeed or all fail)
 """
@@ -11,14 +11,34 @@ from django.db import transaction
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 
-from src.orders.serializers import OrderCreateSerializer, OrderGroupSerializer
+from src.orders.serializers import (
+    OrderCreateSerializer,
+    OrderGroupListSerializer,
+    OrderGroupSerializer,
+)
 from src.orders.services import OrderService
 from src.orders.constants import OrderStatusMessages
 
 
+class OrderGroupPagination(CursorPagination):
+    """
+    Cursor pagination over a user's checkouts, newest first.
+
+    Pages continue after the creation time of the previous page's last
+    checkout (served by the `(user, created_at)` index), so older pages
+    cost about the same as the first one. Only `created_at` goes into the
+    cursor; checkouts placed at the same moment are told apart by an
+    offset within that timestamp, and `-id` only keeps their order stable.
+    """
+
+    page_size = 10
+    ordering = ('-created_at', '-id')
+
+
 class OrderViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for user order management.
@@ -35,22 +55,23 @@ class OrderViewSet(viewsets.ReadOnlyModelViewSet):
     """
 
     serializer_class = OrderGroupSerializer
+    pagination_class = OrderGroupPagination
 
     def get_queryset(self):
-        # Returns all orders for the current user
-        return OrderService.get_user_orders(self.request.user)
+        # The history list only reads the line snapshots; a single
+        # checkout is served with its full order line details
+        if self.action == 'list':
+            return OrderService.get_user_order_group_summaries(
+                self.request.user
+            )
 
-    def list(self, request, *args, **kwargs):
-        # Returns a grouped list of all orders for the current user
-        grouped_orders = OrderService.get_user_orders_grouped(request.user)
+        return OrderService.get_user_order_groups(self.request.user)
 
-        serializer_data = []
-        # Each group is a set of products purchased together
-        for _, orders in grouped_orders.items():
-            serializer_data.append({'orders': orders})
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return OrderGroupListSerializer
 
-        serializer = self.get_serializer(serializer_data, many=True)
-        return Response(serializer.data)
+        return OrderGroupSerializer
 
     @action(
         detail=False,  # This action is not for a single order, but for the collection
@@ -79,20 +100,18 @@ class OrderViewSet(viewsets.ReadOnlyModelViewSet):
                 )
 
                 if orders:
-                    # If orders were created, calculate the total price for the group
-                    order_group_str = str(orders[0].order_group)
-                    total_price = OrderService.calculate_order_group_total(
-                        order_group_str, request.user
-                    )
-
-                    group_serializer = OrderGroupSerializer({'orders': orders})
+                    # If orders were created, load the group with its stored total
+                    order_group = OrderService.get_user_order_groups(
+                        request.user
+                    ).get(pk=orders[0].order_group_id)
+                    group_serializer = OrderGroupSerializer(order_group)
 
                     return Response(
                         {
                             'message': OrderStatusMessages.STATUS_CREATED,
                             'order': group_serializer.data,
                             'total_items': len(orders),
-                            'total_price': total_price,
+                            'total_price': float(order_group.total_price),
                         },
                         status=status.HTTP_201_CREATED,
                     )
@@ -0,0 +1,133 @@
+"""
+Versioned response cache for the public catalog endpoints.
+
+Every category has a version counter stored in the catalog cache, and
+every cached response key embeds the current version of its category.
+Writes to products, inventory and reviews bump the counter (see
+`src.products.signals`), so stale entries simply stop being addressed
+and expire on their own - nothing ever has to scan or delete keys.
+The counter and the time of the last bump also drive the ETag and
+Last-Modified validators of the catalog views.
+
+The catalog cache is Redis (`REDIS_CACHE_URL`), so bumps made by any
+web process or Celery worker reach every other one; only the test
+runner uses an in-process `LocMemCache`, see `settings.CACHES`.
+"""
+
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+
+from src.products.constants import CatalogCacheDefaults
+
+
+def get_catalog_cache():
+    return caches[CatalogCacheDefaults.ALIAS]
+
+
+def _get_version_key(scope):
+    return f'{CatalogCacheDefaults.KEY_PREFIX}:version:{scope}'
+
+
+def _get_modified_key(scope):
+    return f'{CatalogCacheDefaults.KEY_PREFIX}:modified:{scope}'
+
+
+def _new_version():
+    # Seeding from the clock rather than 1 means an evicted counter never
+    # comes back with a value that older entries were stored under
+    return time.time_ns()
+
+
+def get_catalog_version(category):
+    """
+    Return the current version of a category, or of the whole catalog
+    when no category is given.
+    """
+    scope = category or CatalogCacheDefaults.ALL_CATEGORIES
+
+    return get_catalog_cache().get_or_set(
+        _get_version_key(scope),
+        _new_version,
+        timeout=None,
+    )
+
+
+def get_catalog_last_modified(category):
+    """
+    Return when a category (or the whole catalog when no category is
+    given) last changed, as a Unix timestamp in seconds.
+
+    Before the first recorded change this is the time of the first
+    request, which is as precise as HTTP dates get.
+    """
+    scope = category or CatalogCacheDefaults.ALL_CATEGORIES
+
+    return get_catalog_cache().get_or_set(
+        _get_modified_key(scope),
+        lambda: int(time.time()),
+        timeout=None,
+    )
+
+
+def bump_catalog_version(category):
+    """
+    Invalidate every cached response of a category, along with the
+    responses that span all categories. Without a category, only the
+    latter are invalidated.
+    """
+    scopes = (category,) if category else ()
+
+    _bump_scopes(*scopes, CatalogCacheDefaults.ALL_CATEGORIES)
+
+
+def bump_related_products_version():
+    """
+    Invalidate the validators of every response that embeds precomputed
+    related products (see `RelatedProduct`).
+    """
+    _bump_scopes(CatalogCacheDefaults.RELATED_PRODUCTS)
+
+
+def _bump_scopes(*scopes):
+    cache = get_catalog_cache()
+    now = int(time.time())
+
+    for scope in scopes:
+        key = _get_version_key(scope)
+
+        try:
+            cache.incr(key)
+
+        except ValueError:
+            # Counter not set yet (or evicted)
+            cache.set(key, _new_version(), timeout=None)
+
+        cache.set(_get_modified_key(scope), now, timeout=None)
+
+
+def build_catalog_cache_key(namespace, category, params):
+    """
+    Build the cache key of a catalog response.
+
+    `params` maps query parameter names to lists of values and must
+    already be normalized (see `FilterMixin._get_normalized_params`), so
+    equivalent requests share a key regardless of parameter order.
+    """
+    version = get_catalog_version(category)
+
+    query = urlencode(
+        sorted(
+            (key, value) for key, values in params.items() for value in values
+        )
+    )
+    digest = hashlib.md5(query.encode()).hexdigest()
+
+    scope = category or CatalogCacheDefaults.ALL_CATEGORIES
+
+    return (
+        f'{CatalogCacheDefaults.KEY_PREFIX}:{namespace}:{scope}:'
+        f'{version}:{digest}'
+    )
@@ -20,3 +20,42 @@ class ReviewErrorMessages:
 
 class NameFieldLengths:
     NAME_MAX_LENGTH = 30
+
+
+class ProductListingFieldLengths:
+    CATEGORY_MAX_LENGTH = 30
+
+    RATING_MAX_DIGITS = 3
+
+    RATING_DECIMAL_PLACES = 2
+
+
+class CatalogCacheDefaults:
+    # Alias of the cache configured in `settings.CACHES`
+    ALIAS = 'catalog'
+
+    KEY_PREFIX = 'catalog'
+
+    # Version scope covering every category, used by requests that are
+    # not limited to a single category
+    ALL_CATEGORIES = 'all'
+
+    # Version scope of the precomputed related products, which span
+    # categories and are refreshed outside the product's own writes
+    RELATED_PRODUCTS = 'related-products'
+
+    # Entries are invalidated by version bumps; the timeout only bounds
+    # how long unreachable entries linger
+    TIMEOUT = 60 * 60
+
+
+class RelatedProductFieldLengths:
+    RELATION_MAX_LENGTH = 10
+
+
+class RelatedProductDefaults:
+    # Products shown per product for the colour or gender rule
+    RELATED_LIMIT = 5
+
+    # Products of the same type shown from the product's collection
+    COLLECTION_LIMIT = 10
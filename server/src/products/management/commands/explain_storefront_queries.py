@@ -0,0 +1,306 @@
+# python manage.py explain_storefront_queries --products 5000
+import json
+import random
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max, Min, Q
+
+from src.products.models import (
+    Inventory,
+    ProductListing,
+    Review,
+    Size,
+)
+from src.products.models.product import (
+    Bracelet,
+    Collection,
+    Color,
+    Earring,
+    Metal,
+    Necklace,
+    Pendant,
+    Ring,
+    Stone,
+    Watch,
+)
+from src.wishlists.models import Wishlist
+
+UserModel = get_user_model()
+
+PRODUCT_MODELS = (Earring, Necklace, Pendant, Ring, Bracelet, Watch)
+
+
+class Command(BaseCommand):
+    help = (
+        'Run EXPLAIN ANALYZE on the main storefront queries against a '
+        'generated dataset and report which indexes they use. The '
+        'dataset is created inside a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--products',
+            type=int,
+            default=2000,
+            help='Products to generate per category (default: 2000)',
+        )
+        parser.add_argument(
+            '--reviews',
+            type=int,
+            default=5,
+            help='Reviews to generate per product (default: 5)',
+        )
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            default=3,
+            help='Inventory rows (sizes) per product (default: 3)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('EXPLAIN ANALYZE reports require PostgreSQL.')
+
+        with transaction.atomic():
+            self.stdout.write('Generating dataset...')
+            sample = self._generate_dataset(
+                options['products'],
+                options['reviews'],
+                options['sizes'],
+            )
+
+            # Fresh statistics, so the planner sees the generated volume
+            with connection.cursor() as cursor:
+                for model in (
+                    Inventory,
+                    ProductListing,
+                    Review,
+                    Wishlist,
+                ):
+                    cursor.execute(f'ANALYZE {model._meta.db_table}')
+
+            for name, queryset in self._get_queries(sample).items():
+                self._report(name, queryset)
+
+            # Leave the database exactly as it was
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Generated data rolled back.'))
+
+    def _get_queries(self, sample):
+        content_type, object_id = sample
+        product = Q(content_type=content_type, object_id=object_id)
+
+        listing_by_rating = ProductListing.objects.get_product_list(
+            content_type.model,
+            Q(),
+            'rating',
+        )
+        listing_in_stock_by_price = ProductListing.objects.get_product_list(
+            content_type.model,
+            Q(is_sold_out=False),
+            'price_asc',
+        )
+        in_stock_price_range = (
+            Inventory.objects.filter(product, quantity__gt=0)
+            .values('object_id')
+            .annotate(min_price=Min('price'), max_price=Max('price'))
+        )
+        latest_approved_reviews = Review.objects.filter(
+            product,
+            approved=True,
+        ).order_by('-created_at')
+        pending_reviews = Review.objects.filter(
+            approved=False,
+        ).order_by('-created_at')
+
+        return {
+            'Listing page, rating order': listing_by_rating[:8],
+            'Listing page, in stock, price order': (
+                listing_in_stock_by_price[:8]
+            ),
+            'Product inventory with sizes': (
+                Inventory.objects.filter(product).select_related('size')
+            ),
+            'In-stock price range': in_stock_price_range,
+            'Latest approved reviews': latest_approved_reviews[:4],
+            'Pending reviews': pending_reviews[:20],
+            'Wishlist entries of a product': Wishlist.objects.filter(product),
+        }
+
+    def _report(self, name, queryset):
+        plan = json.loads(queryset.explain(format='json', analyze=True))[0]
+        indexes, seq_scans = self._collect_scans(plan['Plan'])
+
+        self.stdout.write(f'\n{name}: {plan["Execution Time"]:.2f} ms')
+
+        for index in sorted(indexes):
+            self.stdout.write(self.style.SUCCESS(f'  index: {index}'))
+
+        for table in sorted(seq_scans):
+            self.stdout.write(self.style.WARNING(f'  seq scan: {table}'))
+
+    def _collect_scans(self, node):
+        indexes = set()
+        seq_scans = set()
+
+        if 'Index Name' in node:
+            indexes.add(node['Index Name'])
+
+        if node['Node Type'] == 'Seq Scan':
+            seq_scans.add(node['Relation Name'])
+
+        for child in node.get('Plans', []):
+            child_indexes, child_seq_scans = self._collect_scans(child)
+            indexes |= child_indexes
+            seq_scans |= child_seq_scans
+
+        return indexes, seq_scans
+
+    def _generate_dataset(self, products_per_category, reviews, sizes):
+        """
+        Bulk create products with inventory, reviews, wishlist entries and
+        listing rows. Signals are bypassed, which keeps generation fast.
+        Returns the (content type, id) of a product to explain with.
+        """
+        rng = random.Random(42)
+        run_id = uuid.uuid4().hex[:6]
+
+        def create_named(model, count):
+            return model.objects.bulk_create(
+                [
+                    model(name=f'Explain {run_id} {index}')
+                    for index in range(count)
+                ]
+            )
+
+        collections = create_named(Collection, 5)
+        colors = create_named(Color, 5)
+        metals = create_named(Metal, 5)
+        stones = create_named(Stone, 5)
+        size_rows = create_named(Size, sizes)
+
+        users = UserModel.objects.bulk_create(
+            [
+                UserModel(
+                    email=f'explain-{run_id}-{index}@example.com',
+                    username=f'explain_{run_id}_{index}',
+                )
+                for index in range(max(reviews, 1))
+            ]
+        )
+
+        sample = None
+
+        for model_class in PRODUCT_MODELS:
+            content_type = ContentType.objects.get_for_model(model_class)
+            prefix = (
+                f'https://explain.example.com/{run_id}/{content_type.model}'
+            )
+
+            products = model_class.objects.bulk_create(
+                [
+                    model_class(
+                        first_image=f'{prefix}/{index}/1.jpg',
+                        second_image=f'{prefix}/{index}/2.jpg',
+                        third_image=f'{prefix}/{index}/3.jpg',
+                        fourth_image=f'{prefix}/{index}/4.jpg',
+                        collection=rng.choice(collections),
+                        color=rng.choice(colors),
+                        metal=rng.choice(metals),
+                        stone=rng.choice(stones),
+                    )
+                    for index in range(products_per_category)
+                ]
+            )
+
+            inventory = []
+            review_rows = []
+            wishlist = []
+            listings = []
+
+            for product in products:
+                product_sizes = [
+                    Inventory(
+                        quantity=rng.choice((0, 1, 3, 5)),
+                        price=rng.randint(100, 5000),
+                        size=size,
+                        content_type=content_type,
+                        object_id=product.pk,
+                    )
+                    for size in size_rows
+                ]
+                inventory.extend(product_sizes)
+
+                review_rows.extend(
+                    Review(
+                        rating=rng.randint(1, 5),
+                        comment='Generated review',
+                        approved=rng.random() < 0.8,
+                        content_type=content_type,
+                        object_id=product.pk,
+                        user=user,
+                    )
+                    for user in users[:reviews]
+                )
+
+                wishlist.append(
+                    Wishlist(
+                        user=rng.choice(users),
+                        content_type=content_type,
+                        object_id=product.pk,
+                    )
+                )
+
+                prices = [item.price for item in product_sizes]
+                in_stock = [item for item in product_sizes if item.quantity]
+
+                listings.append(
+                    ProductListing(
+                        category=content_type.model,
+                        content_type=content_type,
+                        object_id=product.pk,
+                        collection=product.collection,
+                        collection_name=product.collection.name,
+                        color=product.color,
+                        color_name=product.color.name,
+                        metal=product.metal,
+                        metal_name=product.metal.name,
+                        stone=product.stone,
+                        stone_name=product.stone.name,
+                        first_image=product.first_image,
+                        second_image=product.second_image,
+                        third_image=product.third_image,
+                        fourth_image=product.fourth_image,
+                        min_price=min(prices, default=None),
+                        max_price=max(prices, default=None),
+                        average_rating=rng.randint(100, 500) / 100,
+                        total_quantity=sum(
+                            item.quantity for item in product_sizes
+                        ),
+                        in_stock_size_count=len(in_stock),
+                        is_sold_out=not in_stock,
+                        created_at=product.created_at,
+                    )
+                )
+
+            Inventory.objects.bulk_create(inventory)
+            Review.objects.bulk_create(review_rows)
+            Wishlist.objects.bulk_create(wishlist)
+            ProductListing.objects.bulk_create(listings)
+
+            if sample is None and products:
+                sample = (content_type, products[len(products) // 2].pk)
+
+            self.stdout.write(
+                f'  {len(products)} {content_type.model} products'
+            )
+
+        if sample is None:
+            raise CommandError('--products must be at least 1.')
+
+        return sample
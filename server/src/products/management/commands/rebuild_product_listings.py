@@ -0,0 +1,27 @@
+# python manage.py rebuild_product_listings
+from django.core.management.base import BaseCommand
+
+from src.products.models.listing import ProductListing
+from src.products.models.product import (
+    Bracelet,
+    Earring,
+    Necklace,
+    Pendant,
+    Ring,
+    Watch,
+)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized product listing read model'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding product listings...')
+
+        synced = ProductListing.objects.rebuild(
+            (Earring, Necklace, Pendant, Ring, Bracelet, Watch)
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt {synced} product listings.')
+        )
@@ -0,0 +1,19 @@
+# python manage.py rebuild_related_products
+from django.core.management.base import BaseCommand
+
+from src.products.models.related import RelatedProduct
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the precomputed related products of the detail pages'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding related products...')
+
+        refreshed = RelatedProduct.objects.rebuild()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Rebuilt related products for {refreshed} products.'
+            )
+        )
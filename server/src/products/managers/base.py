@@ -1,5 +1,6 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
-from django.db.models import Min, Max, Avg, Count
+from django.db.models import Count, Max, Min, Prefetch, Q
 
 
 class BaseProductManager(models.Manager):
@@ -14,87 +15,87 @@ class BaseProductManager(models.Manager):
     and provides consistent query patterns across all product categories.
     """
 
-    def get_product_item(self, item_id):
+    # Number of reviews shown on the product detail page
+    latest_reviews_count = 4
+
+    def get_product_item(self, item_id, include_unapproved_reviews=False):
         """
         Retrieve a single product by its ID.
 
-        This method provides a simple way to get a specific product
-        by its primary key. It's used when displaying individual
-        product details.
+        This method loads everything the product detail page displays in
+        a fixed number of queries: the attribute foreign keys are joined,
+        the inventory rows are prefetched with their sizes joined, and only the
+        latest reviews are loaded (into `latest_reviews`) together with
+        their authors' profile and photo. Reviewers also see unapproved
+        reviews.
         """
-        return self.get(pk=item_id)
+        # Imported here to avoid a circular import with the models package
+        from src.products.models.inventory import Inventory
+        from src.products.models.review import Review
+
+        product = (
+            self.select_related(
+                'collection',
+                'color',
+                'metal',
+                'stone',
+            )
+            .prefetch_related(
+                # Sizes are joined into the inventory query
+                Prefetch(
+                    'inventory',
+                    queryset=Inventory.objects.select_related('size'),
+                ),
+            )
+            .get(pk=item_id)
+        )
 
-    def get_product_list(self, filters, ordering):
-        """
-        Retrieve a filtered and ordered list of products.
+        # Generic relations cannot prefetch a sliced queryset, so the
+        # latest reviews are fetched with a LIMIT query of their own
+        reviews = Review.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model),
+            object_id=product.pk,
+        )
 
-        This method applies filters to the product queryset and then
-        calls the optimized _get_raw_products method to add annotations
-        and related data. It's used for product listing pages with
-        filtering and sorting capabilities.
-        """
-        # Apply filters to the base queryset
-        qs = self.filter(filters)
+        if not include_unapproved_reviews:
+            reviews = reviews.filter(approved=True)
 
-        # Get optimized product data with annotations
-        raw_products = self._get_raw_products(qs, ordering)
+        product.latest_reviews = list(
+            reviews.select_related(
+                'content_type',
+                'user__userprofile',
+                'user__userphoto',
+            ).order_by('-created_at')[: self.latest_reviews_count]
+        )
 
-        return raw_products
+        return product
 
-    def _get_raw_products(self, qs, ordering):
+    def get_product_cards(self, product_ids):
         """
-        This method takes a filtered queryset and adds optimized database
-        queries with select_related, prefetch_related, and annotations.
-        It calculates important product data like total quantity, price
-        ranges, stock status, and average ratings in a single query.
+        Load several products by id for product cards outside the listing
+        pages (e.g. the wishlist), keyed by id.
+
+        The attributes are joined and the price range and number of
+        in-stock sizes are aggregated over the inventory in the same
+        query, so any number of products costs a single query.
         """
-        # Map user-friendly ordering parameters to database fields
-        # This allows the frontend to use simple names while the database
-        # uses optimized field names for sorting
-        ordering_map = {
-            'price_asc': 'min_price',  # Sort by lowest price first
-            'price_desc': '-max_price',  # Sort by highest price first
-            'rating': '-average_rating',  # Sort by highest rating first
-        }
-
-        # Get the database field name for ordering
-        ordering_criteria = ordering_map[ordering]
-
-        # Return optimized queryset with all related data
         return (
-            qs
-            # prefetch_related fetches many-to-many and reverse foreign key relationships
-            # This prevents N+1 queries when accessing inventory and review data
-            .prefetch_related('inventory', 'review')
-            # values() specifies which fields to include in the result
-            .values(
-                'id',
-                'collection__name',
-                'first_image',
-                'second_image',
-                'third_image',
-                'fourth_image',
-                'color__name',
-                'stone__name',
-                'metal__name',
+            self.select_related(
+                'collection',
+                'color',
+                'metal',
+                'stone',
             )
-            # Annotations add calculated fields to each product
             .annotate(
-                # Find the lowest price for this product
                 min_price=Min('inventory__price'),
-                # Find the highest price for this product
                 max_price=Max('inventory__price'),
-                # Calculate average rating from approved reviews
-                average_rating=Avg('review__rating', distinct=True),
-            )
-            # Order by the specified criteria, with ID as secondary sort
-            .order_by(
-                f'{ordering_criteria}',
-                'id',
+                in_stock_size_count=Count(
+                    'inventory',
+                    filter=Q(inventory__quantity__gt=0),
+                ),
             )
+            .in_bulk(product_ids)
         )
-        
-        
 
 
 class BaseAttributesManager(models.Manager):
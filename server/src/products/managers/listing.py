@@ -0,0 +1,238 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Count, F, Max, Min, Q, Sum, Value
+
+
+class ProductListingManager(models.Manager):
+    """
+    Manager for the ProductListing read model.
+
+    Besides serving listing pages, this manager owns the logic that keeps
+    the read model in sync with the product, Inventory and Review tables.
+    A listing row is always recomputed from scratch for a single product,
+    which keeps the write path simple and makes every sync idempotent.
+    """
+
+    # Map user-friendly ordering parameters to indexed listing columns
+    ordering_map = {
+        'price_asc': 'min_price',  # Sort by lowest price first
+        'price_desc': '-max_price',  # Sort by highest price first
+        'rating': '-average_rating',  # Sort by highest rating first
+    }
+
+    def get_product_list(self, category, filters, ordering):
+        """
+        Retrieve a filtered and ordered list of listing rows for a category.
+
+        The filters are the same Q objects FilterMixin builds for the
+        product models, since the listing keeps the attribute foreign key
+        names. Products are ordered by the requested criteria with the
+        product id as a secondary sort.
+
+        Products without a price sort last in ascending and first in
+        descending order. The placement is stated rather than left to the
+        database, since keyset pagination (`ProductCursorPagination`)
+        steps over NULLs the same way.
+        """
+        ordering_criteria = self.ordering_map[ordering]
+
+        if ordering_criteria.startswith('-'):
+            sort = F(ordering_criteria[1:]).desc(nulls_first=True)
+        else:
+            sort = F(ordering_criteria).asc(nulls_last=True)
+
+        return self.filter(
+            filters,
+            category=category,
+        ).order_by(
+            sort,
+            'object_id',
+        )
+
+    # Facet dimension -> (attribute id column, attribute name column)
+    facet_fields = {
+        'collections': ('collection_id', 'collection_name'),
+        'colors': ('color_id', 'color_name'),
+        'metals': ('metal_id', 'metal_name'),
+        'stones': ('stone_id', 'stone_name'),
+    }
+
+    def get_facet_counts(self, category, facet_filters):
+        """
+        Count products per attribute for every facet dimension at once.
+
+        `facet_filters` maps each dimension to the filters that apply to
+        it. Callers leave a dimension's own selection out of its filters
+        (disjunctive faceting), so selecting a color still shows how many
+        products every other color has. The per-dimension GROUP BY
+        queries are combined with UNION ALL and run as a single query.
+        """
+        facet_queries = []
+
+        for dimension, (id_field, name_field) in self.facet_fields.items():
+            facet_queries.append(
+                self.filter(
+                    facet_filters.get(dimension, Q()),
+                    category=category,
+                )
+                .annotate(
+                    facet=Value(dimension),
+                    attribute_id=F(id_field),
+                    attribute_name=F(name_field),
+                )
+                .values('facet', 'attribute_id', 'attribute_name')
+                .annotate(count=Count('id'))
+                .order_by()
+            )
+
+        first_query, *other_queries = facet_queries
+        rows = first_query.union(*other_queries, all=True)
+
+        facets = {dimension: [] for dimension in self.facet_fields}
+
+        for row in sorted(rows, key=lambda row: row['attribute_id']):
+            facets[row['facet']].append(
+                {
+                    'id': row['attribute_id'],
+                    'name': row['attribute_name'],
+                    'count': row['count'],
+                }
+            )
+
+        return facets
+
+    def sync_product(self, product):
+        """
+        Recompute and store the listing row for a single product.
+        """
+        # Imported here to avoid a circular import with the models package
+        from src.products.models.inventory import Inventory
+
+        content_type = ContentType.objects.get_for_model(product)
+
+        inventory = Inventory.objects.filter(
+            content_type=content_type,
+            object_id=product.pk,
+        ).aggregate(
+            min_price=Min('price'),
+            max_price=Max('price'),
+            total_quantity=Sum('quantity'),
+            in_stock_size_count=Count('id', filter=Q(quantity__gt=0)),
+        )
+
+        listing, _ = self.update_or_create(
+            content_type=content_type,
+            object_id=product.pk,
+            defaults={
+                'category': content_type.model,
+                'collection_id': product.collection_id,
+                'collection_name': product.collection.name,
+                'color_id': product.color_id,
+                'color_name': product.color.name,
+                'metal_id': product.metal_id,
+                'metal_name': product.metal.name,
+                'stone_id': product.stone_id,
+                'stone_name': product.stone.name,
+                'first_image': product.first_image,
+                'second_image': product.second_image,
+                'third_image': product.third_image,
+                'fourth_image': product.fourth_image,
+                'target_gender': product.target_gender,
+                'min_price': inventory['min_price'],
+                'max_price': inventory['max_price'],
+                # Stored approved-review totals, see `Review`
+                'average_rating': product.average_rating,
+                'total_quantity': inventory['total_quantity'] or 0,
+                'in_stock_size_count': inventory['in_stock_size_count'],
+                'is_sold_out': inventory['in_stock_size_count'] == 0,
+                'created_at': product.created_at,
+            },
+        )
+
+        return listing
+
+    def sync_for(self, content_type, object_id):
+        """
+        Recompute the listing row for the product identified by a generic
+        relation pair (as stored on Inventory and Review). If the product
+        no longer exists, its listing row is removed.
+        """
+        model_class = content_type.model_class()
+
+        product = (
+            model_class.objects.select_related(
+                'collection',
+                'color',
+                'metal',
+                'stone',
+            )
+            .filter(pk=object_id)
+            .first()
+        )
+
+        if product is None:
+            self.remove_product(content_type, object_id)
+
+            return None
+
+        return self.sync_product(product)
+
+    def sync_attribute_name(self, attribute):
+        """
+        Copy the current name of a collection, color, metal or stone into
+        the listing rows that use it. Returns the categories whose rows
+        changed.
+        """
+        field_name = attribute._meta.model_name
+
+        listings = self.filter(
+            **{f'{field_name}_id': attribute.pk},
+        ).exclude(
+            **{f'{field_name}_name': attribute.name},
+        )
+
+        categories = set(
+            listings.order_by().values_list('category', flat=True).distinct()
+        )
+
+        if categories:
+            listings.update(**{f'{field_name}_name': attribute.name})
+
+        return categories
+
+    def remove_product(self, content_type, object_id):
+        self.filter(
+            content_type=content_type,
+            object_id=object_id,
+        ).delete()
+
+    def rebuild(self, product_models):
+        """
+        Rebuild the listing rows for every product of the given models and
+        drop rows whose product no longer exists.
+        """
+        synced = 0
+
+        for model_class in product_models:
+            content_type = ContentType.objects.get_for_model(model_class)
+            products = model_class.objects.select_related(
+                'collection',
+                'color',
+                'metal',
+                'stone',
+            )
+
+            product_ids = []
+
+            for product in products.iterator():
+                self.sync_product(product)
+                product_ids.append(product.pk)
+                synced += 1
+
+            self.filter(
+                content_type=content_type,
+            ).exclude(
+                object_id__in=product_ids,
+            ).delete()
+
+        return synced
@@ -0,0 +1,221 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Q
+
+from src.products.constants import RelatedProductDefaults
+
+
+class RelatedProductManager(models.Manager):
+    """
+    Manager for the precomputed related products of the detail pages.
+
+    The rules are the ones the detail page used to evaluate on every
+    request: products of the same type from the same collection, and
+    either the men's products of every type (for men's products) or the
+    products of the other types sharing the product's colour.
+    """
+
+    # Product types in the order related products are picked from
+    product_model_names = (
+        'earring',
+        'necklace',
+        'pendant',
+        'ring',
+        'bracelet',
+        'watch',
+    )
+
+    def _get_product_models(self):
+        return [
+            apps.get_model('products', model_name)
+            for model_name in self.product_model_names
+        ]
+
+    def get_for_product(self, product):
+        """
+        Return the related products of a product grouped by relation.
+
+        Only reads the precomputed rows; a product without rows has no
+        related products.
+        """
+        content_type = ContentType.objects.get_for_model(product)
+        rows = self.filter(
+            content_type=content_type,
+            object_id=product.pk,
+        )
+
+        related = {choice: [] for choice in self.model.RelationChoices}
+
+        for row in rows:
+            related[row.relation].append(row)
+
+        return related
+
+    def _pick(self, model_classes, filters, limit):
+        """
+        Collect up to `limit` (model, id, first_image) tuples, taking the
+        models in order and the products of each model by id.
+        """
+        picked = []
+
+        for model_class in model_classes:
+            remaining = limit - len(picked)
+
+            if remaining <= 0:
+                break
+
+            products = (
+                model_class.objects.filter(filters)
+                .order_by('id')
+                .values_list('id', 'first_image')[:remaining]
+            )
+            picked.extend(
+                (model_class, product_id, first_image)
+                for product_id, first_image in products
+            )
+
+        return picked
+
+    def _compute(self, product):
+        model_class = type(product)
+        relations = {
+            self.model.RelationChoices.COLLECTION: self._pick(
+                [model_class],
+                Q(collection_id=product.collection_id),
+                RelatedProductDefaults.COLLECTION_LIMIT,
+            ),
+        }
+
+        if product.target_gender == 'M':
+            relations[self.model.RelationChoices.GENDER] = self._pick(
+                self._get_product_models(),
+                Q(target_gender='M'),
+                RelatedProductDefaults.RELATED_LIMIT,
+            )
+        else:
+            relations[self.model.RelationChoices.COLOR] = self._pick(
+                [
+                    other_model
+                    for other_model in self._get_product_models()
+                    if other_model is not model_class
+                ],
+                Q(color_id=product.color_id),
+                RelatedProductDefaults.RELATED_LIMIT,
+            )
+
+        return relations
+
+    def refresh_product(self, product):
+        """
+        Recompute and replace the related rows of a single product.
+        """
+        content_type = ContentType.objects.get_for_model(product)
+        rows = [
+            self.model(
+                content_type=content_type,
+                object_id=product.pk,
+                relation=relation,
+                position=position,
+                related_content_type=ContentType.objects.get_for_model(
+                    related_model
+                ),
+                related_object_id=related_id,
+                first_image=first_image,
+            )
+            for relation, picked in self._compute(product).items()
+            for position, (related_model, related_id, first_image) in (
+                enumerate(picked)
+            )
+        ]
+
+        with transaction.atomic():
+            self.remove_product(content_type, product.pk)
+            self.bulk_create(rows)
+
+        return rows
+
+    def refresh_affected_by(self, product):
+        """
+        Refresh the products whose related lists may include the given
+        product: its own type's collection, every product sharing its
+        colour and, for men's products, every men's product.
+        """
+        model_class = type(product)
+        content_type = ContentType.objects.get_for_model(product)
+        refreshed = 0
+
+        # Products currently listing it, in case its colour, collection
+        # or target gender changed
+        referencing = self.filter(
+            related_content_type=content_type,
+            related_object_id=product.pk,
+        ).values_list('content_type_id', 'object_id')
+
+        for referencing_type_id, referencing_id in set(referencing):
+            other_model = ContentType.objects.get_for_id(
+                referencing_type_id
+            ).model_class()
+            other = other_model.objects.filter(pk=referencing_id).first()
+
+            if other is not None:
+                self.refresh_product(other)
+                refreshed += 1
+
+        for other_model in self._get_product_models():
+            filters = Q(color_id=product.color_id)
+
+            if other_model is model_class:
+                filters |= Q(collection_id=product.collection_id)
+
+            if product.target_gender == 'M':
+                filters |= Q(target_gender='M')
+
+            for other in other_model.objects.filter(filters).iterator():
+                self.refresh_product(other)
+                refreshed += 1
+
+        return refreshed
+
+    def remove_product(self, content_type, object_id):
+        """
+        Drop the related rows of a product.
+        """
+        self.filter(
+            content_type=content_type,
+            object_id=object_id,
+        ).delete()
+
+    def remove_related(self, content_type, object_id):
+        """
+        Drop a product from the related lists of other products. The gap
+        is filled on the next refresh of those products.
+        """
+        self.filter(
+            related_content_type=content_type,
+            related_object_id=object_id,
+        ).delete()
+
+    def rebuild(self):
+        """
+        Recompute the related rows of every product and drop the rows of
+        products that no longer exist.
+        """
+        refreshed = 0
+
+        for model_class in self._get_product_models():
+            content_type = ContentType.objects.get_for_model(model_class)
+            product_ids = []
+
+            for product in model_class.objects.iterator():
+                self.refresh_product(product)
+                product_ids.append(product.pk)
+                refreshed += 1
+
+            self.filter(
+                content_type=content_type,
+            ).exclude(
+                object_id__in=product_ids,
+            ).delete()
+
+        return refreshed
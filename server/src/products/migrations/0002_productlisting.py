@@ -0,0 +1,210 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Avg, Count, Max, Min, Q
+
+PRODUCT_MODELS = (
+    'bracelet',
+    'earring',
+    'necklace',
+    'pendant',
+    'ring',
+    'watch',
+)
+
+
+def build_product_listings(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Inventory = apps.get_model('products', 'Inventory')
+    ProductListing = apps.get_model('products', 'ProductListing')
+    Review = apps.get_model('products', 'Review')
+
+    for model_name in PRODUCT_MODELS:
+        model_class = apps.get_model('products', model_name)
+
+        if not model_class.objects.exists():
+            continue
+
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label='products',
+            model=model_name,
+        )
+
+        inventory = {
+            row['object_id']: row
+            for row in Inventory.objects.filter(content_type=content_type)
+            .values('object_id')
+            .annotate(
+                min_price=Min('price'),
+                max_price=Max('price'),
+                in_stock_size_count=Count('id', filter=Q(quantity__gt=0)),
+            )
+        }
+        ratings = dict(
+            Review.objects.filter(content_type=content_type, approved=True)
+            .values('object_id')
+            .annotate(average_rating=Avg('rating'))
+            .values_list('object_id', 'average_rating')
+        )
+
+        products = model_class.objects.select_related(
+            'collection',
+            'color',
+            'metal',
+            'stone',
+        )
+
+        listings = []
+
+        for product in products.iterator():
+            stock = inventory.get(product.pk, {})
+
+            listings.append(
+                ProductListing(
+                    content_type=content_type,
+                    object_id=product.pk,
+                    category=model_name,
+                    collection_id=product.collection_id,
+                    collection_name=product.collection.name,
+                    color_id=product.color_id,
+                    color_name=product.color.name,
+                    metal_id=product.metal_id,
+                    metal_name=product.metal.name,
+                    stone_id=product.stone_id,
+                    stone_name=product.stone.name,
+                    first_image=product.first_image,
+                    second_image=product.second_image,
+                    third_image=product.third_image,
+                    fourth_image=product.fourth_image,
+                    target_gender=product.target_gender,
+                    min_price=stock.get('min_price'),
+                    max_price=stock.get('max_price'),
+                    average_rating=round(ratings.get(product.pk) or 0, 2),
+                    is_sold_out=not stock.get('in_stock_size_count'),
+                    created_at=product.created_at,
+                )
+            )
+
+        ProductListing.objects.bulk_create(listings, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductListing',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('category', models.CharField(max_length=30)),
+                ('object_id', models.PositiveIntegerField()),
+                ('collection_name', models.CharField(max_length=30)),
+                ('color_name', models.CharField(max_length=30)),
+                ('metal_name', models.CharField(max_length=30)),
+                ('stone_name', models.CharField(max_length=30)),
+                ('first_image', models.URLField()),
+                ('second_image', models.URLField()),
+                ('third_image', models.URLField()),
+                ('fourth_image', models.URLField()),
+                (
+                    'target_gender',
+                    models.CharField(blank=True, max_length=1, null=True),
+                ),
+                (
+                    'min_price',
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=7, null=True
+                    ),
+                ),
+                (
+                    'max_price',
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=7, null=True
+                    ),
+                ),
+                (
+                    'average_rating',
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=3
+                    ),
+                ),
+                ('is_sold_out', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                (
+                    'collection',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='products.collection',
+                    ),
+                ),
+                (
+                    'color',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='products.color',
+                    ),
+                ),
+                (
+                    'content_type',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='contenttypes.contenttype',
+                    ),
+                ),
+                (
+                    'metal',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='products.metal',
+                    ),
+                ),
+                (
+                    'stone',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='products.stone',
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [
+                    models.Index(
+                        fields=['category', 'min_price', 'object_id'],
+                        name='listing_price_asc_idx',
+                    ),
+                    models.Index(
+                        fields=['category', '-max_price', 'object_id'],
+                        name='listing_price_desc_idx',
+                    ),
+                    models.Index(
+                        fields=['category', '-average_rating', 'object_id'],
+                        name='listing_rating_idx',
+                    ),
+                ],
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(
+            build_product_listings,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:59
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+PRODUCT_MODELS = (
+    'bracelet',
+    'earring',
+    'necklace',
+    'pendant',
+    'ring',
+    'watch',
+)
+
+
+def backfill_rating_totals(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Review = apps.get_model('products', 'Review')
+
+    for model_name in PRODUCT_MODELS:
+        model_class = apps.get_model('products', model_name)
+        content_type = ContentType.objects.filter(
+            app_label='products',
+            model=model_name,
+        ).first()
+
+        if content_type is None:
+            continue
+
+        totals = (
+            Review.objects.filter(content_type=content_type, approved=True)
+            .values('object_id')
+            .annotate(rating_sum=Sum('rating'), rating_count=Count('id'))
+        )
+
+        for row in totals:
+            model_class.objects.filter(pk=row['object_id']).update(
+                rating_sum=row['rating_sum'],
+                rating_count=row['rating_count'],
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_productlisting'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bracelet',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='bracelet',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='earring',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='earring',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='necklace',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='necklace',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pendant',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pendant',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='ring',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='ring',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='watch',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='watch',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            backfill_rating_totals,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:02
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_stock_rollup(apps, schema_editor):
+    Inventory = apps.get_model('products', 'Inventory')
+    ProductListing = apps.get_model('products', 'ProductListing')
+
+    rollups = Inventory.objects.values(
+        'content_type_id', 'object_id'
+    ).annotate(
+        total_quantity=Sum('quantity'),
+        in_stock_size_count=Count('id', filter=Q(quantity__gt=0)),
+    )
+
+    for row in rollups:
+        ProductListing.objects.filter(
+            content_type_id=row['content_type_id'],
+            object_id=row['object_id'],
+        ).update(
+            total_quantity=row['total_quantity'],
+            in_stock_size_count=row['in_stock_size_count'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_product_rating_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productlisting',
+            name='in_stock_size_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='productlisting',
+            name='total_quantity',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            backfill_stock_rollup,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,175 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Q
+
+# Product types in the order related products are picked from
+PRODUCT_MODELS = (
+    'earring',
+    'necklace',
+    'pendant',
+    'ring',
+    'bracelet',
+    'watch',
+)
+
+RELATED_LIMIT = 5
+COLLECTION_LIMIT = 10
+
+
+def build_related_products(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    RelatedProduct = apps.get_model('products', 'RelatedProduct')
+
+    product_models = {
+        model_name: apps.get_model('products', model_name)
+        for model_name in PRODUCT_MODELS
+    }
+    content_types = {
+        model_name: ContentType.objects.get_or_create(
+            app_label='products',
+            model=model_name,
+        )[0]
+        for model_name, model_class in product_models.items()
+        if model_class.objects.exists()
+    }
+
+    def pick(model_names, filters, limit):
+        picked = []
+
+        for model_name in model_names:
+            remaining = limit - len(picked)
+
+            if remaining <= 0:
+                break
+
+            products = (
+                product_models[model_name]
+                .objects.filter(filters)
+                .order_by('id')
+                .values_list('id', 'first_image')[:remaining]
+            )
+            picked.extend(
+                (model_name, product_id, first_image)
+                for product_id, first_image in products
+            )
+
+        return picked
+
+    rows = []
+
+    for model_name, content_type in content_types.items():
+        for product in product_models[model_name].objects.iterator():
+            relations = {
+                'collection': pick(
+                    [model_name],
+                    Q(collection_id=product.collection_id),
+                    COLLECTION_LIMIT,
+                ),
+            }
+
+            if product.target_gender == 'M':
+                relations['gender'] = pick(
+                    PRODUCT_MODELS,
+                    Q(target_gender='M'),
+                    RELATED_LIMIT,
+                )
+            else:
+                relations['color'] = pick(
+                    [name for name in PRODUCT_MODELS if name != model_name],
+                    Q(color_id=product.color_id),
+                    RELATED_LIMIT,
+                )
+
+            rows.extend(
+                RelatedProduct(
+                    content_type=content_type,
+                    object_id=product.pk,
+                    relation=relation,
+                    position=position,
+                    related_content_type=content_types[related_name],
+                    related_object_id=related_id,
+                    first_image=first_image,
+                )
+                for relation, picked in relations.items()
+                for position, (related_name, related_id, first_image) in (
+                    enumerate(picked)
+                )
+            )
+
+    RelatedProduct.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('products', '0004_listing_stock_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedProduct',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('object_id', models.PositiveIntegerField()),
+                (
+                    'relation',
+                    models.CharField(
+                        choices=[
+                            ('collection', 'Same collection'),
+                            ('color', 'Same color'),
+                            ('gender', 'Same target gender'),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ('position', models.PositiveSmallIntegerField()),
+                ('related_object_id', models.PositiveIntegerField()),
+                ('first_image', models.URLField()),
+                (
+                    'content_type',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='contenttypes.contenttype',
+                    ),
+                ),
+                (
+                    'related_content_type',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='+',
+                        to='contenttypes.contenttype',
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['relation', 'position'],
+                'indexes': [
+                    models.Index(
+                        fields=[
+                            'content_type',
+                            'object_id',
+                            'relation',
+                            'position',
+                        ],
+                        name='related_product_lookup_idx',
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            build_related_products,
+            migrations.RunPython.noop,
+        ),
+    ]
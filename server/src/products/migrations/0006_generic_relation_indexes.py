@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('products', '0005_relatedproduct'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(
+                fields=['content_type', 'object_id', 'price'],
+                name='inventory_product_price_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(
+                condition=models.Q(('quantity__gt', 0)),
+                fields=['content_type', 'object_id', 'price'],
+                name='inventory_in_stock_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                fields=['content_type', 'object_id', '-created_at'],
+                name='review_product_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                condition=models.Q(('approved', True)),
+                fields=['content_type', 'object_id', '-created_at'],
+                name='review_approved_product_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(
+                condition=models.Q(('approved', False)),
+                fields=['-created_at'],
+                name='review_pending_idx',
+            ),
+        ),
+    ]
@@ -1,6 +1,16 @@
+import hashlib
+
 from django.db import models
 from django.db.models import Q
-from src.products.constants import NameFieldLengths
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from src.products.cache import (
+    build_catalog_cache_key,
+    get_catalog_cache,
+    get_catalog_last_modified,
+    get_catalog_version,
+)
+from src.products.constants import CatalogCacheDefaults, NameFieldLengths
 
 
 class NameFieldMixin(models.Model):
@@ -59,6 +69,19 @@ class FilterMixin:
             'collections': self.request.query_params.getlist('collections'),
         }
 
+    def _get_normalized_params(self):
+        """
+        Return the filter parameters in a canonical form.
+
+        Duplicates are dropped and values are sorted, so the same selection
+        made in a different order (e.g. `colors=2&colors=1` and
+        `colors=1&colors=2`) produces the same cache key.
+        """
+        return {
+            key: sorted(set(values))
+            for key, values in self._get_params().items()
+        }
+
     def _build_filters(self, params, filter_map):
         """
         Build database filters based on provided parameters and filter mapping.
@@ -86,6 +109,50 @@ class FilterMixin:
 
         return self._build_filters(params, filter_map)
 
+    def _get_stock_filter(self):
+        """
+        Build the filter that hides sold out products.
+
+        Shoppers opt in with `?in_stock=1` (or `true`); the filter applies
+        to the listing read model, which stores the sold-out flag.
+        """
+        in_stock = self.request.query_params.get('in_stock', '')
+
+        if in_stock.lower() in ('1', 'true'):
+            return Q(is_sold_out=False)
+
+        return Q()
+
+    def _get_filters_for_facets(self):
+        """
+        Build per-dimension filters for disjunctive faceting.
+
+        Each facet dimension is filtered by every selected attribute except
+        its own, so the counts for one dimension show what the shopper
+        would get by changing that dimension's selection.
+        """
+        params = self._get_normalized_params()
+
+        filter_map = {
+            'colors': 'color_id__in',
+            'stones': 'stone_id__in',
+            'metals': 'metal_id__in',
+            'collections': 'collection_id__in',
+        }
+
+        facet_filters = {}
+
+        for dimension in filter_map:
+            other_params = {
+                key: value for key, value in params.items() if key != dimension
+            }
+            facet_filters[dimension] = (
+                self._build_filters(other_params, filter_map)
+                & self._get_stock_filter()
+            )
+
+        return facet_filters
+
     def _get_filters_for_product(self):
         """
         Build database filters for direct product filtering.
@@ -99,4 +166,111 @@ class FilterMixin:
             'collections': 'collection__id__in',
         }
 
-        return self._build_filters(params, filter_map)
+        filters = self._build_filters(params, filter_map)
+
+        return filters & self._get_stock_filter()
+
+
+class CatalogCacheMixin:
+    """
+    Mixin class that caches the response data of public catalog views
+    and answers conditional GET requests.
+
+    Responses are keyed by the view's namespace, the category, the
+    normalized attribute filters and the query parameters listed in
+    `cache_query_params`. The key also carries the category's catalog
+    version, so writes to the catalog invalidate cached responses
+    without touching the cache entries themselves.
+
+    The same key doubles as the response's ETag, and the category's last
+    change time as its Last-Modified date. Both come from the cache
+    alone, so `_get_not_modified_response` can answer 304 before any
+    database or serializer work.
+
+    Views using this mixin must also use FilterMixin, or override
+    `_get_cache_params`.
+    """
+
+    cache_namespace = None
+
+    # Non-filter query parameters that change the response
+    cache_query_params = ()
+
+    # Version scopes besides the category's that the response draws on;
+    # their versions and change times are part of the validators
+    cache_extra_scopes = ()
+
+    def _get_cache_params(self):
+        params = self._get_normalized_params()
+
+        for key in self.cache_query_params:
+            params[key] = self.request.query_params.getlist(key)
+
+        return params
+
+    def _get_cache_key(self, category):
+        return build_catalog_cache_key(
+            self.cache_namespace,
+            category,
+            self._get_cache_params(),
+        )
+
+    def _get_cached_data(self, category, build_data):
+        """
+        Return the cached response data for the current request, calling
+        `build_data` and caching its result on a miss.
+        """
+        cache = get_catalog_cache()
+        cache_key = self._get_cache_key(category)
+
+        data = cache.get(cache_key)
+
+        if data is None:
+            data = build_data()
+            cache.set(cache_key, data, CatalogCacheDefaults.TIMEOUT)
+
+        return data
+
+    def _get_not_modified_response(self, category, variant=''):
+        """
+        Return a 304 response when the client's copy is still current,
+        otherwise None. The validators are remembered and added to the
+        final response by `finalize_response`.
+
+        `variant` distinguishes responses that differ for the same URL,
+        e.g. by the user's permissions.
+        """
+        cache_key = self._get_cache_key(category)
+        extra_versions = ':'.join(
+            str(get_catalog_version(scope))
+            for scope in self.cache_extra_scopes
+        )
+        digest = hashlib.md5(
+            f'{cache_key}:{extra_versions}:{variant}'.encode()
+        ).hexdigest()
+
+        self._validators = {
+            'ETag': f'"{digest}"',
+            'Last-Modified': max(
+                get_catalog_last_modified(scope)
+                for scope in (category, *self.cache_extra_scopes)
+            ),
+        }
+
+        return get_conditional_response(
+            self.request._request,
+            etag=self._validators['ETag'],
+            last_modified=self._validators['Last-Modified'],
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        validators = getattr(self, '_validators', None)
+
+        if validators and response.status_code in (200, 304):
+            response['ETag'] = validators['ETag']
+            response['Last-Modified'] = http_date(validators['Last-Modified'])
+
+        return response
@@ -1,3 +1,5 @@
 from .product import *
 from .inventory import *
 from .review import *
+from .listing import *
+from .related import *
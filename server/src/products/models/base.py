@@ -69,5 +69,43 @@ class BaseProduct(models.Model):
         blank=True,
     )
 
+    # Running totals over approved reviews only, maintained by `Review`
+    # in the same transaction as the review write
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    rating_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    # Written only through `F()` updates; see `save`
+    RATING_TOTAL_FIELDS = ('rating_sum', 'rating_count')
+
+    def save(self, *args, **kwargs):
+        """
+        Save the product without its rating totals, unless they are named
+        in `update_fields`. The in-memory totals may predate concurrent
+        review writes, which would otherwise be overwritten.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.RATING_TOTAL_FIELDS
+            ]
+
+        super().save(*args, **kwargs)
+
+    @property
+    def average_rating(self):
+        if not self.rating_count:
+            return 0
+
+        return round(self.rating_sum / self.rating_count, 2)
+
     def __str__(self):
         return f'{self.collection} {self.__class__.__name__}'
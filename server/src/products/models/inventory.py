@@ -28,6 +28,21 @@ class Inventory(models.Model):
     class Meta:
         ordering = ['id']
 
+        indexes = [
+            # Every product's inventory is looked up by the generic pair;
+            # price is included for the listing price range aggregates
+            models.Index(
+                fields=['content_type', 'object_id', 'price'],
+                name='inventory_product_price_idx',
+            ),
+            # Sizes that can still be bought
+            models.Index(
+                fields=['content_type', 'object_id', 'price'],
+                condition=models.Q(quantity__gt=0),
+                name='inventory_in_stock_idx',
+            ),
+        ]
+
     quantity = models.PositiveIntegerField(
         default=InventoryDefaults.QUANTITY,
     )
@@ -0,0 +1,174 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from src.products.constants import (
+    InventoryFiledLengths,
+    NameFieldLengths,
+    ProductListingFieldLengths,
+)
+from src.products.managers.listing import ProductListingManager
+
+
+class ProductListing(models.Model):
+    """
+    Denormalized read model for product listing pages.
+
+    Every concrete product (Earring, Necklace, Pendant, Ring, Bracelet,
+    Watch) has exactly one row here. The row carries everything a listing
+    card needs - attribute ids and names, price range, approved rating
+    average, stock rollup and the image URLs - so the storefront can serve
+    a filtered, sorted page from this single table instead of grouping the
+    product tables against Inventory and Review on every request.
+
+    Rows are kept up to date by the signal handlers in
+    `src.products.signals` whenever a product, inventory or review is
+    written, and can be rebuilt with `manage.py rebuild_product_listings`.
+    """
+
+    class Meta:
+        ordering = ['id']
+
+        # One listing row per product
+        unique_together = (
+            'content_type',
+            'object_id',
+        )
+
+        # One index per `ordering_map` entry, each ending with the
+        # `object_id` tiebreaker used by the listing endpoint
+        indexes = [
+            models.Index(
+                fields=['category', 'min_price', 'object_id'],
+                name='listing_price_asc_idx',
+            ),
+            models.Index(
+                fields=['category', '-max_price', 'object_id'],
+                name='listing_price_desc_idx',
+            ),
+            models.Index(
+                fields=['category', '-average_rating', 'object_id'],
+                name='listing_rating_idx',
+            ),
+        ]
+
+    # Model name of the product type (e.g. 'earring', 'watch')
+    category = models.CharField(
+        max_length=ProductListingFieldLengths.CATEGORY_MAX_LENGTH,
+    )
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+    )
+
+    # Primary key of the product within its own table
+    object_id = models.PositiveIntegerField()
+
+    product = GenericForeignKey(
+        'content_type',
+        'object_id',
+    )
+
+    # The attribute foreign keys keep the same names as on the product
+    # models, so the filters built by FilterMixin apply unchanged
+    collection = models.ForeignKey(
+        to='products.Collection',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+
+    collection_name = models.CharField(
+        max_length=NameFieldLengths.NAME_MAX_LENGTH,
+    )
+
+    color = models.ForeignKey(
+        to='products.Color',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+
+    color_name = models.CharField(
+        max_length=NameFieldLengths.NAME_MAX_LENGTH,
+    )
+
+    metal = models.ForeignKey(
+        to='products.Metal',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+
+    metal_name = models.CharField(
+        max_length=NameFieldLengths.NAME_MAX_LENGTH,
+    )
+
+    stone = models.ForeignKey(
+        to='products.Stone',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+
+    stone_name = models.CharField(
+        max_length=NameFieldLengths.NAME_MAX_LENGTH,
+    )
+
+    first_image = models.URLField()
+
+    second_image = models.URLField()
+
+    third_image = models.URLField()
+
+    fourth_image = models.URLField()
+
+    target_gender = models.CharField(
+        max_length=1,
+        null=True,
+        blank=True,
+    )
+
+    # Price range across all inventory rows (sizes) of the product
+    min_price = models.DecimalField(
+        max_digits=InventoryFiledLengths.PRICE_MAX_DIGITS,
+        decimal_places=InventoryFiledLengths.PRICE_DECIMAL_PLACES,
+        null=True,
+        blank=True,
+    )
+
+    max_price = models.DecimalField(
+        max_digits=InventoryFiledLengths.PRICE_MAX_DIGITS,
+        decimal_places=InventoryFiledLengths.PRICE_DECIMAL_PLACES,
+        null=True,
+        blank=True,
+    )
+
+    # Average rating of approved reviews only
+    average_rating = models.DecimalField(
+        max_digits=ProductListingFieldLengths.RATING_MAX_DIGITS,
+        decimal_places=ProductListingFieldLengths.RATING_DECIMAL_PLACES,
+        default=0,
+    )
+
+    # Stock rollup across all inventory rows (sizes) of the product
+    total_quantity = models.PositiveIntegerField(
+        default=0,
+    )
+
+    in_stock_size_count = models.PositiveIntegerField(
+        default=0,
+    )
+
+    is_sold_out = models.BooleanField(
+        default=True,
+    )
+
+    # Creation time of the product itself, not of this row
+    created_at = models.DateTimeField()
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    objects = ProductListingManager()
+
+    def __str__(self):
+        return f'{self.collection_name} {self.category} #{self.object_id}'
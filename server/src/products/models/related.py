@@ -0,0 +1,77 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from src.products.constants import RelatedProductFieldLengths
+from src.products.managers.related import RelatedProductManager
+
+
+class RelatedProduct(models.Model):
+    """
+    Precomputed related products shown on a product's detail page.
+
+    Each product has a ranked list of rows per relation: the products of
+    the same type from its collection, and either the products sharing
+    its colour (other product types) or, for men's products, the other
+    men's products. Detail pages read the lists with a single indexed
+    lookup instead of scanning every product table.
+
+    Rows are refreshed on product saves (see `src.products.signals`) and
+    by the `refresh_related_products` Celery task.
+    """
+
+    class RelationChoices(models.TextChoices):
+        COLLECTION = 'collection', 'Same collection'
+        COLOR = 'color', 'Same color'
+        GENDER = 'gender', 'Same target gender'
+
+    class Meta:
+        ordering = ['relation', 'position']
+
+        indexes = [
+            models.Index(
+                fields=['content_type', 'object_id', 'relation', 'position'],
+                name='related_product_lookup_idx',
+            ),
+        ]
+
+    # The product whose detail page shows this row
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+
+    object_id = models.PositiveIntegerField()
+
+    product = GenericForeignKey(
+        'content_type',
+        'object_id',
+    )
+
+    relation = models.CharField(
+        max_length=RelatedProductFieldLengths.RELATION_MAX_LENGTH,
+        choices=RelationChoices.choices,
+    )
+
+    # Rank within the relation, starting from 0
+    position = models.PositiveSmallIntegerField()
+
+    # The related product, with the data the detail page needs from it
+    related_content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+
+    related_object_id = models.PositiveIntegerField()
+
+    first_image = models.URLField()
+
+    objects = RelatedProductManager()
+
+    def __str__(self):
+        return (
+            f'{self.content_type.model} #{self.object_id} -> '
+            f'{self.related_content_type.model} #{self.related_object_id}'
+        )
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -8,6 +9,17 @@ from src.products.constants import ReviewFieldLengths
 
 User = get_user_model()
 
+# Fields that determine a review's contribution to its product's rating
+RATING_CONTRIBUTION_FIELDS = (
+    'approved',
+    'content_type_id',
+    'object_id',
+    'rating',
+)
+
+# Contribution of a review loaded with some of those fields deferred
+UNKNOWN_CONTRIBUTION = object()
+
 
 class Review(models.Model):
     """
@@ -41,6 +53,27 @@ class Review(models.Model):
             'object_id',
         )
 
+        indexes = [
+            # All reviews of a product, newest first (reviewer views)
+            models.Index(
+                fields=['content_type', 'object_id', '-created_at'],
+                name='review_product_idx',
+            ),
+            # Approved reviews of a product, newest first (detail pages
+            # and rating totals)
+            models.Index(
+                fields=['content_type', 'object_id', '-created_at'],
+                condition=models.Q(approved=True),
+                name='review_approved_product_idx',
+            ),
+            # Moderation queue
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(approved=False),
+                name='review_pending_idx',
+            ),
+        ]
+
         # Custom permission for approving reviews
         # This allows admin to control who can approve reviews
         permissions = [
@@ -94,5 +127,111 @@ class Review(models.Model):
         on_delete=models.CASCADE,
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # What this review currently contributes to its product's stored
+        # rating aggregates; unsaved reviews contribute nothing
+        self._counted_rating = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+
+        if all(
+            field in instance.__dict__
+            for field in RATING_CONTRIBUTION_FIELDS
+        ):
+            instance._counted_rating = instance._get_rating_contribution()
+        else:
+            instance._counted_rating = UNKNOWN_CONTRIBUTION
+
+        return instance
+
+    def save(self, *args, **kwargs):
+        # The review row and the product's rating aggregates are written
+        # together (see `update_product_rating`, called on post_save)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def _get_rating_contribution(self):
+        """
+        Return the (content_type_id, object_id, rating) this review adds
+        to its product's approved rating, or None when it is not approved.
+        """
+        if not self.approved:
+            return None
+
+        return (self.content_type_id, self.object_id, self.rating)
+
+    def update_product_rating(self, deleted=False):
+        """
+        Move the product's `rating_sum`/`rating_count` from what this
+        review contributed when it was loaded to what it contributes now.
+
+        Creation, approval, unapproval, rating edits, moves to another
+        product and deletion are all handled as the difference between
+        the two contributions, applied with F() expressions so concurrent
+        review writes never overwrite each other's totals.
+        """
+        previous = self._counted_rating
+        current = None if deleted else self._get_rating_contribution()
+
+        if previous is UNKNOWN_CONTRIBUTION:
+            # Loaded with deferred fields, so the old contribution is not
+            # known; recount the product from its approved reviews instead
+            self.recalculate_product_rating(
+                self.content_type_id,
+                self.object_id,
+            )
+            self._counted_rating = current
+
+            return
+
+        if previous == current:
+            return
+
+        if previous is not None:
+            self._add_to_product_rating(previous, sign=-1)
+
+        if current is not None:
+            self._add_to_product_rating(current, sign=1)
+
+        self._counted_rating = current
+
+    @staticmethod
+    def _add_to_product_rating(contribution, sign):
+        content_type_id, object_id, rating = contribution
+        model_class = ContentType.objects.get_for_id(
+            content_type_id
+        ).model_class()
+
+        model_class.objects.filter(pk=object_id).update(
+            rating_sum=F('rating_sum') + sign * rating,
+            rating_count=F('rating_count') + sign,
+        )
+
+    @classmethod
+    def recalculate_product_rating(cls, content_type_id, object_id):
+        """
+        Recount a product's stored rating aggregates from scratch.
+        """
+        totals = cls.objects.filter(
+            content_type_id=content_type_id,
+            object_id=object_id,
+            approved=True,
+        ).aggregate(
+            rating_sum=Sum('rating'),
+            rating_count=Count('id'),
+        )
+        model_class = ContentType.objects.get_for_id(
+            content_type_id
+        ).model_class()
+
+        model_class.objects.filter(pk=object_id).update(
+            rating_sum=totals['rating_sum'] or 0,
+            rating_count=totals['rating_count'],
+        )
+
     def __str__(self):
         return f'{self.product} - {self.user.username} ({self.rating})'
@@ -7,25 +7,29 @@ It provides:
 - Shared fields and methods for reuse and extension in the product app
 """
 
-from django.db.models import Avg, Q, F
+from django.contrib.contenttypes.models import ContentType
 
 from rest_framework import serializers
 
-from src.products.models.product import Bracelet, Earring, Necklace, Pendant, Ring, Watch
+from src.products.models.listing import ProductListing
+from src.products.models.related import RelatedProduct
 from src.products.serializers.inventory import InventorySerializer
 from src.products.serializers.review import ReviewSerializer
 
 
 class BaseProductListSerializer(serializers.ModelSerializer):
+    # Listing rows are keyed by product; expose the product id as `id`
+    # and keep the `<attribute>__name` keys the client already consumes
+    id = serializers.IntegerField(source='object_id')
     average_rating = serializers.DecimalField(
         max_digits=7,
         decimal_places=2,
     )
     is_sold_out = serializers.BooleanField()
-    collection__name = serializers.CharField()
-    color__name = serializers.CharField()
-    stone__name = serializers.CharField()
-    metal__name = serializers.CharField()
+    collection__name = serializers.CharField(source='collection_name')
+    color__name = serializers.CharField(source='color_name')
+    stone__name = serializers.CharField(source='stone_name')
+    metal__name = serializers.CharField(source='metal_name')
     min_price = serializers.DecimalField(
         max_digits=7,
         decimal_places=2,
@@ -36,6 +40,7 @@ class BaseProductListSerializer(serializers.ModelSerializer):
     )
 
     class Meta:
+        model = ProductListing
         fields = [
             'id',
             'first_image',
@@ -49,33 +54,15 @@ class BaseProductListSerializer(serializers.ModelSerializer):
             'average_rating',
             'min_price',
             'max_price',
+            'is_sold_out',
         ]
-        depth = 2
 
 
 class AverageRatingField(serializers.Field):
     def to_representation(self, value):
-        # Always calculate average from approved reviews only
-        # This ensures consistency across all users
-        avg = (
-            value.review.filter(
-                approved=True,
-            ).aggregate(
-                avg=Avg('rating'),
-            )['avg']
-            or 0
-        )
-
-        return round(avg, 2)
-
-
-class RelatedProductSerializer(serializers.ModelSerializer):
-    class Meta:
-        fields = [
-            'id',
-            'first_image',
-        ]
-        model = None
+        # Read from the stored approved-review totals on the product,
+        # so this costs no query
+        return value.average_rating
 
 
 class BaseProductItemSerializer(serializers.ModelSerializer):
@@ -86,10 +73,15 @@ class BaseProductItemSerializer(serializers.ModelSerializer):
     related_products = serializers.SerializerMethodField()
 
     class Meta:
-        fields = '__all__'
+        # The raw review totals are exposed as `average_rating` only
+        exclude = ['rating_sum', 'rating_count']
         depth = 2
 
     def get_review(self, obj):
+        # Use the reviews prefetched by `get_product_item` when available
+        if hasattr(obj, 'latest_reviews'):
+            return ReviewSerializer(obj.latest_reviews, many=True).data
+
         # Get the request from context to check user permissions
         request = self.context.get('request')
 
@@ -102,61 +94,52 @@ class BaseProductItemSerializer(serializers.ModelSerializer):
 
         return ReviewSerializer(latest_reviews, many=True).data
 
-    def get_related_collection_products(self, obj):
-        model_class = obj.__class__
-        related_products = model_class.objects.filter(
-            collection=obj.collection
-        )
-
-        class DynamicRelatedProductSerializer(RelatedProductSerializer):
-            class Meta(RelatedProductSerializer.Meta):
-                model = model_class
+    def _get_related(self, obj):
+        # Both related fields are served by one indexed lookup of the
+        # precomputed rows, made once per product
+        if not hasattr(obj, '_related_products'):
+            obj._related_products = RelatedProduct.objects.get_for_product(
+                obj
+            )
 
-        serializer = DynamicRelatedProductSerializer(
-            related_products, many=True
-        )
+        return obj._related_products
 
-        return serializer.data
+    def get_related_collection_products(self, obj):
+        related = self._get_related(obj)
+        rows = related[RelatedProduct.RelationChoices.COLLECTION]
+
+        return [
+            {
+                'id': row.related_object_id,
+                'first_image': row.first_image,
+            }
+            for row in rows
+        ]
 
     def get_related_products(self, obj):
-        color_id = obj.color_id
-        target_gender = obj.target_gender
-        current_product_type = type(obj)
-        related_products = []
-
-        def serialize_products_of_type(model_class):
-            # Only include products from other types
-            if model_class == current_product_type and target_gender != 'M':
-                return []
-
-            if target_gender == 'M':
-                products = model_class.objects.filter(
-                    Q(target_gender=target_gender)
-                )
-            else:
-                products = model_class.objects.filter(
-                    color_id=color_id,
-                )
-
-            result = []
-            for product in products:
-                result.append(
-                    {
-                        'id': product.id,
-                        'first_image': product.first_image,
-                        'product_type': f'{model_class.__name__.lower()}s',
-                    }
-                )
-            return result
-
-        related_products.extend(serialize_products_of_type(Earring))
-        related_products.extend(serialize_products_of_type(Necklace))
-        related_products.extend(serialize_products_of_type(Pendant))
-        related_products.extend(serialize_products_of_type(Ring))
-        related_products.extend(serialize_products_of_type(Bracelet))
-        related_products.extend(serialize_products_of_type(Watch))
-
-        return related_products[:5]
+        related = self._get_related(obj)
+
+        # Men's products are related by gender, all others by colour
+        if obj.target_gender == 'M':
+            rows = related[RelatedProduct.RelationChoices.GENDER]
+        else:
+            rows = related[RelatedProduct.RelationChoices.COLOR]
+
+        result = []
+        for row in rows:
+            # Content types are cached by Django, so no query per row
+            content_type = ContentType.objects.get_for_id(
+                row.related_content_type_id
+            )
+            result.append(
+                {
+                    'id': row.related_object_id,
+                    'first_image': row.first_image,
+                    'product_type': f'{content_type.model}s',
+                }
+            )
+
+        return result
 
 
 class BaseAttributesSerializer(serializers.ModelSerializer):
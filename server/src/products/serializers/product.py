@@ -29,33 +29,27 @@ from src.products.serializers.base import (
 
 
 class EarringListSerializer(BaseProductListSerializer):
-    class Meta(BaseProductListSerializer.Meta):
-        model = Earring
+    pass
 
 
 class NecklaceListSerializer(BaseProductListSerializer):
-    class Meta(BaseProductListSerializer.Meta):
-        model = Necklace
+    pass
 
 
 class PendantListSerializer(BaseProductListSerializer):
-    class Meta(BaseProductListSerializer.Meta):
-        model = Pendant
+    pass
 
 
 class BraceletListSerializer(BaseProductListSerializer):
-    class Meta(BaseProductListSerializer.Meta):
-        model = Bracelet
+    pass
 
 
 class RingListSerializer(BaseProductListSerializer):
-    class Meta(BaseProductListSerializer.Meta):
-        model = Ring
+    pass
 
 
 class WatchListSerializer(BaseProductListSerializer):
-    class Meta(BaseProductListSerializer.Meta):
-        model = Watch
+    pass
 
 
 class BraceletItemSerializer(BaseProductItemSerializer):
@@ -1,12 +1,34 @@
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 
 from src.common.views import _send_email
+from src.products.cache import (
+    bump_catalog_version,
+    bump_related_products_version,
+)
+from src.products.models.inventory import Inventory
+from src.products.models.listing import ProductListing
+from src.products.models.product import (
+    Bracelet,
+    Collection,
+    Color,
+    Earring,
+    Metal,
+    Necklace,
+    Pendant,
+    Ring,
+    Stone,
+    Watch,
+)
+from src.products.models.related import RelatedProduct
 from src.products.models.review import Review
+from src.products.tasks import refresh_related_products_for
 
 
 @receiver(signal=post_save, sender=Review)
@@ -26,3 +48,122 @@ def send_approval_email_notification(sender, instance, created, **kwargs):
             from_email=settings.EMAIL_HOST_USER,
             recipient_list=(instance.user.email,),
         )
+
+
+# Registered before the listing sync below, which reads the updated totals
+@receiver(signal=post_save, sender=Review)
+def update_product_rating_on_review_save(sender, instance, **kwargs):
+    instance.update_product_rating()
+
+
+@receiver(signal=post_delete, sender=Review)
+def update_product_rating_on_review_delete(sender, instance, **kwargs):
+    instance.update_product_rating(deleted=True)
+
+
+@receiver(signal=post_save, sender=Inventory)
+@receiver(signal=post_delete, sender=Inventory)
+@receiver(signal=post_save, sender=Review)
+@receiver(signal=post_delete, sender=Review)
+def sync_product_listing_on_related_change(sender, instance, **kwargs):
+    content_type = ContentType.objects.get_for_id(instance.content_type_id)
+
+    # Price range, stock state and rating all live on the listing row,
+    # so any inventory or review write re-syncs the product it belongs to
+    ProductListing.objects.sync_for(
+        content_type,
+        instance.object_id,
+    )
+    invalidate_catalog_cache(content_type.model)
+
+
+def sync_product_listing_on_product_save(sender, instance, **kwargs):
+    ProductListing.objects.sync_product(instance)
+    invalidate_catalog_cache(sender._meta.model_name)
+
+
+def remove_product_listing_on_product_delete(sender, instance, **kwargs):
+    ProductListing.objects.remove_product(
+        ContentType.objects.get_for_model(sender),
+        instance.pk,
+    )
+    invalidate_catalog_cache(sender._meta.model_name)
+
+
+def sync_product_listing_names_on_attribute_save(sender, instance, **kwargs):
+    # Listing rows store attribute names, so a rename has to reach them
+    for category in ProductListing.objects.sync_attribute_name(instance):
+        invalidate_catalog_cache(category)
+
+    # Attribute lists without a category show every attribute, used or not
+    invalidate_catalog_cache(None)
+
+
+def invalidate_attributes_cache_on_attribute_delete(
+    sender, instance, **kwargs
+):
+    # Products using the attribute are deleted with it and invalidate
+    # their own categories
+    invalidate_catalog_cache(None)
+
+
+def refresh_related_products_on_product_save(sender, instance, **kwargs):
+    # The product's own lists are refreshed right away; the lists of the
+    # products that may show it can be many, so a worker refreshes them
+    RelatedProduct.objects.refresh_product(instance)
+
+    content_type = ContentType.objects.get_for_model(sender)
+    transaction.on_commit(
+        lambda: refresh_related_products_for.delay(
+            content_type.id,
+            instance.pk,
+        )
+    )
+
+
+def remove_related_products_on_product_delete(sender, instance, **kwargs):
+    content_type = ContentType.objects.get_for_model(sender)
+
+    RelatedProduct.objects.remove_product(content_type, instance.pk)
+    RelatedProduct.objects.remove_related(content_type, instance.pk)
+
+    # Other products' detail pages no longer show the deleted product
+    bump_related_products_version()
+    transaction.on_commit(bump_related_products_version)
+
+
+def invalidate_catalog_cache(category):
+    # Bump right away and once more on commit: a request served between
+    # the two bumps may have cached data from before this transaction
+    # committed, and the second bump makes that entry unreachable
+    bump_catalog_version(category)
+    transaction.on_commit(lambda: bump_catalog_version(category))
+
+
+for product_model in (Earring, Necklace, Pendant, Ring, Bracelet, Watch):
+    post_save.connect(
+        sync_product_listing_on_product_save,
+        sender=product_model,
+    )
+    post_delete.connect(
+        remove_product_listing_on_product_delete,
+        sender=product_model,
+    )
+    post_save.connect(
+        refresh_related_products_on_product_save,
+        sender=product_model,
+    )
+    post_delete.connect(
+        remove_related_products_on_product_delete,
+        sender=product_model,
+    )
+
+for attribute_model in (Collection, Color, Metal, Stone):
+    post_save.connect(
+        sync_product_listing_names_on_attribute_save,
+        sender=attribute_model,
+    )
+    post_delete.connect(
+        invalidate_attributes_cache_on_attribute_delete,
+        sender=attribute_model,
+    )
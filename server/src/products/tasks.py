@@ -0,0 +1,22 @@
+from celery import shared_task
+
+from django.contrib.contenttypes.models import ContentType
+
+from src.products.cache import bump_related_products_version
+from src.products.models.related import RelatedProduct
+
+
+@shared_task
+def refresh_related_products():
+    RelatedProduct.objects.rebuild()
+    bump_related_products_version()
+
+
+@shared_task
+def refresh_related_products_for(content_type_id, object_id):
+    model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+    product = model_class.objects.filter(pk=object_id).first()
+
+    if product is not None:
+        RelatedProduct.objects.refresh_affected_by(product)
+        bump_related_products_version()
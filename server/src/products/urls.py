@@ -23,8 +23,8 @@ from src.products.views.product import (
     generate_catalog,
 )
 from src.products.views.product import (
-
     ProductAllReviewsView,
+    ProductFacetView,
 )
 from src.products.views.review import ReviewViewSet
 
@@ -117,6 +117,11 @@ urlpatterns = [
         name='collection-retrieve',
     ),
     path('metals/', MetalRetrieveView.as_view(), name='metal-retrieve'),
+    path(
+        '<str:category>/facets/',
+        ProductFacetView.as_view(),
+        name='product-facets',
+    ),
     path(
         '<str:category>/<int:pk>/all-reviews/',
         ProductAllReviewsView.as_view(),
@@ -1,5 +1,6 @@
 from django.apps import apps
 
+from src.common.utils import convert_to_lower_case
 
 from src.products.models.base import BaseProduct
 
@@ -20,3 +21,20 @@ def get_valid_categories():
             valid_categories.append(model._meta.model_name)
 
     return valid_categories
+
+
+def get_category_model_name(category):
+    """
+    Convert a category as used in URLs and query strings (e.g. 'earrings',
+    'watches') to the product model name (e.g. 'earring', 'watch').
+    """
+    if not isinstance(category, str):
+        return ''
+
+    if category.endswith('s') and len(category) > 1:
+        if category == 'watches':
+            category = category[:-2]
+        else:
+            category = category[:-1]
+
+    return convert_to_lower_case(category)
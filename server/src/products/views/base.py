@@ -1,23 +1,221 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.db.models.expressions import OrderBy
+
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework import status
 
-from src.common.utils import convert_to_lower_case
-from src.products.mixins import FilterMixin
-from src.products.utils import get_valid_categories
+from src.products.constants import CatalogCacheDefaults
+from src.products.mixins import CatalogCacheMixin, FilterMixin
+from src.products.models.listing import ProductListing
+from src.products.utils import (
+    get_category_model_name,
+    get_valid_categories,
+)
 
 
 class ProductPagination(PageNumberPagination):
     page_size = 8
 
 
-class BaseProductListView(FilterMixin, ListAPIView):
+class ProductCursorPagination(BasePagination):
+    """
+    Keyset pagination for product listings.
+
+    The queryset must be ordered by one sort column followed by a unique
+    tiebreaker, which is how `ProductListingManager.get_product_list`
+    orders listings. Instead of an OFFSET, each page continues strictly
+    after the (sort value, tiebreaker) pair of the previous page's last
+    row, so deep pages cost the same as the first one.
+
+    The position is returned as an opaque `next` cursor. The total count
+    is only computed when the client asks for it with `?count=true`.
+    """
+
+    page_size = ProductPagination.page_size
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        self.sort_field, self.tiebreaker = self._get_ordering(queryset)
+
+        self.count = None
+        if request.query_params.get(self.count_query_param) == 'true':
+            self.count = queryset.count()
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            queryset = queryset.filter(self._get_keyset_filter(encoded))
+
+        # Fetch one extra row to know whether another page exists
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        return self.page
+
+    def get_paginated_response(self, data):
+        response = {
+            'next': self.get_next_link(),
+            'results': data,
+        }
+
+        if self.count is not None:
+            response['count'] = self.count
+
+        return Response(response)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        value = getattr(last, self.sort_field.lstrip('-'))
+
+        cursor = {
+            'o': self.sort_field,
+            'v': None if value is None else str(value),
+            'id': getattr(last, self.tiebreaker),
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(cursor).encode('ascii')
+        ).decode('ascii')
+
+        # Follow-up pages never recompute the count
+        url = remove_query_param(self.base_url, self.count_query_param)
+
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def _get_ordering(queryset):
+        ordering = queryset.query.order_by
+
+        if len(ordering) != 2:
+            raise ValueError(
+                'Cursor pagination requires a sort field and a tiebreaker.'
+            )
+
+        sort_field, tiebreaker = ordering
+
+        # Sort expressions carry an explicit NULL placement, see
+        # `ProductListingManager.get_product_list`
+        if isinstance(sort_field, OrderBy):
+            prefix = '-' if sort_field.descending else ''
+            sort_field = f'{prefix}{sort_field.expression.name}'
+
+        return sort_field, tiebreaker
+
+    def _decode_cursor(self, encoded):
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+
+            # A cursor is only valid for the ordering it was issued for
+            if cursor['o'] != self.sort_field:
+                raise ValueError
+
+            # Values are checked against their columns, so a tampered
+            # cursor fails here rather than in the database
+            opts = self.model._meta
+            value = cursor['v']
+            if value is not None:
+                value = opts.get_field(self.sort_field.lstrip('-')).clean(
+                    value, None
+                )
+
+            last_id = opts.get_field(self.tiebreaker).clean(cursor['id'], None)
+
+            return value, last_id
+
+        except (
+            binascii.Error,
+            TypeError,
+            KeyError,
+            ValueError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_keyset_filter(self, encoded):
+        value, last_id = self._decode_cursor(encoded)
+
+        descending = self.sort_field.startswith('-')
+        field = self.sort_field.lstrip('-')
+        after_tiebreaker = Q(**{f'{self.tiebreaker}__gt': last_id})
+
+        # Listings sort NULLs last in ascending and first in descending
+        # order, so the keyset has to step over them the same way
+        if value is None:
+            nulls = Q(**{f'{field}__isnull': True}) & after_tiebreaker
+
+            if descending:
+                return nulls | Q(**{f'{field}__isnull': False})
+
+            return nulls
+
+        lookup = 'lt' if descending else 'gt'
+        keyset = Q(**{f'{field}__{lookup}': value}) | (
+            Q(**{field: value}) & after_tiebreaker
+        )
+
+        if not descending:
+            keyset |= Q(**{f'{field}__isnull': True})
+
+        return keyset
+
+
+class BaseProductListView(CatalogCacheMixin, FilterMixin, ListAPIView):
     permission_classes = [AllowAny]
     pagination_class = ProductPagination
+    cursor_pagination_class = ProductCursorPagination
+    cache_namespace = 'list'
+    cache_query_params = (
+        'in_stock',
+        'ordering',
+        'pagination',
+        'page',
+        'cursor',
+        'count',
+    )
+
+    @property
+    def paginator(self):
+        """
+        Use keyset pagination when the client opts in with
+        `?pagination=cursor`, page numbers otherwise.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+
+        return self._paginator
 
     def list(self, request, *args, **kwargs):
+        category = self.model._meta.model_name
+
+        not_modified = self._get_not_modified_response(category)
+        if not_modified is not None:
+            return not_modified
+
+        data = self._get_cached_data(category, self._get_list_data)
+
+        return Response(data)
+
+    def _get_list_data(self):
         data = self._get_products_data()
         page = self.paginate_queryset(data)
 
@@ -25,29 +223,52 @@ class BaseProductListView(FilterMixin, ListAPIView):
             serializer = self.get_serializer(page, many=True)
             response = self.get_paginated_response(serializer.data)
 
-            return response
+            return response.data
 
         serializer = self.get_serializer(data, many=True)
 
-        return Response(
-            {
-                'products': serializer.data,
-            }
-        )
+        return {
+            'products': serializer.data,
+        }
 
     def _get_products_data(self):
         filters = self._get_filters_for_product()
         ordering = self.request.query_params.get('ordering', 'rating')
 
-        return self.model.objects.get_product_list(filters, ordering)
+        # Listings are served from the denormalized read model rather than
+        # by aggregating the product table against Inventory and Review
+        return ProductListing.objects.get_product_list(
+            self.model._meta.model_name,
+            filters,
+            ordering,
+        )
 
 
-class BaseProductItemView(RetrieveAPIView):
+class BaseProductItemView(CatalogCacheMixin, RetrieveAPIView):
     permission_classes = [AllowAny]
+    cache_namespace = 'item'
+
+    # Related products come from other categories and are refreshed by
+    # Celery without touching this product's category
+    cache_extra_scopes = (CatalogCacheDefaults.RELATED_PRODUCTS,)
 
     def get(self, request, *args, **kwargs):
         pk = kwargs.get('pk')
-        product = self.model.objects.get_product_item(pk)
+
+        # Reviewers see unapproved reviews as well
+        is_reviewer = request.user.has_perm('products.approve_review')
+
+        not_modified = self._get_not_modified_response(
+            self.model._meta.model_name,
+            variant='reviewer' if is_reviewer else '',
+        )
+        if not_modified is not None:
+            return not_modified
+
+        product = self.model.objects.get_product_item(
+            pk,
+            include_unapproved_reviews=is_reviewer,
+        )
         serializer = self.get_serializer(
             product,
             context={'request': request},
@@ -59,24 +280,24 @@ class BaseProductItemView(RetrieveAPIView):
             }
         )
 
+    def _get_cache_params(self):
+        # The item is identified by its URL, not by query parameters
+        return {'pk': [str(self.kwargs.get('pk'))]}
 
-class BaseAttributeView(FilterMixin, RetrieveAPIView):
+
+class BaseAttributeView(CatalogCacheMixin, FilterMixin, RetrieveAPIView):
     permission_classes = [AllowAny]
 
+    @property
+    def cache_namespace(self):
+        # One namespace per attribute model (colors, stones, ...)
+        return f'attributes-{self.model._meta.model_name}'
+
     def get(self, request, *args, **kwargs):
         try:
             category = self.request.query_params.get('category', '')
 
-            if not isinstance(category, str):
-                category = ''
-
-            if category.endswith('s') and len(category) > 1:
-                if category == 'watches':
-                    category = category[:-2]
-                else:
-                    category = category[:-1]
-
-            categoryToLowerCase = convert_to_lower_case(category)
+            categoryToLowerCase = get_category_model_name(category)
 
             valid_categories = get_valid_categories()
 
@@ -86,12 +307,18 @@ class BaseAttributeView(FilterMixin, RetrieveAPIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            filters = self._get_filters_for_attributes(categoryToLowerCase)
-            data = self.model.objects.get_attributes_count(
-                filters, categoryToLowerCase)
-            serializer = self.get_serializer(data, many=True)
+            not_modified = self._get_not_modified_response(
+                categoryToLowerCase
+            )
+            if not_modified is not None:
+                return not_modified
+
+            data = self._get_cached_data(
+                categoryToLowerCase,
+                lambda: self._get_attributes_data(categoryToLowerCase),
+            )
 
-            return Response({'results': serializer.data})
+            return Response(data)
 
         except Exception as e:
 
@@ -99,3 +326,10 @@ class BaseAttributeView(FilterMixin, RetrieveAPIView):
                 {'error': 'Resource not found'},
                 status=status.HTTP_404_NOT_FOUND,
             )
+
+    def _get_attributes_data(self, category):
+        filters = self._get_filters_for_attributes(category)
+        data = self.model.objects.get_attributes_count(filters, category)
+        serializer = self.get_serializer(data, many=True)
+
+        return {'results': serializer.data}
@@ -18,6 +18,8 @@ from django.views.decorators.http import require_http_methods
 
 
 from src.common.permissions import IsOrderManager
+from src.products.mixins import CatalogCacheMixin, FilterMixin
+from src.products.models.listing import ProductListing
 from src.products.models.product import Bracelet, Color, Earring, Metal, Necklace, Pendant, Ring, Stone, Collection, Watch
 
 from src.products.serializers.product import (
@@ -40,6 +42,10 @@ from src.products.serializers.product import (
 )
 
 
+from src.products.utils import (
+    get_category_model_name,
+    get_valid_categories,
+)
 from src.products.views.base import (
     BaseAttributeView,
     BaseProductItemView,
@@ -47,7 +53,7 @@ from src.products.views.base import (
 )
 
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from src.products.models.review import Review
 from src.products.serializers.review import ReviewSerializer
@@ -135,6 +141,44 @@ class StoneRetrieveView(BaseAttributeView):
     serializer_class = StoneSerializer
 
 
+class ProductFacetView(CatalogCacheMixin, FilterMixin, APIView):
+    """
+    Attribute counts for all four filter dimensions of a category.
+
+    Replaces calling the collection, color, metal and stone endpoints
+    separately: all counts come from one query against the listing read
+    model. Each dimension ignores its own selection (disjunctive
+    faceting), and results are cached per normalized filter set.
+    """
+
+    permission_classes = [AllowAny]
+    cache_namespace = 'facets'
+    cache_query_params = ('in_stock',)
+
+    def get(self, request, category):
+        category_model_name = get_category_model_name(category)
+
+        if category_model_name not in get_valid_categories():
+            return Response(
+                {'error': 'Invalid category'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        not_modified = self._get_not_modified_response(category_model_name)
+        if not_modified is not None:
+            return not_modified
+
+        facets = self._get_cached_data(
+            category_model_name,
+            lambda: ProductListing.objects.get_facet_counts(
+                category_model_name,
+                self._get_filters_for_facets(),
+            ),
+        )
+
+        return Response(facets)
+
+
 class ProductAllReviewsView(APIView):
     permission_classes = [IsAuthenticated, IsOrderManager]
 
@@ -1,7 +1,9 @@
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import gettext_lazy as _
 from decouple import config
 
@@ -38,6 +40,15 @@ PINECONE_API_KEY = os.getenv(
 PINECONE_INDEX_NAME = os.getenv(
     'PINECONE_INDEX_NAME', config('PINECONE_INDEX_NAME')
 )
+# Chatbot retrieval backend: 'pinecone' (remote index) or 'local' (NumPy
+# index on disk, built by `python manage.py setup_vectorstore`)
+CHATBOT_VECTOR_STORE = os.getenv(
+    'CHATBOT_VECTOR_STORE', config('CHATBOT_VECTOR_STORE', default='pinecone')
+)
+CHATBOT_LOCAL_INDEX_DIR = os.getenv(
+    'CHATBOT_LOCAL_INDEX_DIR',
+    config('CHATBOT_LOCAL_INDEX_DIR', default=str(BASE_DIR / 'vectorstore')),
+)
 LANGSMITH_API_KEY = os.getenv(
     'LANGSMITH_API_KEY', config('LANGSMITH_API_KEY')
 )
@@ -156,6 +167,61 @@ DATABASES = {
     }
 }
 
+# The catalog response cache and chatbot memories must be shared by every
+# web process and Celery worker: cache versions bumped in one process
+# have to reach the others. Only the test runner, a single process, uses
+# in-process caches (LocMemCache evicts least recently used entries)
+TESTING = sys.argv[1:2] == ['test']
+
+REDIS_CACHE_URL = os.getenv(
+    'REDIS_CACHE_URL', config('REDIS_CACHE_URL', default='')
+)
+
+if TESTING:
+    CATALOG_CACHE = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'catalog',
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    }
+    CHATBOT_CACHE = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'chatbot',
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    }
+elif REDIS_CACHE_URL:
+    CATALOG_CACHE = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        },
+    }
+    CHATBOT_CACHE = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+        'KEY_PREFIX': 'chatbot',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        },
+    }
+else:
+    raise ImproperlyConfigured(
+        'REDIS_CACHE_URL must be set: the catalog cache and chatbot memory '
+        'are shared between web processes and Celery workers.'
+    )
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'catalog': CATALOG_CACHE,
+    'chatbot': CHATBOT_CACHE,
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ShoppingBagsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.shopping_bags'
+
+    def ready(self):
+        import src.shopping_bags.signals
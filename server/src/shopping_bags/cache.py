@@ -0,0 +1,113 @@
+"""
+Per-user shopping bag versions for conditional requests.
+
+Every write to a user's bag bumps their version (see
+`src.shopping_bags.signals`), and the bag summary ETag embeds it, so
+clients polling the bag revalidate without touching the database.
+The available quantities in the summary also depend on other shoppers'
+holds, so every inventory row has a reservation version as well, bumped
+whenever a hold on it is created, renewed or released. The versions
+live in the catalog cache, which is shared between processes.
+"""
+
+import hashlib
+import time
+
+from src.products.cache import get_catalog_cache, get_catalog_version
+from src.products.constants import CatalogCacheDefaults
+from src.shopping_bags.constants import ShoppingBagCacheDefaults
+from src.shopping_bags.models import ShoppingBag
+
+
+def _get_version_key(user_id):
+    return f'{ShoppingBagCacheDefaults.KEY_PREFIX}:version:{user_id}'
+
+
+def get_bag_version(user_id):
+    return get_catalog_cache().get_or_set(
+        _get_version_key(user_id),
+        # Seeded from the clock, so an evicted counter never comes back
+        # with a value an old ETag was built from
+        time.time_ns,
+        timeout=None,
+    )
+
+
+def bump_bag_version(user_id):
+    cache = get_catalog_cache()
+    key = _get_version_key(user_id)
+
+    try:
+        cache.incr(key)
+
+    except ValueError:
+        # Counter not set yet (or evicted)
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def _get_reservation_version_key(inventory_id):
+    return f'{ShoppingBagCacheDefaults.KEY_PREFIX}:reservations:{inventory_id}'
+
+
+def bump_reservation_version(inventory_id):
+    cache = get_catalog_cache()
+    key = _get_reservation_version_key(inventory_id)
+
+    try:
+        cache.incr(key)
+
+    except ValueError:
+        # Counter not set yet (or evicted)
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def _get_bag_inventory_ids(user_id, bag_version):
+    # Keyed by the bag version, so the ids are loaded once per bag change
+    return get_catalog_cache().get_or_set(
+        f'{ShoppingBagCacheDefaults.KEY_PREFIX}:inventories:'
+        f'{user_id}:{bag_version}',
+        lambda: sorted(
+            ShoppingBag.objects.filter(user_id=user_id).values_list(
+                'inventory_id', flat=True
+            )
+        ),
+        timeout=CatalogCacheDefaults.TIMEOUT,
+    )
+
+
+def _get_reservation_versions(inventory_ids):
+    cache = get_catalog_cache()
+    keys = [_get_reservation_version_key(pk) for pk in inventory_ids]
+    versions = cache.get_many(keys)
+
+    # Seeded from the clock like the bag version
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+
+    return [versions[key] for key in keys]
+
+
+def get_bag_etag(user_id):
+    """
+    Build the ETag of a user's bag summary. Besides the bag itself, the
+    summary shows prices and stock, so the catalog version is part of it,
+    and the available quantities net of other shoppers' holds, so the
+    reservation versions of the bag's inventory rows are too.
+    """
+    bag_version = get_bag_version(user_id)
+    reservation_versions = _get_reservation_versions(
+        _get_bag_inventory_ids(user_id, bag_version)
+    )
+
+    versions = ':'.join(
+        str(version)
+        for version in (
+            bag_version,
+            get_catalog_version(None),
+            *reservation_versions,
+        )
+    )
+
+    return f'"{hashlib.md5(versions.encode()).hexdigest()}"'
@@ -5,3 +5,15 @@ class ShoppingBagErrorMessages:
     INSUFFICIENT_STOCK = 'Only {quantity} items available in stock'
 
     ERROR_TOTAL_PRICE = 'Unable to calculate total price'
+
+
+class StockReservationDefaults:
+    # How long adding or updating a bag item holds its stock
+    TTL_MINUTES = 15
+
+    # Expired holds deleted per statement by the release task
+    RELEASE_BATCH_SIZE = 500
+
+
+class ShoppingBagCacheDefaults:
+    KEY_PREFIX = 'shopping-bag'
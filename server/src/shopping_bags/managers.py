@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+from django.db import models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from src.shopping_bags.constants import StockReservationDefaults
+
+
+class StockReservationQuerySet(models.QuerySet):
+    def active(self):
+        return self.filter(expires_at__gt=timezone.now())
+
+    def expired(self):
+        return self.filter(expires_at__lte=timezone.now())
+
+
+class StockReservationManager(
+    models.Manager.from_queryset(StockReservationQuerySet)
+):
+    """
+    Manager for stock reservations (holds) of shopping bag items.
+
+    A hold mirrors the quantity of its bag item and keeps that stock out
+    of everyone else's reach until it expires. Holds are never extended
+    implicitly: every add or update of the bag item renews its hold.
+    """
+
+    def hold(self, bag_item):
+        """
+        Create or renew the hold of a bag item for its current quantity.
+        """
+        reservation, _ = self.update_or_create(
+            bag_item=bag_item,
+            defaults={
+                'inventory_id': bag_item.inventory_id,
+                'quantity': bag_item.quantity,
+                'expires_at': timezone.now()
+                + timedelta(minutes=StockReservationDefaults.TTL_MINUTES),
+            },
+        )
+
+        return reservation
+
+    def get_reserved_quantity(self, inventory, exclude_user=None):
+        """
+        Return how many items of an inventory row active holds keep back,
+        leaving out the holds of `exclude_user` (their own bag).
+        """
+        reservations = self.active().filter(inventory=inventory)
+
+        if exclude_user is not None:
+            reservations = reservations.exclude(bag_item__user=exclude_user)
+
+        return reservations.aggregate(total=Sum('quantity'))['total'] or 0
+
+    def get_reserved_quantities(self, inventory_ids, exclude_user=None):
+        """
+        Return {inventory id: held quantity} for several inventory rows in
+        a single query.
+        """
+        reservations = self.active().filter(inventory_id__in=inventory_ids)
+
+        if exclude_user is not None:
+            reservations = reservations.exclude(bag_item__user=exclude_user)
+
+        return dict(
+            reservations.values('inventory_id')
+            .annotate(total=Sum('quantity'))
+            .values_list('inventory_id', 'total')
+            .order_by()
+        )
+
+    def get_reserved_quantity_subquery(self, exclude_user=None):
+        """
+        Return an expression with the held quantity of the inventory row
+        referenced by the outer query's `inventory_id`, for annotating
+        bag items without a query per item.
+        """
+        reservations = self.active().filter(
+            inventory_id=OuterRef('inventory_id')
+        )
+
+        if exclude_user is not None:
+            reservations = reservations.exclude(bag_item__user=exclude_user)
+
+        total = (
+            reservations.order_by()
+            .values('inventory_id')
+            .annotate(total=Sum('quantity'))
+            .values('total')
+        )
+
+        return Coalesce(Subquery(total), 0)
+
+    def release_expired(
+        self,
+        batch_size=StockReservationDefaults.RELEASE_BATCH_SIZE,
+        on_batch=None,
+    ):
+        """
+        Delete expired holds in batches of `batch_size`, so releasing a
+        large backlog never locks many rows in one statement.
+        `on_batch` is called with the inventory ids of every released
+        batch. Returns the number of holds released.
+        """
+        released = 0
+
+        while True:
+            batch = list(
+                self.expired()
+                .order_by('expires_at')
+                .values_list('pk', 'inventory_id')[:batch_size]
+            )
+
+            if not batch:
+                return released
+
+            released += self.filter(
+                pk__in=[pk for pk, _ in batch],
+            ).delete()[0]
+
+            if on_batch is not None:
+                on_batch({inventory_id for _, inventory_id in batch})
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_generic_relation_indexes'),
+        ('shopping_bags', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockReservation',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('quantity', models.PositiveIntegerField()),
+                ('expires_at', models.DateTimeField()),
+                (
+                    'bag_item',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='reservation',
+                        to='shopping_bags.shoppingbag',
+                    ),
+                ),
+                (
+                    'inventory',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='reservations',
+                        to='products.inventory',
+                    ),
+                ),
+            ],
+            options={
+                'indexes': [
+                    models.Index(
+                        fields=['inventory', 'expires_at'],
+                        name='reservation_inventory_idx',
+                    ),
+                    models.Index(
+                        fields=['expires_at'], name='reservation_expires_idx'
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 
+from src.shopping_bags.managers import StockReservationManager
+
 UserModel = get_user_model()
 
 
@@ -29,3 +31,49 @@ class ShoppingBag(models.Model):
         on_delete=models.CASCADE,
         related_name='shopping_bag_items',
     )
+
+
+class StockReservation(models.Model):
+    """
+    A time-limited hold on the stock of a shopping bag item.
+
+    Stock available to a shopper is the inventory quantity minus the
+    active holds of everyone else, so items in other bags cannot be
+    taken from under them until their holds expire. Expired holds are
+    deleted by the `release_expired_reservations` Celery task.
+    """
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['inventory', 'expires_at'],
+                name='reservation_inventory_idx',
+            ),
+            models.Index(
+                fields=['expires_at'],
+                name='reservation_expires_idx',
+            ),
+        ]
+
+    bag_item = models.OneToOneField(
+        to=ShoppingBag,
+        on_delete=models.CASCADE,
+        related_name='reservation',
+    )
+
+    # Denormalized from the bag item, so holds are summed per inventory
+    # row without a join
+    inventory = models.ForeignKey(
+        to='products.Inventory',
+        on_delete=models.CASCADE,
+        related_name='reservations',
+    )
+
+    quantity = models.PositiveIntegerField()
+
+    expires_at = models.DateTimeField()
+
+    objects = StockReservationManager()
+
+    def __str__(self):
+        return f'{self.quantity} x {self.inventory_id} until {self.expires_at}'
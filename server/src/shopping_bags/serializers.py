@@ -3,6 +3,7 @@ from rest_framework import serializers
 from src.products.models.inventory import Inventory
 from src.shopping_bags.models import ShoppingBag
 from src.common.mixins import InventoryMixin
+from src.common.serializers import InventoryListSerializer
 
 
 class ShoppingBagSerializer(serializers.ModelSerializer):
@@ -44,9 +45,18 @@ class ShoppingBagSerializer(serializers.ModelSerializer):
             'total_price',
         ]
         depth = 3
+        # Resolves the products of all items in a batch
+        list_serializer_class = InventoryListSerializer
 
     def get_product_info(self, obj):
-        return InventoryMixin.get_product_info(obj)
+        product_info = InventoryMixin.get_product_info(obj)
+
+        # Listed bag items are annotated with the stock that is not held
+        # in other shoppers' bags (see `ShoppingBagViewSet.get_queryset`)
+        if product_info and hasattr(obj, 'available_quantity'):
+            product_info['available_quantity'] = obj.available_quantity
+
+        return product_info
 
     def get_total_price(self, obj):
         return InventoryMixin.get_total_price_per_product(obj)
@@ -1,6 +1,7 @@
 from rest_framework.exceptions import ValidationError
 
-from src.shopping_bags.models import ShoppingBag
+from src.products.models import Inventory
+from src.shopping_bags.models import ShoppingBag, StockReservation
 from src.common.services import UserIdentificationService
 from src.shopping_bags.constants import ShoppingBagErrorMessages
 
@@ -14,6 +15,7 @@ class ShoppingBagService:
     - Inventory object retrieval and validation
     - Stock quantity validation
     - Atomic database operations for inventory updates
+    - Time-limited stock holds for bag items
     - Shopping bag item creation and retrieval
     """
 
@@ -22,16 +24,43 @@ class ShoppingBagService:
         return UserIdentificationService.get_user_identifier(request)
 
     @staticmethod
-    def validate_inventory_quantity(inventory_obj, required_quantity):
-        if required_quantity > inventory_obj.quantity:
+    def lock_inventory(inventory_obj):
+        # Serializes concurrent holds on the same inventory row until the
+        # surrounding transaction ends
+        return Inventory.objects.select_for_update().get(pk=inventory_obj.pk)
+
+    @staticmethod
+    def get_available_quantity(inventory_obj, user=None):
+        # Stock held by other shoppers is not available; the user's own
+        # hold is, since it is the quantity they are changing
+        return inventory_obj.quantity - (
+            StockReservation.objects.get_reserved_quantity(
+                inventory_obj,
+                exclude_user=user,
+            )
+        )
+
+    @staticmethod
+    def validate_inventory_quantity(
+        inventory_obj, required_quantity, user=None
+    ):
+        available_quantity = ShoppingBagService.get_available_quantity(
+            inventory_obj, user
+        )
+
+        if required_quantity > available_quantity:
             raise ValidationError(
                 {
                     'quantity': ShoppingBagErrorMessages.INSUFFICIENT_STOCK.format(
-                        quantity=inventory_obj.quantity
+                        quantity=max(available_quantity, 0)
                     )
                 }
             )
 
+    @staticmethod
+    def hold_stock(bag_item):
+        return StockReservation.objects.hold(bag_item)
+
     @staticmethod
     def get_or_create_bag_item(filters, defaults):
         return ShoppingBag.objects.get_or_create(**filters, defaults=defaults)
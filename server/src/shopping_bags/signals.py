@@ -0,0 +1,39 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from src.shopping_bags.cache import (
+    bump_bag_version,
+    bump_reservation_version,
+)
+from src.shopping_bags.models import ShoppingBag, StockReservation
+
+
+@receiver(signal=post_save, sender=ShoppingBag)
+@receiver(signal=post_delete, sender=ShoppingBag)
+def bump_bag_version_on_change(sender, instance, **kwargs):
+    user_id = instance.user_id
+
+    # Bump right away and once more on commit, like the catalog cache:
+    # a summary served in between may still show the old bag
+    bump_bag_version(user_id)
+    transaction.on_commit(lambda: bump_bag_version(user_id))
+
+
+@receiver(signal=post_delete, sender=ShoppingBag)
+def bump_reservation_version_on_bag_item_delete(sender, instance, **kwargs):
+    # The item's hold is deleted with it, freeing stock for other shoppers
+    inventory_id = instance.inventory_id
+
+    bump_reservation_version(inventory_id)
+    transaction.on_commit(lambda: bump_reservation_version(inventory_id))
+
+
+# Expired holds are released in bulk by `release_expired_reservations`,
+# which bumps the versions itself and keeps Django's fast delete path
+@receiver(signal=post_save, sender=StockReservation)
+def bump_reservation_version_on_hold(sender, instance, **kwargs):
+    inventory_id = instance.inventory_id
+
+    bump_reservation_version(inventory_id)
+    transaction.on_commit(lambda: bump_reservation_version(inventory_id))
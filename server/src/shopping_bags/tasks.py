@@ -0,0 +1,16 @@
+from celery import shared_task
+
+from src.shopping_bags.cache import bump_reservation_version
+from src.shopping_bags.models import StockReservation
+
+
+def _bump_reservation_versions(inventory_ids):
+    for inventory_id in inventory_ids:
+        bump_reservation_version(inventory_id)
+
+
+@shared_task
+def release_expired_reservations():
+    return StockReservation.objects.release_expired(
+        on_batch=_bump_reservation_versions,
+    )
@@ -1,12 +1,14 @@
 from django.db import transaction
-from django.db.models import Sum, F
+from django.db.models import F, Sum, Window
+from django.utils.cache import get_conditional_response
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 
-from src.shopping_bags.models import ShoppingBag
+from src.shopping_bags.cache import get_bag_etag
+from src.shopping_bags.models import ShoppingBag, StockReservation
 from src.shopping_bags.serializers import ShoppingBagSerializer
 from src.shopping_bags.services import ShoppingBagService
 from src.shopping_bags.constants import ShoppingBagErrorMessages
@@ -24,11 +26,28 @@ class ShoppingBagViewSet(viewsets.ModelViewSet):
         try:
             user_filters = ShoppingBagService.get_user_identifier(self.request)
 
-            return ShoppingBag.objects.filter(**user_filters).select_related(
-                # select_related() performs a SQL JOIN to fetch related objects
-                # This reduces the number of database queries
-                'inventory',
-                'user',
+            return (
+                ShoppingBag.objects.filter(**user_filters)
+                .select_related(
+                    # select_related() performs a SQL JOIN to fetch related objects
+                    # This reduces the number of database queries
+                    'inventory__size',
+                    'user',
+                )
+                # The serializer nests the user (depth=3) with their
+                # groups and permissions
+                .prefetch_related(
+                    'user__groups',
+                    'user__user_permissions',
+                )
+                .annotate(
+                    # Stock the user can still buy: what is not held in
+                    # other shoppers' bags
+                    available_quantity=F('inventory__quantity')
+                    - StockReservation.objects.get_reserved_quantity_subquery(
+                        exclude_user=user_filters['user']
+                    ),
+                )
             )
         except ValidationError:
             # Return empty queryset if user identification fails
@@ -45,10 +64,8 @@ class ShoppingBagViewSet(viewsets.ModelViewSet):
         inventory = validated_data['inventory']
         quantity_to_add = validated_data['quantity']
 
-        # Get the inventory object and validate stock availability
-        ShoppingBagService.validate_inventory_quantity(
-            inventory, quantity_to_add
-        )
+        # Lock the inventory row, so concurrent adds see each other's holds
+        inventory = ShoppingBagService.lock_inventory(inventory)
 
         # Create filters for finding existing bag item
         filters = {'inventory': inventory, **user_filters}
@@ -60,14 +77,19 @@ class ShoppingBagViewSet(viewsets.ModelViewSet):
 
         if not created:
             # If item already exists, add to existing quantity
-            new_total_quantity = bag_item.quantity + quantity_to_add
-            # Re-validate to ensure we don't exceed stock
-            ShoppingBagService.validate_inventory_quantity(
-                inventory, quantity_to_add
-            )
-            bag_item.quantity = new_total_quantity
+            bag_item.quantity += quantity_to_add
+
+        # Validate the whole bag quantity against the stock that is not
+        # held by other shoppers
+        ShoppingBagService.validate_inventory_quantity(
+            inventory, bag_item.quantity, user_filters['user']
+        )
+
+        if not created:
             bag_item.save(update_fields=['quantity'])
 
+        ShoppingBagService.hold_stock(bag_item)
+
         # Set the instance for the serializer
         serializer.instance = bag_item
 
@@ -85,29 +107,32 @@ class ShoppingBagViewSet(viewsets.ModelViewSet):
         if new_quantity <= 0:
             return self.perform_destroy(instance)
 
-        # Get inventory object for validation
-        inventory = instance.inventory
-
         # Calculate the change in quantity
         quantity_delta = new_quantity - instance.quantity
 
         # If adding more items, validate stock availability
         if quantity_delta > 0:
+            inventory = ShoppingBagService.lock_inventory(instance.inventory)
+
             ShoppingBagService.validate_inventory_quantity(
-                inventory, quantity_delta
+                inventory, new_quantity, instance.user
             )
 
         # Save the updated instance
         serializer.save()
 
+        # Renew the hold for the new quantity
+        instance.quantity = new_quantity
+        ShoppingBagService.hold_stock(instance)
+
     @transaction.atomic
     def perform_destroy(self, instance):
         """
-        This method handles the deletion of shopping bag items and restores
-        the corresponding inventory quantity.
+        This method handles the deletion of shopping bag items and releases
+        their stock holds.
         """
 
-        # Delete the shopping bag item
+        # Delete the shopping bag item (its hold is deleted with it)
         instance.delete()
 
     @action(detail=False, methods=['get'], url_path='count')
@@ -180,3 +205,60 @@ class ShoppingBagViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @action(detail=False, methods=['get'], url_path='summary')
+    def get_summary(self, request):
+        """
+        Get the bag items together with the total quantity and price.
+
+        This custom action replaces calling `list`, `count` and
+        `total-price` separately: the totals are computed by window
+        functions over the same rows, so items and totals come from a
+        single query. Responses carry an ETag built from the user's bag
+        version; a matching If-None-Match is answered with 304 without
+        querying the database.
+        """
+        try:
+            # Get user identification filters
+            user_filters = ShoppingBagService.get_user_identifier(request)
+            etag = get_bag_etag(user_filters['user'].pk)
+
+            not_modified = get_conditional_response(
+                request._request,
+                etag=etag,
+            )
+
+            if not_modified is not None:
+                not_modified['ETag'] = etag
+
+                return not_modified
+
+            bag_items = list(
+                self.get_queryset().annotate(
+                    bag_quantity=Window(Sum('quantity')),
+                    bag_total_price=Window(
+                        Sum(F('inventory__price') * F('quantity'))
+                    ),
+                )
+            )
+
+            count = bag_items[0].bag_quantity if bag_items else 0
+            total_price = bag_items[0].bag_total_price if bag_items else 0
+
+            response = Response(
+                {
+                    'items': self.get_serializer(bag_items, many=True).data,
+                    'count': count,
+                    'total_price': round(total_price, 2),
+                },
+                status=status.HTTP_200_OK,
+            )
+            response['ETag'] = etag
+
+            return response
+
+        except ValidationError as e:
+            return Response(
+                e.detail,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WishlistConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.wishlists'
+
+    def ready(self):
+        import src.wishlists.signals
@@ -0,0 +1,67 @@
+"""
+Per-user cache of wishlist membership keys.
+
+Every write to a user's wishlist bumps their version (see
+`src.wishlists.signals`). The cached keys and the ETag of the keys
+endpoint both embed the version, so they change together and stale
+entries are never addressed again. The versions and entries live in
+the catalog cache, which is shared between processes.
+"""
+
+import hashlib
+import time
+
+from src.products.cache import get_catalog_cache
+from src.wishlists.constants import WishlistCacheDefaults
+from src.wishlists.models import Wishlist
+
+
+def _get_version_key(user_id):
+    return f'{WishlistCacheDefaults.KEY_PREFIX}:version:{user_id}'
+
+
+def get_wishlist_version(user_id):
+    return get_catalog_cache().get_or_set(
+        _get_version_key(user_id),
+        # Seeded from the clock, so an evicted counter never comes back
+        # with a value an old entry or ETag was built from
+        time.time_ns,
+        timeout=None,
+    )
+
+
+def bump_wishlist_version(user_id):
+    cache = get_catalog_cache()
+    key = _get_version_key(user_id)
+
+    try:
+        cache.incr(key)
+
+    except ValueError:
+        # Counter not set yet (or evicted)
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def get_wishlist_etag(user_id):
+    version = f'{user_id}:{get_wishlist_version(user_id)}'
+
+    return f'"{hashlib.md5(version.encode()).hexdigest()}"'
+
+
+def get_wishlist_keys(user_id):
+    """
+    Return the user's wishlisted products as sorted
+    [content type, object id] pairs, from the cache when possible.
+    """
+    version = get_wishlist_version(user_id)
+
+    return get_catalog_cache().get_or_set(
+        f'{WishlistCacheDefaults.KEY_PREFIX}:keys:{user_id}:{version}',
+        lambda: [
+            list(key)
+            for key in Wishlist.objects.filter(user_id=user_id)
+            .order_by('content_type__model', 'object_id')
+            .values_list('content_type__model', 'object_id')
+        ],
+        timeout=WishlistCacheDefaults.TIMEOUT,
+    )
@@ -6,3 +6,11 @@ class WishlistErrorMessages:
     ITEM_NOT_FOUND = 'Wishlist item not found'
 
     ERROR_INVALID_CONTENT_TYPE_OR_ID = 'Invalid content type or object ID'
+
+
+class WishlistCacheDefaults:
+    KEY_PREFIX = 'wishlist'
+
+    # Keys payloads are invalidated by version bumps; the timeout only
+    # bounds how long unreachable entries linger
+    TIMEOUT = 60 * 60
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('wishlists', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wishlist',
+            index=models.Index(
+                fields=['content_type', 'object_id'],
+                name='wishlist_product_idx',
+            ),
+        ),
+    ]
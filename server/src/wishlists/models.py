@@ -16,6 +16,15 @@ class Wishlist(models.Model):
 
         ordering = ['-created_at']
 
+        indexes = [
+            # Wishlist entries of a product (the unique constraint above
+            # leads with the user, so it cannot serve these lookups)
+            models.Index(
+                fields=['content_type', 'object_id'],
+                name='wishlist_product_idx',
+            ),
+        ]
+
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -1,11 +1,50 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Avg
 
 from rest_framework import serializers
 
 from src.wishlists.models import Wishlist
 
 
+class WishlistListSerializer(serializers.ListSerializer):
+    """
+    List serializer that loads every wishlisted product up front: one
+    query per product type, with the price range and stock status
+    aggregated in bulk (see `BaseProductManager.get_product_cards`).
+    The products are stored in each item's generic foreign key cache,
+    so `WishlistSerializer.get_product_info` runs no queries.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        product_ids = {}
+
+        for item in items:
+            product_ids.setdefault(item.content_type_id, set()).add(
+                item.object_id
+            )
+
+        # (content type id, object id) -> product
+        products = {}
+
+        for content_type_id, ids in product_ids.items():
+            model_class = ContentType.objects.get_for_id(
+                content_type_id
+            ).model_class()
+
+            for pk, product in model_class.objects.get_product_cards(
+                ids
+            ).items():
+                products[content_type_id, pk] = product
+
+        for item in items:
+            product = products.get((item.content_type_id, item.object_id))
+
+            if product is not None:
+                Wishlist.product.set_cached_value(item, product)
+
+        return super().to_representation(items)
+
+
 class WishlistSerializer(serializers.ModelSerializer):
     """
     This serializer handles the conversion of Wishlist model instances to JSON
@@ -13,7 +52,7 @@ class WishlistSerializer(serializers.ModelSerializer):
 
     Key Features:
     - Includes product information from the related product
-    - Calculates average rating from approved reviews
+    - Includes the stored average rating from approved reviews
     - Provides price range (min/max) from inventory items
     - Determines if product is sold out based on inventory
     - Handles GenericForeignKey relationships
@@ -43,6 +82,8 @@ class WishlistSerializer(serializers.ModelSerializer):
             'object_id',
             'product_info',
         ]
+        # Loads all products in bulk when serializing many items
+        list_serializer_class = WishlistListSerializer
         # Fields that cannot be modified through the API
         read_only_fields = [
             'id',
@@ -62,36 +103,14 @@ class WishlistSerializer(serializers.ModelSerializer):
         # Get the related product object through GenericForeignKey
         product = obj.product
 
-        # Calculate average rating from approved reviews only
-        # Uses Django's aggregation to get the average rating
-        # Returns 0 if no approved reviews exist
-        avg_rating = (
-            product.review.filter(
-                approved=True,
-            ).aggregate(
-                avg=Avg(
-                    'rating',
-                )
-            )['avg']
-            or 0
-        )
+        if hasattr(product, 'in_stock_size_count'):
+            # Aggregated in bulk by `WishlistListSerializer`
+            min_price = product.min_price or 0
+            max_price = product.max_price or 0
+            is_sold_out = product.in_stock_size_count == 0
 
-        # Get all inventory items for the product
-        inventory_items = product.inventory.all()
-        if inventory_items:
-            # Calculate price range from all inventory items
-            prices = [item.price for item in inventory_items]
-            min_price = min(prices)
-            max_price = max(prices)
         else:
-            # No inventory items available
-            min_price = max_price = 0
-
-        # Determine if product is sold out
-        # Checks if any inventory items have quantity > 0
-        is_sold_out = not inventory_items.filter(
-            quantity__gt=0,
-        ).exists()
+            min_price, max_price, is_sold_out = self._get_stock_info(product)
 
         # Return comprehensive product information
         return {
@@ -103,8 +122,27 @@ class WishlistSerializer(serializers.ModelSerializer):
             'stone__name': product.stone.name,
             'metal__name': product.metal.name,
             'is_sold_out': is_sold_out,
-            # Round to 2 decimal places
-            'average_rating': round(avg_rating, 2),
+            # Stored totals over approved reviews, 0 if there are none
+            'average_rating': product.average_rating,
             'min_price': min_price,
             'max_price': max_price,
         }
+
+    @staticmethod
+    def _get_stock_info(product):
+        # Get all inventory items for the product
+        inventory_items = product.inventory.all()
+        if inventory_items:
+            # Calculate price range from all inventory items
+            prices = [item.price for item in inventory_items]
+            min_price = min(prices)
+            max_price = max(prices)
+        else:
+            # No inventory items available
+            min_price = max_price = 0
+
+        # Determine if product is sold out
+        # Checks the already fetched inventory items, so no extra query
+        is_sold_out = not any(item.quantity > 0 for item in inventory_items)
+
+        return min_price, max_price, is_sold_out
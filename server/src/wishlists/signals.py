@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from src.wishlists.cache import bump_wishlist_version
+from src.wishlists.models import Wishlist
+
+
+@receiver(signal=post_save, sender=Wishlist)
+@receiver(signal=post_delete, sender=Wishlist)
+def bump_wishlist_version_on_change(sender, instance, **kwargs):
+    user_id = instance.user_id
+
+    # Bump right away and once more on commit, like the catalog cache:
+    # keys cached in between may come from before the change
+    bump_wishlist_version(user_id)
+    transaction.on_commit(lambda: bump_wishlist_version(user_id))
@@ -1,10 +1,12 @@
 from django.contrib.contenttypes.models import ContentType
+from django.utils.cache import get_conditional_response
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 
+from src.wishlists.cache import get_wishlist_etag, get_wishlist_keys
 from src.wishlists.models import Wishlist
 from src.wishlists.serializers import WishlistSerializer
 from src.wishlists.services import WishlistService
@@ -135,3 +137,43 @@ class WishlistViewSet(viewsets.ModelViewSet):
                 e.detail,
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+    @action(detail=False, methods=['get'], url_path='keys')
+    def get_wishlist_keys(self, request):
+        """
+        This custom action returns only the [content type, object id]
+        pairs of the user's wishlist, so listing pages can mark
+        wishlisted products without loading the full wishlist. The pairs
+        are cached per user and the response carries an ETag; a matching
+        If-None-Match is answered with 304.
+        """
+        try:
+            # Get user identification filters
+            user_filters = WishlistService.get_user_identifier(request)
+            user_id = user_filters['user'].pk
+            etag = get_wishlist_etag(user_id)
+
+            not_modified = get_conditional_response(
+                request._request,
+                etag=etag,
+            )
+
+            if not_modified is not None:
+                not_modified['ETag'] = etag
+
+                return not_modified
+
+            response = Response(
+                {'keys': get_wishlist_keys(user_id)},
+                status=status.HTTP_200_OK,
+            )
+            response['ETag'] = etag
+
+            return response
+
+        except ValidationError as e:
+            # Return validation error details
+            return Response(
+                e.detail,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
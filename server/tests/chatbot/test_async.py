@@ -0,0 +1,143 @@
+import json
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+from django.core.cache import caches
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from src.chatbot.adapters import MemoryAdapter
+from src.chatbot.config import MEMORY_CACHE_ALIAS
+from src.chatbot.constants import ERROR_RESPONSE_OBJECT
+from src.chatbot.services import ChatbotService
+
+
+async def _astream(*chunks):
+    for chunk in chunks:
+        yield Mock(content=chunk)
+
+
+class AsyncChatbotServiceTestCase(TestCase):
+    """Test suite for the async chatbot service path"""
+
+    def setUp(self):
+        caches[MEMORY_CACHE_ALIAS].clear()
+        self.session_id = str(uuid.uuid4())
+
+        self.llm = Mock()
+        self.llm.ainvoke = AsyncMock(return_value=Mock(content='gold rings'))
+        self.streaming_llm = Mock()
+        self.streaming_llm.astream = Mock(
+            return_value=_astream('Here are ', '', 'gold rings')
+        )
+        self.vector_store = Mock()
+        self.vector_store.asimilarity_search = AsyncMock(
+            return_value=[Mock(page_content='Gold ring, 100 EUR')]
+        )
+
+        self.service = ChatbotService(
+            session_id=self.session_id,
+            vector_store=self.vector_store,
+            memory=MemoryAdapter.get_memory(self.session_id),
+            llm=self.llm,
+            streaming_llm=self.streaming_llm,
+            customer_query='Show me rings',
+        )
+
+    async def _collect(self):
+        return [
+            chunk async for chunk in self.service.agenerate_response_stream()
+        ]
+
+    async def test_streams_chunks_using_async_apis(self):
+        """The response is streamed through ainvoke, search and astream"""
+        chunks = await self._collect()
+
+        self.assertIn(self.session_id, chunks[0])
+        self.assertEqual(
+            [
+                json.loads(chunk[len('data: ') :])['chunk']
+                for chunk in chunks[1:]
+            ],
+            ['Here are ', 'gold rings'],
+        )
+        self.vector_store.asimilarity_search.assert_awaited_once()
+        self.assertEqual(
+            self.vector_store.asimilarity_search.await_args.args[0],
+            'gold rings',
+        )
+
+    async def test_saves_the_exchange_to_memory(self):
+        """The completed exchange is stored for follow-up questions"""
+        await self._collect()
+
+        memory_vars = await MemoryAdapter.get_memory(
+            self.session_id
+        ).aload_memory_variables({})
+
+        self.assertEqual(
+            [
+                message.content
+                for message in memory_vars['conversation_memory']
+            ],
+            ['Show me rings', 'Here are gold rings'],
+        )
+
+    async def test_llm_error_yields_error_chunk(self):
+        """A failing LLM call ends the stream with an error chunk"""
+        self.llm.ainvoke.side_effect = Exception('LLM error')
+
+        with self.assertLogs('src.chatbot.services', level='ERROR'):
+            chunks = await self._collect()
+
+        self.assertIn('error', chunks[-1])
+
+
+class AsyncChatBotViewTestCase(TestCase):
+    """Test suite for AsyncChatBotView"""
+
+    def setUp(self):
+        self.client = AsyncClient()
+        self.url = reverse('chatbot:chatbot-chat-stream')
+
+    async def test_post_streams_service_chunks(self):
+        """A valid request streams the chunks of the async service"""
+        session_id = str(uuid.uuid4())
+
+        async def chunks():
+            yield f'data: {json.dumps({"session_id": session_id})}\n\n'
+            yield f'data: {json.dumps({"chunk": "Here are rings"})}\n\n'
+
+        mock_service = Mock()
+        mock_service.agenerate_response_stream = chunks
+
+        with patch(
+            'src.chatbot.views.ChatbotServiceFactory.create',
+            return_value=mock_service,
+        ) as mock_factory:
+            response = await self.client.post(
+                self.url,
+                data={'message': 'Show me rings', 'session_id': session_id},
+                content_type='application/json',
+            )
+
+            content = b''.join(
+                [chunk async for chunk in response.streaming_content]
+            ).decode('utf-8')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(session_id, content)
+        self.assertIn('Here are rings', content)
+        mock_factory.assert_called_once_with(session_id, 'Show me rings')
+
+    async def test_post_with_invalid_data(self):
+        """Invalid requests are rejected before any service is created"""
+        response = await self.client.post(
+            self.url,
+            data={'message': ''},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), ERROR_RESPONSE_OBJECT)
@@ -0,0 +1,72 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from src.chatbot.documents import iter_product_documents
+from src.chatbot.sync import assign_chunk_ids
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductDocumentsTestCase(TestCase):
+    """Test suite for the database-built knowledge chunks"""
+
+    def setUp(self):
+        self.data = TestDataBuilder.create_listed_product(
+            'Knowledge', price=150.00
+        )
+        self.unpriced = TestDataBuilder.create_listed_product(
+            'Unpriced', price=None
+        )
+
+    def _get_documents(self, **kwargs):
+        return {
+            document.metadata['product_id']: document
+            for document in iter_product_documents(**kwargs)
+        }
+
+    def test_one_document_per_product_with_metadata(self):
+        """Each product becomes one chunk with filterable metadata"""
+        product = self.data['product']
+        document = self._get_documents()[product.id]
+
+        self.assertIn(f'Product ID: {product.id};', document.page_content)
+        self.assertIn('Price: $150.00', document.page_content)
+        self.assertIn(product.collection.name, document.page_content)
+        self.assertEqual(document.metadata['category'], 'earrings')
+        self.assertEqual(document.metadata['min_price'], 150.0)
+        self.assertEqual(document.metadata['max_price'], 150.0)
+        self.assertEqual(document.metadata['target_gender'], 'F')
+
+    def test_product_without_sizes_has_no_price_range(self):
+        """Products without inventory carry no null price metadata"""
+        document = self._get_documents()[self.unpriced['product'].id]
+
+        self.assertNotIn('min_price', document.metadata)
+        self.assertNotIn(None, document.metadata.values())
+
+    def test_queries_do_not_grow_with_products(self):
+        """Streaming runs a fixed number of queries per batch"""
+        with CaptureQueriesContext(connection) as few_products:
+            self._get_documents()
+
+        for index in range(3):
+            TestDataBuilder.create_listed_product(f'Extra{index}')
+
+        with CaptureQueriesContext(connection) as many_products:
+            self._get_documents()
+
+        self.assertEqual(
+            len(many_products.captured_queries),
+            len(few_products.captured_queries),
+        )
+
+    def test_chunks_are_keyed_by_product(self):
+        """The sync id comes from the category and product id metadata"""
+        product = self.data['product']
+        document = assign_chunk_ids(
+            [self._get_documents()[product.id]], 'product'
+        )[0]
+
+        self.assertEqual(
+            document.metadata['chunk_id'], f'product-earrings-{product.id}'
+        )
@@ -0,0 +1,59 @@
+import uuid
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from src.chatbot.adapters import MemoryAdapter
+from src.chatbot.config import MEMORY_CACHE_ALIAS
+from src.chatbot.memory import CacheChatMessageHistory
+
+
+class CacheChatMessageHistoryTestCase(TestCase):
+    """Test suite for the cache-backed session memory"""
+
+    def setUp(self):
+        caches[MEMORY_CACHE_ALIAS].clear()
+        self.session_id = str(uuid.uuid4())
+
+    def test_memory_is_shared_between_adapter_calls(self):
+        """A follow-up request sees the context saved by an earlier one"""
+        MemoryAdapter.get_memory(self.session_id).save_context(
+            {'input': 'Show me rings'},
+            {'response': 'Here are some rings'},
+        )
+
+        memory_vars = MemoryAdapter.get_memory(
+            self.session_id
+        ).load_memory_variables({})
+        messages = memory_vars['conversation_memory']
+
+        self.assertEqual(
+            [message.content for message in messages],
+            ['Show me rings', 'Here are some rings'],
+        )
+
+    def test_history_keeps_only_latest_messages(self):
+        """Only the latest max_messages messages are kept"""
+        history = CacheChatMessageHistory(self.session_id, max_messages=4)
+
+        for index in range(3):
+            history.add_user_message(f'question {index}')
+            history.add_ai_message(f'answer {index}')
+
+        self.assertEqual(
+            [message.content for message in history.messages],
+            ['question 1', 'answer 1', 'question 2', 'answer 2'],
+        )
+
+    def test_sessions_are_isolated_and_clearable(self):
+        """Sessions do not share messages and clear removes the session"""
+        history = CacheChatMessageHistory(self.session_id)
+        other_history = CacheChatMessageHistory(str(uuid.uuid4()))
+
+        history.add_user_message('Hello')
+
+        self.assertEqual(other_history.messages, [])
+
+        history.clear()
+
+        self.assertEqual(history.messages, [])
@@ -0,0 +1,105 @@
+from django.test import TestCase
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.chatbot.config import DIMENSIONS
+from src.chatbot.sync import assign_chunk_ids, sync_documents
+from src.chatbot.vectorstores import LocalVectorStore
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    """Fake embedding that records how many texts were embedded"""
+
+    embedded: int = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+
+        return super().embed_documents(texts)
+
+
+def _product_chunk(product_id, price):
+    return Document(
+        page_content=(
+            f'Collection: Daisy; Category: rings; Product ID: {product_id}; '
+            f'Sizes: Size: Small - Price: ${price}; Average Rating: 4.5/5 stars;'
+        )
+    )
+
+
+class VectorIndexSyncTestCase(TestCase):
+    """Test suite for the incremental vector index sync"""
+
+    def setUp(self):
+        self.embedding = CountingEmbedding(size=DIMENSIONS)
+        self.store = LocalVectorStore(self.embedding)
+
+        self.store_sync(
+            [_product_chunk(1, 100), _product_chunk(2, 200)],
+            batch_size=1,
+        )
+        self.embedding.embedded = 0
+
+    def store_sync(self, chunks, **kwargs):
+        return sync_documents(
+            self.store,
+            assign_chunk_ids(chunks, 'product'),
+            self.store.get_content_hashes(),
+            **kwargs,
+        )
+
+    def test_chunks_get_stable_product_ids(self):
+        """Product chunks are keyed by category and product id"""
+        self.assertEqual(
+            self.store.ids, ['product-rings-1', 'product-rings-2']
+        )
+
+    def test_unchanged_catalog_embeds_nothing(self):
+        """A re-sync without edits embeds no chunk"""
+        stats = self.store_sync(
+            [_product_chunk(1, 100), _product_chunk(2, 200)]
+        )
+
+        self.assertEqual(
+            stats, {'added': 0, 'updated': 0, 'deleted': 0, 'unchanged': 2}
+        )
+        self.assertEqual(self.embedding.embedded, 0)
+
+    def test_price_change_re_embeds_only_that_product(self):
+        """An edited product replaces its own vector"""
+        stats = self.store_sync(
+            [_product_chunk(1, 150), _product_chunk(2, 200)]
+        )
+
+        self.assertEqual(stats['updated'], 1)
+        self.assertEqual(self.embedding.embedded, 1)
+        self.assertEqual(len(self.store.ids), 2)
+        self.assertIn(
+            '$150',
+            self.store.similarity_search(
+                _product_chunk(1, 150).page_content, k=1
+            )[0].page_content,
+        )
+
+    def test_removed_product_is_deleted_after_upserts(self):
+        """Vectors of removed products are deleted, new ones added"""
+        stats = self.store_sync(
+            [_product_chunk(2, 200), _product_chunk(3, 300)]
+        )
+
+        self.assertEqual(
+            stats, {'added': 1, 'updated': 0, 'deleted': 1, 'unchanged': 1}
+        )
+        self.assertEqual(
+            self.store.ids, ['product-rings-2', 'product-rings-3']
+        )
+
+    def test_force_re_embeds_every_chunk(self):
+        """Forcing a sync embeds all chunks without emptying the store"""
+        stats = self.store_sync(
+            [_product_chunk(1, 100), _product_chunk(2, 200)], force=True
+        )
+
+        self.assertEqual(stats['updated'], 2)
+        self.assertEqual(self.embedding.embedded, 2)
+        self.assertEqual(len(self.store.ids), 2)
@@ -0,0 +1,89 @@
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+from django.test import TestCase, override_settings
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.chatbot.adapters import VectorStoreAdapter
+from src.chatbot.config import DIMENSIONS
+from src.chatbot.vectorstores import LocalVectorStore
+
+
+class LocalVectorStoreTestCase(TestCase):
+    """Test suite for the in-process NumPy vector store"""
+
+    TEXTS = [
+        'Gold ring with diamonds',
+        'Silver necklace with pearls',
+        'Rose gold earrings with rubies',
+        'Boutique opening hours',
+    ]
+
+    def setUp(self):
+        self.embedding = DeterministicFakeEmbedding(size=DIMENSIONS)
+        self.store = LocalVectorStore.from_texts(
+            self.TEXTS,
+            self.embedding,
+            metadatas=[{'index': index} for index in range(len(self.TEXTS))],
+        )
+
+    def test_rows_are_normalized(self):
+        """Stored embeddings are unit vectors"""
+        self.assertEqual(self.store.vectors.shape, (4, DIMENSIONS))
+        np.testing.assert_allclose(
+            np.linalg.norm(self.store.vectors, axis=1), 1, rtol=1e-5
+        )
+
+    def test_similarity_search_returns_best_matches_first(self):
+        """The exact text ranks first and k bounds the results"""
+        results = self.store.similarity_search_with_score(self.TEXTS[2], k=2)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0][0].page_content, self.TEXTS[2])
+        self.assertAlmostEqual(results[0][1], 1, places=5)
+        self.assertGreaterEqual(results[0][1], results[1][1])
+
+    async def test_async_search_matches_sync_search(self):
+        """The async path used by the ASGI view returns the same results"""
+        results = await self.store.asimilarity_search(self.TEXTS[0], k=3)
+
+        self.assertEqual(
+            results, self.store.similarity_search(self.TEXTS[0], k=3)
+        )
+
+    def test_saved_index_is_memory_mapped_on_load(self):
+        """An index written by save is mapped back with its documents"""
+        with tempfile.TemporaryDirectory() as path:
+            self.store.save(path)
+            loaded = LocalVectorStore.load(path, self.embedding)
+
+            self.assertIsInstance(loaded.vectors, np.memmap)
+            self.assertEqual(loaded.ids, self.store.ids)
+            self.assertEqual(
+                loaded.similarity_search(self.TEXTS[1], k=1)[0].metadata,
+                {'index': 1},
+            )
+
+    def test_load_without_index_raises(self):
+        """Loading before the index is built asks to run the command"""
+        with tempfile.TemporaryDirectory() as path:
+            with self.assertRaises(ValueError):
+                LocalVectorStore.load(path, self.embedding)
+
+    def test_adapter_uses_local_backend_when_configured(self):
+        """The adapter maps the local index when the setting selects it"""
+        with tempfile.TemporaryDirectory() as path:
+            self.store.save(path)
+
+            with override_settings(
+                CHATBOT_VECTOR_STORE='local',
+                CHATBOT_LOCAL_INDEX_DIR=path,
+            ), patch(
+                'src.chatbot.adapters.OpenAIEmbeddings',
+                return_value=self.embedding,
+            ):
+                vectorstore = VectorStoreAdapter._initialize()
+
+            self.assertIsInstance(vectorstore, LocalVectorStore)
+            self.assertEqual(len(vectorstore.documents), len(self.TEXTS))
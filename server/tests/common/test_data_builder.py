@@ -12,6 +12,9 @@ from src.products.models import (
     Inventory,
 )
 
+from src.orders.models import Order, OrderGroup
+from src.orders.services import OrderService
+
 UserModel = get_user_model()
 
 
@@ -137,6 +140,69 @@ class TestDataBuilder:
             'content_type': ContentType.objects.get_for_model(Earring),
         }
 
+    @classmethod
+    def create_listed_product(cls, prefix, price=100.00, quantity=10):
+        """
+        Create an earring with its own set of image URLs. Unlike
+        `create_product_with_inventory`, several of these can coexist,
+        since every image URL is unique. Pass `price=None` for a product
+        without any inventory.
+        """
+        attributes = cls.create_unique_product_data(prefix)
+        unique_id = str(uuid.uuid4())[:8]
+
+        product = Earring.objects.create(
+            **{
+                f'{position}_image': f'https://{unique_id}.example.com/{position}.jpg'
+                for position in ('first', 'second', 'third', 'fourth')
+            },
+            collection=attributes['collection'],
+            color=attributes['color'],
+            metal=attributes['metal'],
+            stone=attributes['stone'],
+        )
+
+        inventory = None
+        if price is not None:
+            inventory = Inventory.objects.create(
+                quantity=quantity,
+                price=price,
+                size=attributes['size'],
+                content_type=ContentType.objects.get_for_model(Earring),
+                object_id=product.id,
+            )
+
+        return {
+            'product': product,
+            'inventory': inventory,
+            **attributes,
+        }
+
+    @classmethod
+    def create_order(cls, user, inventory, quantity=1, **kwargs):
+        """
+        Create a single-line checkout: an order group with its stored
+        totals and the order line with its price and product snapshot.
+        Extra keyword arguments (e.g. `status`) apply to both.
+        """
+        order_group = OrderGroup.objects.create(
+            user=user,
+            total_price=inventory.price * quantity,
+            total_items=quantity,
+            **kwargs,
+        )
+
+        return Order.objects.create(
+            user=user,
+            inventory=inventory,
+            quantity=quantity,
+            order_group=order_group,
+            unit_price=inventory.price,
+            total_price=inventory.price * quantity,
+            product_snapshot=OrderService.build_product_snapshot(inventory),
+            **kwargs,
+        )
+
     @classmethod
     def create_unique_user(
         cls, email_prefix='test', username_prefix='testuser'
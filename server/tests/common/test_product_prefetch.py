@@ -0,0 +1,111 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.common.mixins import InventoryMixin
+from src.orders.models import Order
+from src.orders.services import OrderService
+from src.shopping_bags.models import ShoppingBag
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductPrefetchTest(TestCase):
+
+    def setUp(self):
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_prefetch', '_prefetch'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _create_inventories(self, count):
+        return [
+            TestDataBuilder.create_listed_product(f'Prefetch{index}')[
+                'inventory'
+            ]
+            for index in range(count)
+        ]
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+
+        return len(context.captured_queries)
+
+    def test_prefetched_products_serve_product_info(self):
+        inventory = self._create_inventories(1)[0]
+        bag_item = ShoppingBag.objects.create(
+            user=self.user, inventory=inventory, quantity=1
+        )
+        rows = list(
+            ShoppingBag.objects.filter(pk=bag_item.pk).select_related(
+                'inventory__size'
+            )
+        )
+
+        with self.assertNumQueries(1):
+            InventoryMixin.prefetch_products(rows)
+
+        with self.assertNumQueries(0):
+            InventoryMixin.prefetch_products(rows)
+            info = InventoryMixin.get_product_info(rows[0])
+
+        self.assertEqual(info['metal'], inventory.product.metal.name)
+
+    def test_bag_list_queries_do_not_grow_with_items(self):
+        url = reverse('shopping-bag-list')
+
+        for inventory in self._create_inventories(2):
+            ShoppingBag.objects.create(
+                user=self.user, inventory=inventory, quantity=1
+            )
+
+        small_bag = self._count_queries(url)
+
+        for inventory in self._create_inventories(18):
+            ShoppingBag.objects.create(
+                user=self.user, inventory=inventory, quantity=1
+            )
+
+        self.assertEqual(self._count_queries(url), small_bag)
+
+    def test_order_list_queries_do_not_grow_with_items(self):
+        url = reverse('order-list')
+
+        for inventory in self._create_inventories(2):
+            ShoppingBag.objects.create(
+                user=self.user, inventory=inventory, quantity=1
+            )
+
+        self.client.post(
+            reverse('order-create-from-shopping-bag'),
+            {
+                'card_number': '4111 1111 1111 1111',
+                'card_holder_name': 'John Doe',
+                'expiry_date': '12/99',
+                'cvv': '123',
+            },
+            format='json',
+        )
+        small_history = self._count_queries(url)
+
+        Order.objects.bulk_create(
+            Order(
+                user=self.user,
+                inventory=inventory,
+                quantity=1,
+                order_group=Order.objects.first().order_group,
+                unit_price=inventory.price,
+                total_price=inventory.price,
+                product_snapshot=OrderService.build_product_snapshot(
+                    inventory
+                ),
+            )
+            for inventory in self._create_inventories(10)
+        )
+
+        self.assertEqual(self._count_queries(url), small_history)
@@ -0,0 +1,151 @@
+import threading
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from rest_framework.exceptions import ValidationError
+
+from src.orders.models import Order
+from src.orders.services import OrderService
+from src.products.models import Inventory, ProductListing
+from src.shopping_bags.models import ShoppingBag
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class CheckoutStockTest(TestCase):
+
+    def setUp(self):
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_checkout', '_checkout'
+        )
+        self.first = TestDataBuilder.create_listed_product(
+            'CheckoutFirst', quantity=5
+        )
+        self.second = TestDataBuilder.create_listed_product(
+            'CheckoutSecond', quantity=2
+        )
+
+    def _add_to_bag(self, inventory, quantity):
+        ShoppingBag.objects.create(
+            user=self.user,
+            inventory=inventory,
+            quantity=quantity,
+        )
+
+    def test_checkout_decrements_stock_and_syncs_listing(self):
+        self._add_to_bag(self.first['inventory'], 3)
+        self._add_to_bag(self.second['inventory'], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            orders = OrderService.process_order_from_shopping_bag(self.user)
+
+        self.assertEqual(len(orders), 2)
+        self.assertEqual(len({order.order_group for order in orders}), 1)
+
+        self.first['inventory'].refresh_from_db()
+        self.second['inventory'].refresh_from_db()
+        self.assertEqual(self.first['inventory'].quantity, 2)
+        self.assertEqual(self.second['inventory'].quantity, 0)
+
+        listing = ProductListing.objects.get(
+            object_id=self.second['product'].id,
+            category='earring',
+        )
+        self.assertTrue(listing.is_sold_out)
+
+    def test_insufficient_stock_rejects_every_short_line(self):
+        self._add_to_bag(self.first['inventory'], 6)
+        self._add_to_bag(self.second['inventory'], 3)
+
+        with self.assertRaises(ValidationError) as context:
+            OrderService.process_order_from_shopping_bag(self.user)
+
+        errors = context.exception.detail['shopping_bag']
+        self.assertEqual(
+            set(errors),
+            {
+                self.first['inventory'].id,
+                self.second['inventory'].id,
+            },
+        )
+
+        self.first['inventory'].refresh_from_db()
+        self.assertEqual(self.first['inventory'].quantity, 5)
+        self.assertFalse(Order.objects.filter(user=self.user).exists())
+        self.assertEqual(ShoppingBag.objects.filter(user=self.user).count(), 2)
+
+    def test_checkout_query_count_does_not_grow_with_bag(self):
+        self._add_to_bag(self.first['inventory'], 1)
+
+        # Bag fetch, row locks, other shoppers' holds, stock UPDATE, group
+        # INSERT, products for the line snapshots (one query per product
+        # type), order INSERT, bag DELETE (collect, holds, items) and the
+        # SAVEPOINT and RELEASE of the atomic block
+        with self.assertNumQueries(12):
+            OrderService.process_order_from_shopping_bag(self.user)
+
+        self._add_to_bag(self.first['inventory'], 1)
+        self._add_to_bag(self.second['inventory'], 1)
+
+        with self.assertNumQueries(12):
+            OrderService.process_order_from_shopping_bag(self.user)
+
+
+class ConcurrentCheckoutTest(TransactionTestCase):
+
+    CHECKOUTS = 6
+    STOCK = 3
+
+    def setUp(self):
+        data = TestDataBuilder.create_listed_product(
+            'Concurrent', quantity=self.STOCK
+        )
+        self.inventory = data['inventory']
+        self.users = [
+            TestDataBuilder.create_authenticated_user(
+                f'_concurrent_{index}', f'_concurrent_{index}'
+            )
+            for index in range(self.CHECKOUTS)
+        ]
+
+        for user in self.users:
+            ShoppingBag.objects.create(
+                user=user,
+                inventory=self.inventory,
+                quantity=1,
+            )
+
+    def test_concurrent_checkouts_never_oversell(self):
+        barrier = threading.Barrier(self.CHECKOUTS)
+        outcomes = []
+
+        def checkout(user):
+            try:
+                barrier.wait()
+                OrderService.process_order_from_shopping_bag(user)
+                outcomes.append('ordered')
+
+            except ValidationError:
+                outcomes.append('rejected')
+
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=checkout, args=(user,))
+            for user in self.users
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(outcomes.count('ordered'), self.STOCK)
+        self.assertEqual(
+            outcomes.count('rejected'), self.CHECKOUTS - self.STOCK
+        )
+        self.assertEqual(
+            Inventory.objects.get(pk=self.inventory.pk).quantity, 0
+        )
+        self.assertEqual(Order.objects.count(), self.STOCK)
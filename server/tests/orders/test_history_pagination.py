@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.orders.models import OrderGroup
+from src.orders.views import OrderGroupPagination
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class OrderHistoryPaginationTest(TestCase):
+
+    def setUp(self):
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_history', '_history'
+        )
+        self.inventory = TestDataBuilder.create_listed_product('History')[
+            'inventory'
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        # More checkouts than fit on one page, each a day older
+        now = timezone.now()
+        self.order_groups = []
+
+        for days in range(OrderGroupPagination.page_size + 2):
+            order_group = TestDataBuilder.create_order(
+                self.user, self.inventory
+            ).order_group
+            OrderGroup.objects.filter(pk=order_group.pk).update(
+                created_at=now - timedelta(days=days)
+            )
+            self.order_groups.append(str(order_group.pk))
+
+    def test_history_pages_newest_first_with_cursor(self):
+        response = self.client.get(reverse('order-list'))
+
+        first_page = [
+            str(item['order_group']) for item in response.data['results']
+        ]
+        self.assertEqual(
+            first_page,
+            self.order_groups[: OrderGroupPagination.page_size],
+        )
+        self.assertIsNone(response.data['previous'])
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get(response.data['next'])
+
+        second_page = [
+            str(item['order_group']) for item in response.data['results']
+        ]
+        self.assertEqual(
+            second_page,
+            self.order_groups[OrderGroupPagination.page_size :],
+        )
+        self.assertIsNone(response.data['next'])
+
+    def test_history_list_lines_are_lightweight(self):
+        response = self.client.get(reverse('order-list'))
+        line = response.data['results'][0]['products'][0]
+
+        self.assertEqual(
+            set(line),
+            {
+                'id',
+                'quantity',
+                'product_info',
+                'product_content_type',
+                'product_object_id',
+            },
+        )
+
+    def test_detail_returns_full_lines_of_own_checkout(self):
+        response = self.client.get(
+            reverse('order-detail', args=[self.order_groups[0]])
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        line = response.data['products'][0]
+        self.assertEqual(line['inventory'], self.inventory.id)
+        self.assertIn('total_price', line)
+
+        other_user = TestDataBuilder.create_authenticated_user(
+            '_history_other', '_history_other'
+        )
+        self.client.force_authenticate(user=other_user)
+
+        response = self.client.get(
+            reverse('order-detail', args=[self.order_groups[0]])
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,62 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.orders.models import Order
+from src.orders.services import OrderService
+from src.products.models import Inventory
+from src.shopping_bags.models import ShoppingBag
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class OrderLineSnapshotTest(TestCase):
+
+    def setUp(self):
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_snapshot', '_snapshot'
+        )
+        self.data = TestDataBuilder.create_listed_product(
+            'Snapshot', price=19.99
+        )
+        ShoppingBag.objects.create(
+            user=self.user, inventory=self.data['inventory'], quantity=3
+        )
+        OrderService.process_order_from_shopping_bag(self.user)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_checkout_stores_price_and_product_snapshot(self):
+        order = Order.objects.get(user=self.user)
+        product = self.data['product']
+
+        self.assertEqual(order.unit_price, Decimal('19.99'))
+        self.assertEqual(order.total_price, Decimal('59.97'))
+        self.assertEqual(order.product_snapshot['product_id'], product.id)
+        self.assertEqual(order.product_snapshot['content_type'], 'earring')
+        self.assertEqual(order.product_snapshot['category'], 'Earring')
+        self.assertEqual(order.product_snapshot['metal'], product.metal.name)
+
+    def test_history_keeps_checkout_price_after_repricing(self):
+        Inventory.objects.filter(pk=self.data['inventory'].pk).update(
+            price=Decimal('999.00')
+        )
+
+        order_group = Order.objects.get(user=self.user).order_group_id
+        response = self.client.get(reverse('order-detail', args=[order_group]))
+        line = response.data['products'][0]
+
+        self.assertEqual(line['product_info']['price'], 19.99)
+        self.assertEqual(line['total_price'], Decimal('59.97'))
+        self.assertNotIn('size', line['product_info'])
+
+    def test_history_does_not_read_catalog_tables(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('order-list'))
+
+        for query in queries.captured_queries:
+            self.assertNotIn('"products_', query['sql'])
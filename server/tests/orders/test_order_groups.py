@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.orders.models import OrderGroup
+from src.orders.services import OrderService
+from src.shopping_bags.models import ShoppingBag
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class OrderGroupTest(TestCase):
+
+    def setUp(self):
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_order_groups', '_order_groups'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _checkout(self, *lines):
+        for price, quantity in lines:
+            inventory = TestDataBuilder.create_listed_product(
+                'OrderGroup', price=price
+            )['inventory']
+            ShoppingBag.objects.create(
+                user=self.user, inventory=inventory, quantity=quantity
+            )
+
+        return OrderService.process_order_from_shopping_bag(self.user)
+
+    def test_checkout_stores_group_totals(self):
+        orders = self._checkout((19.99, 3), (100.00, 1))
+
+        order_group = OrderGroup.objects.get(user=self.user)
+
+        self.assertEqual(order_group.total_price, Decimal('159.97'))
+        self.assertEqual(order_group.total_items, 4)
+        self.assertEqual(
+            {order.order_group_id for order in orders}, {order_group.pk}
+        )
+        self.assertEqual(order_group.orders.count(), 2)
+
+    def test_history_serves_stored_totals(self):
+        self._checkout((19.99, 3), (100.00, 1))
+
+        response = self.client.get(reverse('order-list'))
+
+        results = response.data['results']
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['total_price'], 159.97)
+        self.assertEqual(results[0]['total_items'], 4)
+        self.assertEqual(len(results[0]['products']), 2)
+
+    def test_history_queries_do_not_grow_with_groups(self):
+        self._checkout((50.00, 1), (60.00, 1))
+
+        with CaptureQueriesContext(connection) as few_groups:
+            self.client.get(reverse('order-list'))
+
+        for _ in range(5):
+            self._checkout((70.00, 2), (80.00, 1))
+
+        with CaptureQueriesContext(connection) as many_groups:
+            response = self.client.get(reverse('order-list'))
+
+        self.assertEqual(len(response.data['results']), 6)
+        self.assertEqual(
+            len(many_groups.captured_queries),
+            len(few_groups.captured_queries),
+        )
@@ -169,18 +169,20 @@ class OrderServiceTest(TestCase):
         with self.assertRaises(ValidationError):
             OrderService.process_order_from_shopping_bag(user)
 
-    def test_get_user_orders_and_grouped(self):
+    def test_get_user_orders_and_order_groups(self):
         user = TestDataBuilder.create_authenticated_user(
             '_grouped_user', '_grouped_user'
         )
-        order1 = Order.objects.create(
+        order1 = TestDataBuilder.create_order(
             user=user, inventory=self.inventory, quantity=1, status='PE'
         )
-        order2 = Order.objects.create(
+        order2 = TestDataBuilder.create_order(
             user=user, inventory=self.inventory, quantity=2, status='CO'
         )
         orders = OrderService.get_user_orders(user)
-        grouped = OrderService.get_user_orders_grouped(user)
+        order_groups = OrderService.get_user_order_groups(user)
         self.assertEqual(orders.count(), 2)
-        self.assertIn(str(order1.order_group), grouped)
-        self.assertIn(str(order2.order_group), grouped)
+        self.assertEqual(
+            {order_group.pk for order_group in order_groups},
+            {order1.order_group_id, order2.order_group_id},
+        )
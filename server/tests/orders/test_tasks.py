@@ -5,7 +5,7 @@ from django.test import TestCase
 from tests.common.test_data_builder import TestDataBuilder
 from src.orders.tasks import complete_old_orders
 from src.orders.choices import OrderStatusChoices
-from src.orders.models import Order
+from src.orders.models import Order, OrderGroup
 
 
 class CompleteOldOrdersTaskTest(TestCase):
@@ -22,7 +22,7 @@ class CompleteOldOrdersTaskTest(TestCase):
         )
         user = TestDataBuilder.create_authenticated_user()
 
-        old_order = Order.objects.create(
+        old_order = TestDataBuilder.create_order(
             inventory=product_with_inventory['inventory'],
             user=user,
             quantity=1,
@@ -38,3 +38,51 @@ class CompleteOldOrdersTaskTest(TestCase):
         old_order.refresh_from_db()
 
         self.assertEqual(old_order.status, OrderStatusChoices.COMPLETED)
+
+    def test_completes_in_batches_and_reports_counts(self):
+        product_with_inventory = (
+            TestDataBuilder.create_product_with_inventory()
+        )
+        user = TestDataBuilder.create_authenticated_user()
+
+        orders = [
+            TestDataBuilder.create_order(
+                user, product_with_inventory['inventory']
+            )
+            for _ in range(3)
+        ]
+        recent_order = TestDataBuilder.create_order(
+            user, product_with_inventory['inventory']
+        )
+
+        old_ids = [order.id for order in orders]
+        old_group_ids = [order.order_group_id for order in orders]
+        Order.objects.filter(id__in=old_ids).update(
+            created_at=self.now - timedelta(days=2)
+        )
+        OrderGroup.objects.filter(id__in=old_group_ids).update(
+            created_at=self.now - timedelta(days=2)
+        )
+
+        progress = []
+        completed = Order.objects.complete_pending_before(
+            self.now - timedelta(days=1),
+            batch_size=2,
+            on_batch=progress.append,
+        )
+
+        self.assertEqual(completed, 3)
+        self.assertEqual(progress, [2, 3])
+
+        result = complete_old_orders(batch_size=2)
+
+        self.assertEqual(result, {'order groups': 3, 'orders': 0})
+        self.assertFalse(
+            OrderGroup.objects.pending().filter(id__in=old_group_ids).exists()
+        )
+
+        recent_order.refresh_from_db()
+        self.assertEqual(recent_order.status, OrderStatusChoices.PENDING)
+        self.assertEqual(
+            recent_order.order_group.status, OrderStatusChoices.PENDING
+        )
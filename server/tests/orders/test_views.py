@@ -19,6 +19,7 @@ from src.products.models import (
 )
 from src.shopping_bags.models import ShoppingBag
 from rest_framework.test import APIClient
+from tests.common.test_data_builder import TestDataBuilder
 
 User = get_user_model()
 
@@ -52,13 +53,13 @@ class OrderViewSetTest(TestCase):
             price=Decimal('199.99'),
             size=self.size,
         )
-        self.order1 = Order.objects.create(
+        self.order1 = TestDataBuilder.create_order(
             user=self.user,
             inventory=self.inventory,
             quantity=2,
             status=OrderStatusChoices.PENDING,
         )
-        self.order2 = Order.objects.create(
+        self.order2 = TestDataBuilder.create_order(
             user=self.user,
             inventory=self.inventory,
             quantity=1,
@@ -0,0 +1,129 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.cache import (
+    build_catalog_cache_key,
+    bump_catalog_version,
+    get_catalog_cache,
+    get_catalog_version,
+)
+from src.products.models import Inventory, Review
+from src.products.models.product import Color, Earring
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class CatalogVersionTest(TestCase):
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+    def test_bump_changes_category_and_global_versions(self):
+        earring_version = get_catalog_version('earring')
+        global_version = get_catalog_version('')
+        watch_version = get_catalog_version('watch')
+
+        bump_catalog_version('earring')
+
+        self.assertNotEqual(get_catalog_version('earring'), earring_version)
+        self.assertNotEqual(get_catalog_version(''), global_version)
+        self.assertEqual(get_catalog_version('watch'), watch_version)
+
+    def test_cache_key_ignores_parameter_order(self):
+        first = build_catalog_cache_key(
+            'list', 'earring', {'colors': ['1', '2'], 'ordering': ['rating']}
+        )
+        second = build_catalog_cache_key(
+            'list', 'earring', {'ordering': ['rating'], 'colors': ['1', '2']}
+        )
+
+        self.assertEqual(first, second)
+
+    def test_evicted_version_does_not_reuse_old_keys(self):
+        key = build_catalog_cache_key('list', 'earring', {})
+
+        get_catalog_cache().delete('catalog:version:earring')
+
+        self.assertNotEqual(
+            build_catalog_cache_key('list', 'earring', {}), key
+        )
+
+
+class CatalogResponseCacheTest(TestCase):
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+        self.client = APIClient()
+        self.data = TestDataBuilder.create_listed_product('Cached')
+        self.url = reverse('earrings-list')
+
+    def test_repeated_list_request_is_served_from_cache(self):
+        first = self.client.get(self.url, {'colors': [self.data['color'].id]})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(
+                self.url, {'colors': [self.data['color'].id]}
+            )
+
+        self.assertEqual(first.data, second.data)
+
+    def test_inventory_write_invalidates_list(self):
+        self.client.get(self.url)
+
+        inventory = self.data['inventory']
+        inventory.price = 999
+        inventory.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['results'][0]['min_price'], '999.00')
+
+    def test_review_write_invalidates_list(self):
+        self.client.get(self.url)
+
+        Review.objects.create(
+            rating=5,
+            comment='Great',
+            content_type=ContentType.objects.get_for_model(Earring),
+            object_id=self.data['product'].id,
+            user=TestDataBuilder.create_authenticated_user(),
+            approved=True,
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['results'][0]['average_rating'], '5.00')
+
+    def test_product_save_invalidates_attribute_counts(self):
+        url = reverse('color-retrieve')
+        self.client.get(url, {'category': 'earrings'})
+
+        TestDataBuilder.create_listed_product('Another')
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'category': 'earrings'})
+
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_attribute_create_and_delete_invalidate_attribute_list(self):
+        url = reverse('color-retrieve')
+        count = len(self.client.get(url).data['results'])
+
+        color = Color.objects.create(name='Unused Color')
+        self.assertEqual(len(self.client.get(url).data['results']), count + 1)
+
+        color.delete()
+        self.assertEqual(len(self.client.get(url).data['results']), count)
+
+    def test_other_category_write_keeps_list_cached(self):
+        self.client.get(self.url)
+
+        Inventory.objects.filter(pk=self.data['inventory'].pk).update(
+            quantity=0
+        )
+        bump_catalog_version('watch')
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
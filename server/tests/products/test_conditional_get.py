@@ -0,0 +1,81 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.cache import get_catalog_cache
+from src.products.tasks import refresh_related_products
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class CatalogConditionalGetTest(TestCase):
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+        self.client = APIClient()
+        self.data = TestDataBuilder.create_listed_product('Etag')
+        self.list_url = reverse('earrings-list')
+        self.item_url = reverse(
+            'earrings-item', kwargs={'pk': self.data['product'].id}
+        )
+        self.attribute_url = reverse('color-retrieve')
+
+    def test_responses_carry_validators(self):
+        for url in (self.list_url, self.item_url, self.attribute_url):
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.has_header('ETag'))
+            self.assertTrue(response.has_header('Last-Modified'))
+
+    def test_matching_etag_returns_304_without_queries(self):
+        for url in (self.list_url, self.item_url, self.attribute_url):
+            etag = self.client.get(url)['ETag']
+
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response['ETag'], etag)
+
+    def test_catalog_write_changes_etag(self):
+        etag = self.client.get(self.item_url)['ETag']
+
+        inventory = self.data['inventory']
+        inventory.quantity = 0
+        inventory.save()
+
+        response = self.client.get(self.item_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_related_products_refresh_changes_item_etag(self):
+        etag = self.client.get(self.item_url)['ETag']
+
+        refresh_related_products()
+
+        response = self.client.get(self.item_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_depends_on_query_params(self):
+        etag = self.client.get(self.list_url)['ETag']
+
+        response = self.client.get(
+            self.list_url,
+            {'ordering': 'price_asc'},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since_returns_304(self):
+        last_modified = self.client.get(self.list_url)['Last-Modified']
+
+        response = self.client.get(
+            self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,28 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from src.products.models import Inventory, ProductListing, Review
+
+
+class ExplainStorefrontQueriesCommandTest(TestCase):
+
+    def test_reports_plans_and_rolls_back_generated_data(self):
+        out = StringIO()
+
+        call_command(
+            'explain_storefront_queries',
+            products=3,
+            reviews=2,
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn('Latest approved reviews', output)
+        self.assertIn('ms', output)
+        self.assertIn('rolled back', output)
+
+        self.assertFalse(Inventory.objects.exists())
+        self.assertFalse(Review.objects.exists())
+        self.assertFalse(ProductListing.objects.exists())
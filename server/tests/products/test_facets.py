@@ -0,0 +1,87 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.cache import get_catalog_cache
+from src.products.models.product import Earring
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductFacetViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.first = TestDataBuilder.create_listed_product('Facet A')
+        cls.second = TestDataBuilder.create_listed_product('Facet B')
+
+        # A third product sharing the first product's color only
+        cls.third = TestDataBuilder.create_listed_product('Facet C')
+        product = cls.third['product']
+        product.color = cls.first['color']
+        product.save()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('product-facets', kwargs={'category': 'earrings'})
+        get_catalog_cache().clear()
+
+    @staticmethod
+    def _counts(facet):
+        return {item['id']: item['count'] for item in facet}
+
+    def test_returns_counts_for_all_dimensions(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            set(response.data),
+            {'collections', 'colors', 'metals', 'stones'},
+        )
+        self.assertEqual(
+            self._counts(response.data['colors']),
+            {self.first['color'].id: 2, self.second['color'].id: 1},
+        )
+
+    def test_dimension_ignores_its_own_selection(self):
+        response = self.client.get(
+            self.url, {'colors': [self.second['color'].id]}
+        )
+
+        # Colors are still counted over the whole category...
+        self.assertEqual(
+            self._counts(response.data['colors']),
+            {self.first['color'].id: 2, self.second['color'].id: 1},
+        )
+        # ...while other dimensions are narrowed to the selected color
+        self.assertEqual(
+            self._counts(response.data['collections']),
+            {self.second['collection'].id: 1},
+        )
+
+    def test_single_query_and_cached_per_normalized_selection(self):
+        first_color = self.first['color'].id
+        second_color = self.second['color'].id
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url, {'colors': [first_color, second_color]})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                self.url, {'colors': [second_color, first_color]}
+            )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_category_returns_not_found(self):
+        response = self.client.get(
+            reverse('product-facets', kwargs={'category': 'hats'})
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_other_categories_are_not_counted(self):
+        response = self.client.get(
+            reverse('product-facets', kwargs={'category': 'watches'})
+        )
+
+        self.assertTrue(Earring.objects.exists())
+        self.assertEqual(response.data['colors'], [])
@@ -0,0 +1,189 @@
+from decimal import Decimal
+from importlib import import_module
+from io import StringIO
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.cache import get_catalog_cache
+from src.products.models import Inventory, ProductListing, Review
+from src.products.models.product import Earring
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductListingSyncTest(TestCase):
+
+    def setUp(self):
+        self.data = TestDataBuilder.create_product_with_inventory(
+            'Listing', price=120.00
+        )
+        self.product = self.data['product']
+        self.inventory = self.data['inventory']
+        self.content_type = self.data['content_type']
+
+    def _get_listing(self):
+        return ProductListing.objects.get(
+            content_type=self.content_type,
+            object_id=self.product.id,
+        )
+
+    def test_listing_created_with_product_and_inventory(self):
+        listing = self._get_listing()
+
+        self.assertEqual(listing.category, 'earring')
+        self.assertEqual(listing.collection_id, self.data['collection'].id)
+        self.assertEqual(listing.collection_name, self.data['collection'].name)
+        self.assertEqual(listing.min_price, Decimal('120.00'))
+        self.assertEqual(listing.max_price, Decimal('120.00'))
+        self.assertFalse(listing.is_sold_out)
+        self.assertEqual(listing.total_quantity, self.inventory.quantity)
+        self.assertEqual(listing.in_stock_size_count, 1)
+
+    def test_inventory_write_updates_price_range_and_stock(self):
+        Inventory.objects.create(
+            quantity=0,
+            price=80.00,
+            size=self.data['size'],
+            content_type=self.content_type,
+            object_id=self.product.id,
+        )
+        self.assertEqual(self._get_listing().min_price, Decimal('80.00'))
+
+        self.inventory.quantity = 0
+        self.inventory.save()
+
+        listing = self._get_listing()
+        self.assertTrue(listing.is_sold_out)
+        self.assertEqual(listing.total_quantity, 0)
+        self.assertEqual(listing.in_stock_size_count, 0)
+
+    def test_only_approved_reviews_count_towards_rating(self):
+        user = TestDataBuilder.create_authenticated_user()
+        other_user = TestDataBuilder.create_authenticated_user()
+
+        review = Review.objects.create(
+            rating=4,
+            comment='Lovely',
+            content_type=self.content_type,
+            object_id=self.product.id,
+            user=user,
+            approved=True,
+        )
+        Review.objects.create(
+            rating=1,
+            comment='Pending',
+            content_type=self.content_type,
+            object_id=self.product.id,
+            user=other_user,
+        )
+        self.assertEqual(self._get_listing().average_rating, Decimal('4.00'))
+
+        review.delete()
+        self.assertEqual(self._get_listing().average_rating, Decimal('0.00'))
+
+    def test_product_delete_removes_listing(self):
+        product_id = self.product.id
+        self.product.delete()
+
+        self.assertFalse(
+            ProductListing.objects.filter(
+                content_type=self.content_type,
+                object_id=product_id,
+            ).exists()
+        )
+
+    def test_rebuild_command_restores_missing_rows(self):
+        ProductListing.objects.all().delete()
+
+        call_command('rebuild_product_listings', stdout=StringIO())
+
+        self.assertEqual(self._get_listing().min_price, Decimal('120.00'))
+
+    def test_migration_builds_rows_for_existing_products(self):
+        migration = import_module(
+            'src.products.migrations.0002_productlisting'
+        )
+        ProductListing.objects.all().delete()
+
+        migration.build_product_listings(apps, None)
+
+        listing = self._get_listing()
+        self.assertEqual(listing.collection_name, self.data['collection'].name)
+        self.assertEqual(listing.min_price, Decimal('120.00'))
+        self.assertFalse(listing.is_sold_out)
+
+    def test_attribute_rename_updates_listing_names(self):
+        collection = self.data['collection']
+        collection.name = 'Renamed'
+        collection.save()
+
+        self.assertEqual(self._get_listing().collection_name, 'Renamed')
+
+
+class ProductListViewTest(TestCase):
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+        self.client = APIClient()
+        self.cheap = TestDataBuilder.create_listed_product(
+            'Cheap', price=50.00
+        )
+        self.expensive = TestDataBuilder.create_listed_product(
+            'Expensive', price=500.00
+        )
+
+    def test_list_is_served_in_requested_order(self):
+        response = self.client.get(
+            reverse('earrings-list'), {'ordering': 'price_asc'}
+        )
+
+        ids = [product['id'] for product in response.data['results']]
+        self.assertEqual(
+            ids, [self.cheap['product'].id, self.expensive['product'].id]
+        )
+        self.assertEqual(
+            response.data['results'][0]['collection__name'],
+            self.cheap['collection'].name,
+        )
+
+    def test_list_applies_attribute_filters(self):
+        response = self.client.get(
+            reverse('earrings-list'),
+            {'colors': [self.expensive['color'].id]},
+        )
+
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(
+            response.data['results'][0]['id'],
+            self.expensive['product'].id,
+        )
+
+    def test_in_stock_filter_hides_sold_out_products(self):
+        inventory = self.cheap['inventory']
+        inventory.quantity = 0
+        inventory.save()
+
+        response = self.client.get(reverse('earrings-list'), {'in_stock': 1})
+
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(
+            response.data['results'][0]['id'],
+            self.expensive['product'].id,
+        )
+        self.assertFalse(response.data['results'][0]['is_sold_out'])
+
+    def test_list_runs_a_single_table_query(self):
+        with self.assertNumQueries(2):
+            # One COUNT for the paginator and one page fetch
+            self.client.get(reverse('earrings-list'))
+
+    def test_listing_category_is_model_name(self):
+        self.assertEqual(
+            set(ProductListing.objects.values_list('category', flat=True)),
+            {ContentType.objects.get_for_model(Earring).model},
+        )
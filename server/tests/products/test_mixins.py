@@ -64,3 +64,13 @@ class FilterMixinTest(TestCase):
         self.assertIn('stone_id__in', q_string)
         self.assertIn('metal__id__in', q_string)
         self.assertIn('collection__id__in', q_string)
+
+    def test_stock_filter_only_when_requested(self):
+        mixin = FilterMixin()
+        mixin.request = self.mock_request
+
+        self.mock_request.query_params.get = Mock(return_value='')
+        self.assertNotIn('is_sold_out', str(mixin._get_filters_for_product()))
+
+        self.mock_request.query_params.get = Mock(return_value='1')
+        self.assertIn('is_sold_out', str(mixin._get_filters_for_product()))
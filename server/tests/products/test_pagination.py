@@ -0,0 +1,143 @@
+import base64
+import json
+from unittest.mock import patch
+
+from django.db.models import Q
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.cache import get_catalog_cache
+from src.products.models import ProductListing
+from src.products.views.base import ProductCursorPagination
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductCursorPaginationTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # Repeated prices exercise the id tiebreaker and the product
+        # without inventory exercises NULL price handling
+        cls.products = [
+            TestDataBuilder.create_listed_product(f'Cursor {index}', price)[
+                'product'
+            ]
+            for index, price in enumerate(
+                [300.00, 100.00, 200.00, 100.00, None, 200.00, 50.00]
+            )
+        ]
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+        self.client = APIClient()
+        self.url = reverse('earrings-list')
+
+    def _walk_cursor_pages(self, ordering):
+        ids = []
+        params = {'pagination': 'cursor', 'ordering': ordering}
+        response = self.client.get(self.url, params)
+
+        while True:
+            ids.extend(product['id'] for product in response.data['results'])
+
+            if response.data['next'] is None:
+                return ids
+
+            response = self.client.get(response.data['next'])
+
+    def _get_all_page_number_ids(self, ordering):
+        response = self.client.get(self.url, {'ordering': ordering})
+        ids = [product['id'] for product in response.data['results']]
+
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            ids.extend(product['id'] for product in response.data['results'])
+
+        return ids
+
+    @patch.object(ProductCursorPagination, 'page_size', 2)
+    def test_cursor_pages_match_offset_ordering(self):
+        for ordering in ('price_asc', 'price_desc', 'rating'):
+            with self.subTest(ordering=ordering):
+                cursor_ids = self._walk_cursor_pages(ordering)
+
+                self.assertEqual(
+                    cursor_ids, self._get_all_page_number_ids(ordering)
+                )
+                self.assertEqual(len(cursor_ids), len(self.products))
+
+    def test_listing_order_states_null_placement(self):
+        for ordering, placement in (
+            ('price_asc', 'NULLS LAST'),
+            ('price_desc', 'NULLS FIRST'),
+        ):
+            with self.subTest(ordering=ordering):
+                queryset = ProductListing.objects.get_product_list(
+                    'earring', Q(), ordering
+                )
+
+                self.assertIn(placement, str(queryset.query))
+
+    def test_count_is_only_returned_on_request(self):
+        response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertNotIn('count', response.data)
+
+        response = self.client.get(
+            self.url, {'pagination': 'cursor', 'count': 'true'}
+        )
+        self.assertEqual(response.data['count'], len(self.products))
+
+    @patch.object(ProductCursorPagination, 'page_size', 2)
+    def test_deep_page_skips_count_query(self):
+        first_page = self.client.get(
+            self.url, {'pagination': 'cursor', 'count': 'true'}
+        )
+
+        self.assertNotIn('count=', first_page.data['next'])
+
+        with self.assertNumQueries(1):
+            self.client.get(first_page.data['next'])
+
+    def test_invalid_cursor_returns_not_found(self):
+        response = self.client.get(
+            self.url, {'pagination': 'cursor', 'cursor': 'not-a-cursor'}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_tampered_cursor_values_return_not_found(self):
+        for ordering, sort_field in (
+            ('price_asc', 'min_price'),
+            ('rating', '-average_rating'),
+        ):
+            for value, last_id in (('abc', 1), ('1.00', 'abc'), ('1', 2**40)):
+                with self.subTest(ordering=ordering, value=value, id=last_id):
+                    cursor = base64.urlsafe_b64encode(
+                        json.dumps(
+                            {'o': sort_field, 'v': value, 'id': last_id}
+                        ).encode()
+                    ).decode()
+
+                    response = self.client.get(
+                        self.url,
+                        {
+                            'pagination': 'cursor',
+                            'ordering': ordering,
+                            'cursor': cursor,
+                        },
+                    )
+
+                    self.assertEqual(response.status_code, 404)
+
+    @patch.object(ProductCursorPagination, 'page_size', 2)
+    def test_cursor_is_rejected_for_a_different_ordering(self):
+        first_page = self.client.get(
+            self.url, {'pagination': 'cursor', 'ordering': 'price_asc'}
+        )
+        next_url = first_page.data['next'].replace('price_asc', 'rating')
+
+        response = self.client.get(next_url)
+
+        self.assertEqual(response.status_code, 404)
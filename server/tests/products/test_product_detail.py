@@ -0,0 +1,83 @@
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.models import Inventory, RelatedProduct, Review, Size
+from src.products.models.product import Earring
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductDetailQueryTest(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.data = TestDataBuilder.create_listed_product('Detail')
+        self.product = self.data['product']
+        self.content_type = ContentType.objects.get_for_model(Earring)
+        self.url = reverse('earrings-item', kwargs={'pk': self.product.id})
+
+        RelatedProduct.objects.refresh_product(self.product)
+
+    def _add_sizes(self, count):
+        for index in range(count):
+            Inventory.objects.create(
+                quantity=1,
+                price=100 + index,
+                size=Size.objects.create(name=f'Detail size {index}'),
+                content_type=self.content_type,
+                object_id=self.product.id,
+            )
+
+    def _add_reviews(self, count, approved=True):
+        for _ in range(count):
+            Review.objects.create(
+                rating=5,
+                comment='Beautiful',
+                content_type=self.content_type,
+                object_id=self.product.id,
+                user=TestDataBuilder.create_authenticated_user(),
+                approved=approved,
+            )
+
+    def test_query_count_does_not_grow_with_sizes_or_reviews(self):
+        # Product with its attributes, inventory with sizes, latest
+        # reviews with their authors, and the related products
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+        self._add_sizes(5)
+        self._add_reviews(6)
+
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        product = response.data['product']
+        self.assertEqual(len(product['inventory']), 6)
+        self.assertEqual(len(product['review']), 4)
+        self.assertEqual(
+            product['collection']['id'], self.data['collection'].id
+        )
+
+    def test_only_approved_reviews_for_shoppers(self):
+        self._add_reviews(2)
+        self._add_reviews(1, approved=False)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data['product']['review']), 2)
+
+    def test_reviewers_also_see_unapproved_reviews(self):
+        self._add_reviews(2)
+        self._add_reviews(1, approved=False)
+
+        reviewer = TestDataBuilder.create_authenticated_user()
+        reviewer.user_permissions.add(
+            Permission.objects.get(codename='approve_review')
+        )
+        self.client.force_authenticate(user=reviewer)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data['product']['review']), 3)
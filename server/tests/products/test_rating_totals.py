@@ -0,0 +1,120 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.test import TestCase
+from django.urls import reverse
+
+from src.products.models import ProductListing, Review
+from src.products.models.product import Earring
+from src.products.serializers.base import AverageRatingField
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ProductRatingTotalsTest(TestCase):
+
+    def setUp(self):
+        self.product = TestDataBuilder.create_listed_product('Rated')[
+            'product'
+        ]
+        self.content_type = ContentType.objects.get_for_model(Earring)
+
+    def _create_review(self, rating, approved=True):
+        return Review.objects.create(
+            rating=rating,
+            comment='Review',
+            content_type=self.content_type,
+            object_id=self.product.id,
+            user=TestDataBuilder.create_authenticated_user(),
+            approved=approved,
+        )
+
+    def _get_totals(self):
+        self.product.refresh_from_db()
+
+        return self.product.rating_sum, self.product.rating_count
+
+    def test_only_approved_reviews_are_counted(self):
+        self._create_review(4)
+        self._create_review(1, approved=False)
+
+        self.assertEqual(self._get_totals(), (4, 1))
+
+    def test_approve_unapprove_edit_and_delete_adjust_totals(self):
+        review = self._create_review(3, approved=False)
+        self._create_review(5)
+
+        review.approved = True
+        review.save()
+        self.assertEqual(self._get_totals(), (8, 2))
+
+        review.rating = 1
+        review.save()
+        self.assertEqual(self._get_totals(), (6, 2))
+
+        review.approved = False
+        review.save()
+        self.assertEqual(self._get_totals(), (5, 1))
+
+        Review.objects.get(pk=review.pk).delete()
+        Review.objects.filter(approved=True).delete()
+        self.assertEqual(self._get_totals(), (0, 0))
+
+    def test_review_loaded_from_database_is_adjusted(self):
+        review = self._create_review(2)
+
+        loaded = Review.objects.get(pk=review.pk)
+        loaded.rating = 4
+        loaded.save()
+
+        self.assertEqual(self._get_totals(), (4, 1))
+
+    def test_deferred_review_falls_back_to_recount(self):
+        review = self._create_review(2)
+
+        deferred = Review.objects.only('id', 'comment').get(pk=review.pk)
+        deferred.comment = 'Edited'
+        deferred.save()
+
+        self.assertEqual(self._get_totals(), (2, 1))
+
+    def test_stale_product_save_keeps_review_totals(self):
+        stale = Earring.objects.get(pk=self.product.pk)
+        self._create_review(5)
+
+        stale.description = 'Edited'
+        stale.save()
+
+        self.assertEqual(self._get_totals(), (5, 1))
+        self.assertEqual(self.product.description, 'Edited')
+
+    def test_item_response_exposes_average_only(self):
+        self._create_review(4)
+
+        response = self.client.get(
+            reverse('earrings-item', kwargs={'pk': self.product.id})
+        )
+        product = response.data['product']
+
+        self.assertEqual(product['average_rating'], 4)
+        self.assertNotIn('rating_sum', product)
+        self.assertNotIn('rating_count', product)
+
+    def test_average_is_read_without_queries(self):
+        self._create_review(4)
+        self._create_review(5)
+        self.product.refresh_from_db()
+
+        with self.assertNumQueries(0):
+            average = AverageRatingField().to_representation(self.product)
+
+        self.assertEqual(average, 4.5)
+
+    def test_product_list_average_uses_approved_reviews(self):
+        self._create_review(4)
+        self._create_review(4)
+        self._create_review(1, approved=False)
+
+        listing = ProductListing.objects.get_product_list(
+            'earring', Q(), 'rating'
+        ).get(object_id=self.product.id)
+
+        self.assertEqual(listing.average_rating, 4)
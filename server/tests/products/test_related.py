@@ -0,0 +1,186 @@
+import uuid
+from importlib import import_module
+from unittest.mock import patch
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.models import RelatedProduct
+from src.products.models.product import Earring, Necklace, Ring, Watch
+from src.products.tasks import refresh_related_products
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class RelatedProductTest(TestCase):
+
+    def setUp(self):
+        self.attributes = TestDataBuilder.create_unique_product_data('Rel')
+
+    def _create(self, model_class, target_gender='F', **overrides):
+        unique_id = str(uuid.uuid4())[:8]
+        fields = {
+            'collection': self.attributes['collection'],
+            'color': self.attributes['color'],
+            'metal': self.attributes['metal'],
+            'stone': self.attributes['stone'],
+            'target_gender': target_gender,
+            **overrides,
+        }
+
+        return model_class.objects.create(
+            **{
+                f'{position}_image': f'https://{unique_id}.example.com/{position}.jpg'
+                for position in ('first', 'second', 'third', 'fourth')
+            },
+            **fields,
+        )
+
+    def _related(self, product, relation):
+        return [
+            (row.related_content_type.model, row.related_object_id)
+            for row in RelatedProduct.objects.get_for_product(product)[
+                relation
+            ]
+        ]
+
+    def test_color_rule_picks_other_types_with_same_color(self):
+        earring = self._create(Earring)
+        other_earring = self._create(Earring)
+        necklace = self._create(Necklace)
+        ring = self._create(Ring)
+
+        RelatedProduct.objects.refresh_product(earring)
+
+        self.assertEqual(
+            self._related(earring, RelatedProduct.RelationChoices.COLOR),
+            [('necklace', necklace.id), ('ring', ring.id)],
+        )
+        self.assertNotIn(
+            ('earring', other_earring.id),
+            self._related(earring, RelatedProduct.RelationChoices.COLOR),
+        )
+
+    def test_gender_rule_for_mens_products_is_capped(self):
+        watches = [self._create(Watch, target_gender='M') for _ in range(7)]
+        ring = self._create(Ring, target_gender='M')
+
+        RelatedProduct.objects.refresh_product(watches[0])
+        related = self._related(
+            watches[0], RelatedProduct.RelationChoices.GENDER
+        )
+
+        # Rings come before watches, then watches by id
+        self.assertEqual(related[0], ('ring', ring.id))
+        self.assertEqual(len(related), 5)
+        self.assertEqual(
+            self._related(watches[0], RelatedProduct.RelationChoices.COLOR),
+            [],
+        )
+
+    @patch(
+        'src.products.managers.related.RelatedProductDefaults.'
+        'COLLECTION_LIMIT',
+        2,
+    )
+    def test_collection_rule_is_limited(self):
+        earrings = [self._create(Earring) for _ in range(3)]
+
+        RelatedProduct.objects.refresh_product(earrings[0])
+
+        self.assertEqual(
+            self._related(
+                earrings[0], RelatedProduct.RelationChoices.COLLECTION
+            ),
+            [('earring', earrings[0].id), ('earring', earrings[1].id)],
+        )
+
+    def test_affected_products_are_refreshed(self):
+        earring = self._create(Earring)
+        necklace = self._create(Necklace)
+
+        RelatedProduct.objects.refresh_affected_by(necklace)
+
+        self.assertEqual(
+            self._related(earring, RelatedProduct.RelationChoices.COLOR),
+            [('necklace', necklace.id)],
+        )
+
+    def test_deleted_product_is_dropped_from_lists(self):
+        earring = self._create(Earring)
+        necklace = self._create(Necklace)
+        RelatedProduct.objects.refresh_product(earring)
+
+        necklace.delete()
+
+        self.assertFalse(
+            RelatedProduct.objects.filter(
+                related_content_type=ContentType.objects.get_for_model(
+                    Necklace
+                ),
+            ).exists()
+        )
+
+    def test_task_rebuilds_all_products(self):
+        earring = self._create(Earring)
+        self._create(Necklace)
+        RelatedProduct.objects.all().delete()
+
+        refresh_related_products()
+
+        self.assertEqual(
+            len(self._related(earring, RelatedProduct.RelationChoices.COLOR)),
+            1,
+        )
+
+    def test_detail_view_reads_precomputed_rows(self):
+        earring = self._create(Earring)
+        necklace = self._create(Necklace)
+        RelatedProduct.objects.refresh_product(earring)
+
+        response = APIClient().get(
+            reverse('earrings-item', kwargs={'pk': earring.id})
+        )
+
+        self.assertEqual(
+            response.data['product']['related_products'],
+            [
+                {
+                    'id': necklace.id,
+                    'first_image': necklace.first_image,
+                    'product_type': 'necklaces',
+                }
+            ],
+        )
+        self.assertEqual(
+            response.data['product']['related_collection_products'],
+            [{'id': earring.id, 'first_image': earring.first_image}],
+        )
+
+    def test_detail_view_does_not_write_missing_rows(self):
+        earring = self._create(Earring)
+        RelatedProduct.objects.all().delete()
+
+        response = APIClient().get(
+            reverse('earrings-item', kwargs={'pk': earring.id})
+        )
+
+        self.assertEqual(response.data['product']['related_products'], [])
+        self.assertFalse(RelatedProduct.objects.exists())
+
+    def test_migration_builds_rows_for_existing_products(self):
+        migration = import_module(
+            'src.products.migrations.0005_relatedproduct'
+        )
+        earring = self._create(Earring)
+        necklace = self._create(Necklace)
+        RelatedProduct.objects.all().delete()
+
+        migration.build_related_products(apps, None)
+
+        self.assertEqual(
+            self._related(earring, RelatedProduct.RelationChoices.COLOR),
+            [('necklace', necklace.id)],
+        )
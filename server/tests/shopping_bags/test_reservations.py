@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from src.orders.services import OrderService
+from src.shopping_bags.constants import StockReservationDefaults
+from src.shopping_bags.models import ShoppingBag, StockReservation
+from src.shopping_bags.tasks import release_expired_reservations
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class StockReservationTest(TestCase):
+
+    def setUp(self):
+        self.inventory = TestDataBuilder.create_listed_product(
+            'Reserved', quantity=3
+        )['inventory']
+        self.shopper = TestDataBuilder.create_authenticated_user(
+            '_shopper', '_shopper'
+        )
+        self.other_shopper = TestDataBuilder.create_authenticated_user(
+            '_other', '_other'
+        )
+        self.client = APIClient()
+
+    def _add_to_bag(self, user, quantity):
+        self.client.force_authenticate(user=user)
+
+        return self.client.post(
+            reverse('shopping-bag-list'),
+            {'inventory': self.inventory.id, 'quantity': quantity},
+            format='json',
+        )
+
+    def _expire_holds(self):
+        StockReservation.objects.update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+    def test_adding_to_bag_holds_stock_for_ttl(self):
+        before = timezone.now()
+        self._add_to_bag(self.shopper, 2)
+
+        reservation = StockReservation.objects.get(bag_item__user=self.shopper)
+        self.assertEqual(reservation.quantity, 2)
+        self.assertEqual(reservation.inventory, self.inventory)
+        self.assertGreaterEqual(
+            reservation.expires_at,
+            before + timedelta(minutes=StockReservationDefaults.TTL_MINUTES),
+        )
+
+        self._add_to_bag(self.shopper, 1)
+
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.quantity, 3)
+
+    def test_held_stock_is_not_available_to_other_shoppers(self):
+        self._add_to_bag(self.shopper, 2)
+
+        response = self._add_to_bag(self.other_shopper, 2)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self._add_to_bag(self.other_shopper, 1)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(reverse('shopping-bag-list'))
+        self.assertEqual(
+            response.data[0]['product_info']['available_quantity'], 1
+        )
+
+    def test_expired_holds_no_longer_count(self):
+        self._add_to_bag(self.shopper, 3)
+        self._expire_holds()
+
+        response = self._add_to_bag(self.other_shopper, 3)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_checkout_respects_other_shoppers_holds(self):
+        # Added before holds existed, so the bag item holds nothing
+        ShoppingBag.objects.create(
+            user=self.other_shopper,
+            inventory=self.inventory,
+            quantity=2,
+        )
+        self._add_to_bag(self.shopper, 2)
+
+        with self.assertRaises(ValidationError):
+            OrderService.process_order_from_shopping_bag(self.other_shopper)
+
+        OrderService.process_order_from_shopping_bag(self.shopper)
+        self.assertFalse(StockReservation.objects.exists())
+
+    def test_release_task_deletes_expired_holds_in_batches(self):
+        self._add_to_bag(self.shopper, 1)
+        self._add_to_bag(self.other_shopper, 1)
+        self._expire_holds()
+
+        fresh_user = TestDataBuilder.create_authenticated_user(
+            '_fresh', '_fresh'
+        )
+        self._add_to_bag(fresh_user, 1)
+
+        with self.assertNumQueries(5):
+            # Two single-row batches and the empty batch that ends the loop
+            released = StockReservation.objects.release_expired(batch_size=1)
+
+        self.assertEqual(released, 2)
+        self.assertEqual(
+            list(
+                StockReservation.objects.values_list(
+                    'bag_item__user', flat=True
+                )
+            ),
+            [fresh_user.id],
+        )
+        self.assertEqual(ShoppingBag.objects.count(), 3)
+        self.assertEqual(release_expired_reservations(), 0)
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.products.cache import get_catalog_cache
+from src.shopping_bags.models import ShoppingBag, StockReservation
+from src.shopping_bags.tasks import release_expired_reservations
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class ShoppingBagSummaryTest(TestCase):
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_summary', '_summary'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.first = TestDataBuilder.create_listed_product(
+            'SummaryFirst', price=100.00
+        )
+        self.second = TestDataBuilder.create_listed_product(
+            'SummarySecond', price=25.50
+        )
+        self.bag_item = ShoppingBag.objects.create(
+            user=self.user,
+            inventory=self.first['inventory'],
+            quantity=2,
+        )
+        ShoppingBag.objects.create(
+            user=self.user,
+            inventory=self.second['inventory'],
+            quantity=1,
+        )
+
+        self.url = reverse('shopping-bag-get-summary')
+
+    def test_summary_returns_items_and_totals(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['items']), 2)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(float(response.data['total_price']), 225.50)
+        self.assertIn('ETag', response)
+
+    def test_empty_bag_summary(self):
+        ShoppingBag.objects.filter(user=self.user).delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['items'], [])
+        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(response.data['total_price'], 0)
+
+    def test_matching_etag_is_answered_without_queries(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_bag_write_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        self.bag_item.quantity = 3
+        self.bag_item.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['count'], 4)
+
+    def test_other_users_bag_does_not_change_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        ShoppingBag.objects.create(
+            user=TestDataBuilder.create_authenticated_user('_other', '_other'),
+            inventory=self.first['inventory'],
+            quantity=1,
+        )
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def _hold_for_other_user(self, inventory):
+        other_item = ShoppingBag.objects.create(
+            user=TestDataBuilder.create_authenticated_user('_other', '_other'),
+            inventory=inventory,
+            quantity=1,
+        )
+
+        return StockReservation.objects.hold(other_item)
+
+    def test_other_users_hold_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        self._hold_for_other_user(self.first['inventory'])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_released_expired_hold_changes_etag(self):
+        reservation = self._hold_for_other_user(self.first['inventory'])
+        StockReservation.objects.filter(pk=reservation.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        etag = self.client.get(self.url)['ETag']
+
+        release_expired_reservations()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_hold_on_other_inventory_does_not_change_etag(self):
+        other = TestDataBuilder.create_listed_product('SummaryOther')
+        etag = self.client.get(self.url)['ETag']
+
+        self._hold_for_other_user(other['inventory'])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
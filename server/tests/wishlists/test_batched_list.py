@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.products.models import Inventory
+from src.products.models.product import Earring
+from src.wishlists.models import Wishlist
+from src.wishlists.serializers import WishlistSerializer
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class WishlistBatchedListTest(TestCase):
+
+    def setUp(self):
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_wishlist_batch', '_wishlist_batch'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.content_type = ContentType.objects.get_for_model(Earring)
+
+    def _wishlist_products(self, count, **kwargs):
+        products = []
+
+        for index in range(count):
+            data = TestDataBuilder.create_listed_product(
+                f'WishlistBatch{index}', **kwargs
+            )
+            Wishlist.objects.create(
+                user=self.user,
+                content_type=self.content_type,
+                object_id=data['product'].id,
+            )
+            products.append(data)
+
+        return products
+
+    def _get_list(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('wishlist-list'))
+
+        return response, len(context.captured_queries)
+
+    def test_list_queries_do_not_grow_with_wishlist(self):
+        self._wishlist_products(2)
+        _, small_wishlist = self._get_list()
+
+        self._wishlist_products(10)
+        response, large_wishlist = self._get_list()
+
+        self.assertEqual(len(response.data), 12)
+        self.assertEqual(large_wishlist, small_wishlist)
+
+    def test_bulk_product_info_matches_single_item(self):
+        data = self._wishlist_products(1, price=80.00)[0]
+        Inventory.objects.create(
+            quantity=0,
+            price=120.00,
+            size=data['size'],
+            content_type=self.content_type,
+            object_id=data['product'].id,
+        )
+        sold_out = self._wishlist_products(1, quantity=0)[0]
+        no_inventory = self._wishlist_products(1, price=None)[0]
+
+        response, _ = self._get_list()
+        listed = {
+            item['object_id']: item['product_info'] for item in response.data
+        }
+
+        for product_data in (data, sold_out, no_inventory):
+            item = Wishlist.objects.get(object_id=product_data['product'].id)
+            self.assertEqual(
+                listed[item.object_id],
+                WishlistSerializer(item).data['product_info'],
+            )
+
+        self.assertEqual(
+            listed[data['product'].id]['min_price'], Decimal('80')
+        )
+        self.assertEqual(
+            listed[data['product'].id]['max_price'], Decimal('120')
+        )
+        self.assertTrue(listed[sold_out['product'].id]['is_sold_out'])
+        self.assertEqual(listed[no_inventory['product'].id]['min_price'], 0)
@@ -0,0 +1,95 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.products.cache import get_catalog_cache
+from tests.common.test_data_builder import TestDataBuilder
+
+
+class WishlistKeysTest(TestCase):
+
+    def setUp(self):
+        get_catalog_cache().clear()
+
+        self.user = TestDataBuilder.create_authenticated_user(
+            '_wishlist_keys', '_wishlist_keys'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.products = [
+            TestDataBuilder.create_listed_product(f'Keys{index}')['product']
+            for index in range(2)
+        ]
+        self.url = reverse('wishlist-get-wishlist-keys')
+
+    def _add(self, product):
+        return self.client.post(
+            reverse('wishlist-list'),
+            {'content_type': 'earring', 'object_id': product.id},
+            format='json',
+        )
+
+    def _remove(self, product):
+        return self.client.delete(
+            reverse(
+                'wishlist-remove-item',
+                kwargs={
+                    'content_type_name': 'earring',
+                    'object_id': product.id,
+                },
+            )
+        )
+
+    def test_keys_list_wishlisted_pairs(self):
+        for product in self.products:
+            self._add(product)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['keys'],
+            [['earring', product.id] for product in self.products],
+        )
+
+    def test_keys_are_cached_and_revalidated(self):
+        self._add(self.products[0])
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_add_and_remove_invalidate_keys(self):
+        etag = self.client.get(self.url)['ETag']
+
+        self._add(self.products[0])
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['keys']), 1)
+
+        self._remove(self.products[0])
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['keys'], [])
+
+    def test_other_users_wishlist_does_not_invalidate(self):
+        etag = self.client.get(self.url)['ETag']
+
+        other_user = TestDataBuilder.create_authenticated_user(
+            '_other_keys', '_other_keys'
+        )
+        self.client.force_authenticate(user=other_user)
+        self._add(self.products[0])
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)